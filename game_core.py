@@ -2,6 +2,7 @@ import pygame
 import random
 import os
 from enum import Enum
+from collections import Counter
 import colorsys
 
 # Get the directory where this script is located
@@ -15,6 +16,8 @@ GAME_OFFSET_Y = 0  # Game uses full screen, HUD is overlaid
 GRID_SIZE = 16  # Half of original 32 for 240x240 base resolution  
 GRID_WIDTH = SCREEN_WIDTH // GRID_SIZE
 GRID_HEIGHT = SCREEN_HEIGHT // GRID_SIZE  # Grid uses full height
+HALF_GRID = GRID_SIZE // 2  # Pixel offset from a cell's corner to its center
+CENTER_Y_OFFSET = HALF_GRID + GAME_OFFSET_Y  # Cell center offset on the y axis (includes game area offset)
 
 # Debug: Print grid calculations
 print("DEBUG: SCREEN_HEIGHT={}, HUD_HEIGHT={}, GRID_SIZE={}".format(SCREEN_HEIGHT, HUD_HEIGHT, GRID_SIZE))
@@ -97,6 +100,54 @@ class Direction(Enum):
     LEFT = (-1, 0)
     RIGHT = (1, 0)
 
+# Shared tuple of the four directions, for loops that try each one in turn
+CARDINAL_DIRECTIONS = (Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT)
+
+# Plain attributes on each member for the movement code: Enum's .value is a descriptor
+# call on every access. delta is the (dx, dy) step, opposite the 180-degree turn.
+for _direction in CARDINAL_DIRECTIONS:
+    _direction.delta = _direction.value
+del _direction
+Direction.UP.opposite = Direction.DOWN
+Direction.DOWN.opposite = Direction.UP
+Direction.LEFT.opposite = Direction.RIGHT
+Direction.RIGHT.opposite = Direction.LEFT
+
+def grid_to_pixel_center(grid_x, grid_y):
+    """Convert a grid cell to the screen pixel at its center"""
+    return (grid_x * GRID_SIZE + HALF_GRID, grid_y * GRID_SIZE + CENTER_Y_OFFSET)
+
+# Enemy categories (resolved once from the enemy_type string prefix)
+class EnemyKind:
+    OTHER = 0
+    ANT = 1
+    SPIDER = 2
+    WASP = 3
+    SCORPION = 4
+    BEETLE = 5
+    WALL = 6
+
+ENEMY_KIND_PREFIXES = (
+    ('enemy_ant', EnemyKind.ANT),
+    ('enemy_spider', EnemyKind.SPIDER),
+    ('enemy_wasp', EnemyKind.WASP),
+    ('enemy_scorpion', EnemyKind.SCORPION),
+    ('enemy_beetle', EnemyKind.BEETLE),
+)
+
+# Enemy kinds that die to a single bullet (walls take several hits)
+SHOOTABLE_ENEMY_KINDS = frozenset((EnemyKind.ANT, EnemyKind.SPIDER, EnemyKind.WASP,
+                                   EnemyKind.SCORPION, EnemyKind.BEETLE))
+
+def enemy_kind_for(enemy_type):
+    """Map an enemy_type string (e.g. 'enemy_ant2') to its EnemyKind"""
+    if enemy_type == 'enemy_wall':
+        return EnemyKind.WALL
+    for prefix, kind in ENEMY_KIND_PREFIXES:
+        if enemy_type.startswith(prefix):
+            return kind
+    return EnemyKind.OTHER
+
 # Utility function for hue shifting
 def hue_shift_surface(surface, hue_shift):
     """Apply a hue shift to a pygame surface.
@@ -155,6 +206,20 @@ def hue_shift_color(color, hue_shift):
     
     return (int(r * 255), int(g * 255), int(b * 255))
 
+def update_entities(entities):
+    """Update every entity and return the survivors.
+    
+    Entities only need update() and is_alive(). The list is only rebuilt
+    on frames where something died; otherwise the same list is returned."""
+    dead_count = 0
+    for entity in entities:
+        entity.update()
+        if not entity.is_alive():
+            dead_count += 1
+    if dead_count == 0:
+        return entities
+    return [entity for entity in entities if entity.is_alive()]
+
 class Particle:
     """Visual effect particle"""
     def __init__(self, x, y, color, velocity):
@@ -181,6 +246,9 @@ class Particle:
 
 class GifParticle:
     """Animated GIF particle effect"""
+    # Spawned in bursts of a whole snake body at a time, so skip the per-instance dict
+    __slots__ = ('x', 'y', 'frames', 'frame_index', 'animation_counter', 'animation_speed', 'alive')
+    
     def __init__(self, x, y, frames):
         self.x = x
         self.y = y
@@ -200,7 +268,8 @@ class GifParticle:
                 if self.frame_index > len(self.frames):
                     self.alive = False
     
-    def draw(self, screen):
+    def get_blit(self):
+        """(frame, position) for Surface.blits(), or None once the animation is done"""
         if self.alive and self.frames:
             # Clamp frame_index to valid range (show last frame if we've gone past)
             current_frame_index = min(self.frame_index, len(self.frames) - 1)
@@ -208,8 +277,14 @@ class GifParticle:
             # Center the particle effect on the position
             offset_x = frame.get_width() // 2
             offset_y = frame.get_height() // 2
+            return (frame, (int(self.x - offset_x), int(self.y - offset_y)))
+        return None
+    
+    def draw(self, screen):
+        blit = self.get_blit()
+        if blit:
             # Normal blitting (transparency handled by the GIF itself)
-            screen.blit(frame, (int(self.x - offset_x), int(self.y - offset_y)))
+            screen.blit(*blit)
     
     def is_alive(self):
         return self.alive
@@ -249,6 +324,15 @@ class EggPiece:
     def is_alive(self):
         return self.lifetime > 0
 
+class RespawnEgg:
+    """Egg a multiplayer snake waits in before respawning"""
+    __slots__ = ('pos', 'timer', 'direction')
+    
+    def __init__(self, pos, timer, direction=None):
+        self.pos = pos  # Grid (x, y)
+        self.timer = timer  # Frames until auto-hatch
+        self.direction = direction  # Chosen hatch Direction, or None while waiting
+
 class MusicManager:
     """Manages random music playback without immediate repeats"""
     def __init__(self):
@@ -468,15 +552,32 @@ class SoundManager:
             except:
                 print(f"Warning: Could not load {path}")
                 self.sounds[name] = None
+        
+        # Menu blips get their own reserved channel so they never steal one from gameplay sounds
+        self.blip_sound = self.sounds['blip_select']
+        pygame.mixer.set_reserved(1)
+        self.blip_channel = pygame.mixer.Channel(0)
     
     def play(self, sound_name):
         """Play a sound effect by name"""
         if self.sound_enabled and sound_name in self.sounds and self.sounds[sound_name]:
             self.sounds[sound_name].play()
+    
+    def play_blip(self):
+        """Play the menu blip on its reserved channel"""
+        if self.sound_enabled and self.blip_sound:
+            self.blip_channel.play(self.blip_sound)
 
 class Bullet:
     """Bullet fired by player with isotope ability"""
+    __slots__ = ('grid_x', 'grid_y', 'direction', 'alive', 'pixel_x', 'pixel_y', 'speed')
+    
     def __init__(self, x, y, direction):
+        self.speed = 8  # Pixels per frame (faster than snake movement)
+        self.reset(x, y, direction)
+    
+    def reset(self, x, y, direction):
+        """(Re)launch from grid (x, y), so spent bullets can be reused"""
         self.grid_x = x
         self.grid_y = y
         self.direction = direction  # Direction enum
@@ -485,7 +586,6 @@ class Bullet:
         # Visual properties for smooth movement
         self.pixel_x = x * GRID_SIZE
         self.pixel_y = y * GRID_SIZE
-        self.speed = 8  # Pixels per frame (faster than snake movement)
     
     def update(self):
         """Update bullet position"""
@@ -493,7 +593,7 @@ class Bullet:
             return
         
         # Move in pixel space
-        dx, dy = self.direction.value
+        dx, dy = self.direction.delta
         self.pixel_x += dx * self.speed
         self.pixel_y += dy * self.speed
         
@@ -505,6 +605,9 @@ class Bullet:
         if (self.grid_x < 0 or self.grid_x >= GRID_WIDTH or 
             self.grid_y < 0 or self.grid_y >= GRID_HEIGHT):
             self.alive = False
+    
+    def is_alive(self):
+        return self.alive
 
 class Spewtum:
     """Spewtum projectile fired by boss worm"""
@@ -604,7 +707,7 @@ class ScorpionStinger:
             return
         
         # Move in pixel space
-        dx, dy = self.direction.value
+        dx, dy = self.direction.delta
         self.pixel_x += dx * self.speed
         self.pixel_y += dy * self.speed
         
@@ -641,6 +744,9 @@ class ScorpionStinger:
             offset_x = frame.get_width() // 2
             offset_y_adjust = frame.get_height() // 2
             screen.blit(frame, (int(self.pixel_x - offset_x), int(self.pixel_y - offset_y_adjust + offset_y)))
+    
+    def is_alive(self):
+        return self.alive
 
 class BeetleLarvae:
     """Larvae projectile fired by beetle - travels in a straight line in one of four cardinal directions"""
@@ -665,7 +771,7 @@ class BeetleLarvae:
             return
         
         # Move in pixel space
-        dx, dy = self.direction.value
+        dx, dy = self.direction.delta
         self.pixel_x += dx * self.speed
         self.pixel_y += dy * self.speed
         
@@ -695,6 +801,9 @@ class BeetleLarvae:
             offset_x = frame.get_width() // 2
             offset_y_adjust = frame.get_height() // 2
             screen.blit(frame, (int(self.pixel_x - offset_x), int(self.pixel_y - offset_y_adjust + offset_y)))
+    
+    def is_alive(self):
+        return self.alive
 
 class Snake:
     """Snake game logic"""
@@ -720,6 +829,10 @@ class Snake:
         # Start with just the head - body will grow as player moves
         self.body = [(center_x, center_y)]
         self.previous_body = list(self.body)  # Track previous positions for interpolation
+        # Cached cell -> segment count map, see get_body_cells()
+        self.body_cells = Counter()
+        self.body_cells_source = None
+        self.body_cells_key = None
         
         # Set direction (default to RIGHT if not specified)
         if direction:
@@ -740,10 +853,11 @@ class Snake:
         """Move snake one step"""
         # Save previous body positions for smooth interpolation
         self.previous_body = list(self.body)
+        body_cells = self.get_body_cells()
         
         self.direction = self.next_direction
         head_x, head_y = self.body[0]
-        dx, dy = self.direction.value
+        dx, dy = self.direction.delta
         new_head_x = head_x + dx
         new_head_y = head_y + dy
         
@@ -760,19 +874,23 @@ class Snake:
         
         new_head = (new_head_x, new_head_y)
         self.body.insert(0, new_head)
+        body_cells[new_head] += 1
         
         if self.grow_pending > 0:
             self.grow_pending -= 1
         else:
-            self.body.pop()
+            tail = self.body.pop()
+            body_cells[tail] -= 1
+            if not body_cells[tail]:
+                del body_cells[tail]
+        
+        # Cell counts were updated in place, keep the cache valid for the new body
+        self.body_cells_key = (len(self.body), new_head, self.body[-1])
     
     def change_direction(self, new_direction):
         """Change direction if not opposite to current"""
-        dx, dy = self.direction.value
-        new_dx, new_dy = new_direction.value
-        
         # Prevent 180 degree turns
-        if (dx + new_dx, dy + new_dy) != (0, 0):
+        if new_direction is not self.direction.opposite:
             self.next_direction = new_direction
     
     def check_collision(self, wrap_around=False):
@@ -787,11 +905,46 @@ class Snake:
                 return True
         
         # Self collision
-        if self.body[0] in self.body[1:]:
+        if self.tail_contains(self.body[0]):
             return True
         
         return False
     
+    def get_body_cells(self):
+        """Map of cell -> number of segments on it, for O(1) membership tests.
+        
+        move() updates it in place. body is also reassigned and popped from
+        outside this class, so rather than syncing on every edit the cache is
+        checked against the list object, its length and its end cells - every
+        edit made to a snake body changes one of those - and rebuilt if stale.
+        """
+        body = self.body
+        key = (len(body), body[0], body[-1]) if body else (0, None, None)
+        if body is not self.body_cells_source or key != self.body_cells_key:
+            self.body_cells = Counter(body)
+            self.body_cells_source = body
+            self.body_cells_key = key
+        return self.body_cells
+    
+    def tail_contains(self, pos):
+        """Check if pos is on any segment behind the head (no body[1:] copy)"""
+        count = self.get_body_cells().get(pos, 0)
+        # A single match only counts if it isn't the head
+        return count > 1 or (count == 1 and pos != self.body[0])
+    
+    def tail_index(self, pos):
+        """Index of the first segment behind the head at pos, or -1 if none.
+        
+        Positions along the body shift on every move, so there is no cell -> index
+        map to keep; the cell counts rule out misses and the list is only scanned
+        on an actual hit.
+        """
+        body = self.body
+        count = self.get_body_cells().get(pos, 0)
+        if not count or (count == 1 and pos == body[0]):
+            return -1  # Hash miss (the common case), or only the head is at pos
+        return body.index(pos, 1)
+    
     def wrap_position(self):
         """Wrap the snake's head position around the grid edges."""
         head_x, head_y = self.body[0]
@@ -820,6 +973,12 @@ class Snake:
     def grow(self, amount=1):
         """Grow snake by amount"""
         self.grow_pending += amount
+    
+    def get_bounds(self):
+        """Return the body's bounding box as (min_x, min_y, max_x, max_y)"""
+        xs = [x for x, _ in self.body]
+        ys = [y for _, y in self.body]
+        return (min(xs), min(ys), max(xs), max(ys))
 
 
 class Enemy:
@@ -828,6 +987,7 @@ class Enemy:
         self.grid_x = x
         self.grid_y = y
         self.enemy_type = enemy_type
+        self.kind = enemy_kind_for(enemy_type)  # Integer category, avoids startswith in hot loops
         self.alive = True
         
         # Movement properties (default for all enemies)
@@ -922,22 +1082,42 @@ class Enemy:
         self.animation_frame = 0  # Current frame of animation
         self.animation_counter = 0  # Counter for animation timing
         
+        # Cached grid cells covered by the enemy (rebuilt only when its anchor cell changes)
+        self.cells_anchor = None
+        self.cells_cache = ()
+    
+    @property
+    def occupied_cells(self):
+        """Grid cells covered at the current position (4 cells for 2x2 scorpions)"""
+        return self.cells_at(self.grid_x, self.grid_y)
+    
+    def cells_at(self, x, y):
+        """Grid cells covered when anchored at (x, y); cached until the anchor changes"""
+        if self.cells_anchor != (x, y):
+            self.cells_anchor = (x, y)
+            if self.kind == EnemyKind.SCORPION:
+                self.cells_cache = ((x, y), (x + 1, y), (x, y + 1), (x + 1, y + 1))
+            else:
+                self.cells_cache = ((x, y),)
+        return self.cells_cache
+        
     def update(self, snake_body, level_walls, collectibles):
         """Update enemy behavior based on type"""
         if not self.alive:
             return
         
-        if self.enemy_type.startswith('enemy_ant'):
+        kind = self.kind
+        if kind == EnemyKind.ANT:
             self._update_ant(snake_body, level_walls, collectibles)
-        elif self.enemy_type.startswith('enemy_spider'):
+        elif kind == EnemyKind.SPIDER:
             self._update_spider(snake_body, level_walls, collectibles)
-        elif self.enemy_type.startswith('enemy_scorpion'):
+        elif kind == EnemyKind.SCORPION:
             self._update_scorpion(snake_body, level_walls, collectibles)
-        elif self.enemy_type.startswith('enemy_wasp'):
+        elif kind == EnemyKind.WASP:
             self._update_wasp(snake_body, level_walls, collectibles)
-        elif self.enemy_type.startswith('enemy_beetle'):
+        elif kind == EnemyKind.BEETLE:
             self._update_beetle(snake_body, level_walls, collectibles)
-        elif self.enemy_type == 'enemy_wall':
+        elif kind == EnemyKind.WALL:
             # Enemy walls don't move, they're stationary obstacles
             pass
     
@@ -1595,13 +1775,13 @@ class Enemy:
         """Get interpolated position for rendering"""
         if self.is_moving:
             # Different enemies move at different speeds
-            if self.enemy_type.startswith('enemy_wasp'):
+            if self.kind == EnemyKind.WASP:
                 progress = self.move_timer / 3.0
-            elif self.enemy_type.startswith('enemy_spider'):
+            elif self.kind == EnemyKind.SPIDER:
                 progress = self.move_timer / 5.0
-            elif self.enemy_type.startswith('enemy_scorpion'):
+            elif self.kind == EnemyKind.SCORPION:
                 progress = self.move_timer / 5.0  # Same speed as spiders
-            elif self.enemy_type.startswith('enemy_beetle'):
+            elif self.kind == EnemyKind.BEETLE:
                 progress = self.move_timer / 8.0
             else:
                 progress = self.move_timer / 10.0  # Ants and other enemies
@@ -1610,8 +1790,10 @@ class Enemy:
             return render_x, render_y
         return self.grid_x, self.grid_y
     
-    def check_collision_with_snake(self, snake_head, snake_body):
+    def check_collision_with_snake(self, snake_head, snake_body, snake_cells=None):
         """Check if enemy collides with snake
+        snake_cells: optional set/map of the body's cells (Snake.get_body_cells()),
+        turns the body test into hash lookups instead of a scan per enemy
         Returns: 'head' if collided with head, 'body' if collided with body, None otherwise
         """
         if not self.alive:
@@ -1620,41 +1802,34 @@ class Enemy:
         # When moving, check collision with target position (early detection)
         # This prevents the ant from completing its full movement animation before dying
         # Exception: Beetles use current position since they charge across multiple cells
-        if self.is_moving and not self.enemy_type.startswith('enemy_beetle'):
+        if self.is_moving and self.kind != EnemyKind.BEETLE:
             base_x, base_y = self.target_x, self.target_y
         else:
             base_x, base_y = self.grid_x, self.grid_y
         
         # For scorpions (2x2), check all 4 grid cells
-        if self.enemy_type.startswith('enemy_scorpion'):
-            check_positions = [
-                (base_x, base_y),
-                (base_x + 1, base_y),
-                (base_x, base_y + 1),
-                (base_x + 1, base_y + 1)
-            ]
-        else:
-            check_positions = [(base_x, base_y)]
+        check_positions = self.cells_at(base_x, base_y)
         
         # Check collision with snake head
-        for check_pos in check_positions:
-            if check_pos == snake_head:
-                return 'head'
+        if snake_head in check_positions:
+            return 'head'
         
         # Wasps ignore snake body (they fly over it) and cannot be killed
-        if self.enemy_type.startswith('enemy_wasp'):
+        if self.kind == EnemyKind.WASP:
             return None  # Wasp only collides with head, never with body
         
+        # Check collision with snake body (excluding head)
         # Beetles only kill on head collision, but die when hitting snake body
-        if self.enemy_type.startswith('enemy_beetle'):
+        if snake_cells is not None:
+            # No check_pos is the head here, so any hit is on the tail
             for check_pos in check_positions:
-                if check_pos in snake_body[1:]:
-                    return 'body'  # Beetle dies, player doesn't
-            return None  # No collision
+                if check_pos in snake_cells:
+                    return 'body'
+            return None
         
-        # Check collision with snake body (excluding head) for non-wasp/non-beetle enemies
+        # The head check above returned already, so no need to slice it off
         for check_pos in check_positions:
-            if check_pos in snake_body[1:]:
+            if check_pos in snake_body:
                 return 'body'
         
         return None
@@ -3,16 +3,19 @@ import pygame
 import json
 import os
 import random
+import math
 import gc
 import shutil
+from bisect import bisect_right
+from collections import defaultdict
 
 # CRITICAL: Set SDL to grab input and prevent passthrough to EmulationStation
 # This must be set BEFORE pygame.init()
 os.environ['SDL_JOYSTICK_ALLOW_BACKGROUND_EVENTS'] = '0'
 os.environ['SDL_VIDEO_MINIMIZE_ON_FOCUS_LOSS'] = '0'
 
-from game_core import Snake, GameState, Difficulty, Direction, Particle, GifParticle, EggPiece, MusicManager, SoundManager, Enemy, Bullet, Spewtum, hue_shift_surface, hue_shift_frames, hue_shift_color, GamepadButton
-from game_core import SCREEN_WIDTH, SCREEN_HEIGHT, GRID_SIZE, GRID_WIDTH, GRID_HEIGHT, HUD_HEIGHT, GAME_OFFSET_Y
+from game_core import Snake, GameState, Difficulty, Direction, Particle, GifParticle, EggPiece, RespawnEgg, MusicManager, SoundManager, Enemy, Bullet, Spewtum, ScorpionStinger, BeetleLarvae, hue_shift_surface, hue_shift_frames, hue_shift_color, GamepadButton, update_entities, EnemyKind, SHOOTABLE_ENEMY_KINDS, CARDINAL_DIRECTIONS
+from game_core import SCREEN_WIDTH, SCREEN_HEIGHT, GRID_SIZE, GRID_WIDTH, GRID_HEIGHT, HUD_HEIGHT, GAME_OFFSET_Y, HALF_GRID, CENTER_Y_OFFSET, grid_to_pixel_center
 from game_core import BLACK, WHITE, GREEN, DARK_GREEN, RED, YELLOW, ORANGE, GRAY, DARK_GRAY
 from game_core import NEON_GREEN, NEON_LIME, NEON_PINK, NEON_CYAN, NEON_ORANGE, NEON_PURPLE, NEON_YELLOW, NEON_BLUE
 from game_core import GRID_COLOR, HUD_BG, DARK_BG
@@ -43,8 +46,96 @@ pygame.init()
 # - Mono output (1 channel) halves the audio processing load
 pygame.mixer.init(frequency=22050, size=-16, channels=1, buffer=8192)
 
+# handle_event only acts on QUIT, KEYDOWN, JOYBUTTONDOWN and JOYHATMOTION. Stick axes are
+# polled in handle_input, releases are never used (get_pressed()/get_button() read SDL's
+# state, which is kept current either way) and mouse/touch input is unused, so keep those
+# events out of the queue: SDL drops them before they reach Python and each frame's
+# event.get() stays short. TEXTINPUT starts out blocked too: pygame fills KEYDOWN's unicode
+# from it, which only high score name entry reads, so run() allows it in that state alone.
+# IME composition (TEXTEDITING) is never used.
+pygame.event.set_blocked([pygame.MOUSEMOTION, pygame.JOYAXISMOTION, pygame.JOYBALLMOTION,
+                          pygame.FINGERMOTION, pygame.FINGERDOWN, pygame.FINGERUP,
+                          pygame.KEYUP, pygame.JOYBUTTONUP,
+                          pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL,
+                          pygame.TEXTINPUT, pygame.TEXTEDITING])
+
 FPS = 60
 
+# Cosmetic animations in waiting states tick every Nth frame and advance N steps at once
+# (same playback speed, fewer per-frame updates)
+IDLE_ANIMATION_TICK = 2
+
+# Per-hit combat logging (bullet hits, enemy kills, boss damage). Off by default:
+# these fire many times a second in busy fights and the console writes cost frame time
+DEBUG_COMBAT = False
+
+# Minimum time between analog-stick menu steps. The stick must also return to center,
+# but a worn stick jittering around the threshold would otherwise re-arm every frame
+AXIS_NAV_DEBOUNCE_MS = 150
+
+# States where handle_input has nothing to poll: no steering and no stick menu, so they
+# only react to KEYDOWN/button events in handle_event
+UNPOLLED_STATES = frozenset((
+    GameState.SPLASH, GameState.INTRO, GameState.OUTRO, GameState.CREDITS,
+    GameState.PAUSED, GameState.GAME_OVER, GameState.LEVEL_COMPLETE, GameState.HIGH_SCORES,
+    GameState.LEVEL_EDITOR_MENU, GameState.NETWORK_HOST_LOBBY,
+))
+
+# Where ESCAPE (keyboard) or B (gamepad) leads from each screen whose "back" is a fixed
+# parent. Screens that also need cleanup on the way out register it in SnakeGame.back_hooks
+BACK_STATES = {
+    GameState.SINGLE_PLAYER_MENU: GameState.MENU,
+    GameState.EXTRAS_MENU: GameState.MENU,
+    GameState.MULTIPLAYER_MENU: GameState.MENU,
+    GameState.ADVENTURE_LEVEL_SELECT: GameState.SINGLE_PLAYER_MENU,
+    GameState.CREDITS: GameState.EXTRAS_MENU,
+    GameState.ACHIEVEMENTS: GameState.EXTRAS_MENU,
+    GameState.MUSIC_PLAYER: GameState.EXTRAS_MENU,
+    GameState.LEVEL_EDITOR_MENU: GameState.EXTRAS_MENU,
+    GameState.NETWORK_MENU: GameState.MULTIPLAYER_MENU,
+    GameState.NETWORK_HOST_LOBBY: GameState.NETWORK_MENU,
+    GameState.NETWORK_CLIENT_LOBBY: GameState.NETWORK_MENU,
+}
+
+# Minimum time between LAN server-list refreshes (each one restarts discovery)
+DISCOVERY_REFRESH_MIN_MS = 250
+
+# Adventure level select grid width, shared by its navigation and drawing
+LEVEL_SELECT_COLUMNS = 8
+
+# Network/respawn input tracing (every input sent or applied, hatches, music sync).
+# Off by default: clients send input several times a second and the prints stall the loop
+DEBUG_NETWORK = False
+
+# Arrow keys in the order handle_input gives them priority when several are held.
+# Scancodes, not keycodes: get_key_direction indexes get_pressed()'s state by scancode directly
+DIRECTION_KEYS = (
+    (pygame.KSCAN_UP, Direction.UP),
+    (pygame.KSCAN_DOWN, Direction.DOWN),
+    (pygame.KSCAN_LEFT, Direction.LEFT),
+    (pygame.KSCAN_RIGHT, Direction.RIGHT),
+)
+
+# D-pad hat value -> direction; on diagonals the vertical part wins, like the old if/elif order
+HAT_DIRECTIONS = {
+    (0, 1): Direction.UP, (-1, 1): Direction.UP, (1, 1): Direction.UP,
+    (0, -1): Direction.DOWN, (-1, -1): Direction.DOWN, (1, -1): Direction.DOWN,
+    (-1, 0): Direction.LEFT,
+    (1, 0): Direction.RIGHT,
+}
+
+# Score multiplier and endless-mode growth per segment eaten, by difficulty
+SCORE_MULTIPLIERS = {Difficulty.EASY: 0.5, Difficulty.MEDIUM: 1.0, Difficulty.HARD: 2.0}
+ENDLESS_GROWTH_BY_DIFFICULTY = {Difficulty.EASY: 1, Difficulty.MEDIUM: 2, Difficulty.HARD: 4}
+
+# Multiplayer replacement food per lobby item_frequency (0=Low, 1=Normal, 2=High):
+# (cumulative thresholds for random.random(), food type for each band, None = no spawn)
+FOOD_RESPAWN_ODDS = (
+    ((0.75, 0.95), ('worm', 'apple', None)),  # Low - mostly worms, no black apples
+    ((0.6, 0.85), ('worm', 'apple', 'black_apple')),  # Normal
+    ((0.5, 0.8), ('worm', 'apple', 'black_apple')),  # High - more variety
+)
+
 # MEMORY OPTIMIZATION STRATEGY
 # Uses lazy loading approach - assets loaded only when needed:
 # - Intro/outro sequences not preloaded (can be loaded on-demand if needed)
@@ -69,6 +160,7 @@ class SnakeGame:
         # CRITICAL: Grab input to prevent passthrough to EmulationStation
         pygame.event.set_grab(True)
         self.clock = pygame.time.Clock()
+        self.idle_frame_count = 0  # Frame counter for reduced-rate idle animations
         self.font_small = pygame.font.Font(None, 16)  # Scaled for 240x240 base resolution
         self.font_medium = pygame.font.Font(None, 24)  # Scaled for 240x240 base resolution
         self.font_large = pygame.font.Font(None, 33)  # Scaled for 240x240 base resolution
@@ -854,6 +946,9 @@ class SnakeGame:
                 self.boss_animations[img_name] = []
                 print("Warning: {}.png not found or could not be loaded: {}".format(img_name, e))
         
+        # Boss assets never change after loading, so resolve the death animation check once
+        self.boss_has_death1_anim = bool(self.boss_animations.get('wormBossDeath1'))
+        
         # Load spewtum projectile animation
         self.spewtum_frames = []
         try:
@@ -945,6 +1040,8 @@ class SnakeGame:
         # Boss battle state
         self.boss_active = False
         self.boss_data = None
+        # Bullet hitbox lookup per boss_data, so new bosses register here instead of in the bullet pass
+        self.boss_hitbox_getters = {'wormBoss': self.get_worm_boss_hitbox, 'frog': self.get_frog_hitbox}
         self.boss_spawn_timer = 0  # Timer in seconds for boss events
         self.boss_spawned = False
         self.boss_current_animation = None
@@ -955,6 +1052,8 @@ class SnakeGame:
         self.boss_animation_loop = True  # Whether current animation loops
         self.screen_shake_intensity = 0
         self.screen_shake_offset = (0, 0)
+        # Separate RNG for cosmetic effects (shake, explosion particles); bound randrange skips randint's wrapper
+        self.effect_randrange = random.Random().randrange
         self.boss_minions = []  # List of boss minion snakes
         self.enemy_snakes = []  # List of enemy snakes (non-boss)
         self.boss_minion_respawn_timers = {}  # Dict of minion_id -> respawn_timer
@@ -962,14 +1061,15 @@ class SnakeGame:
         self.boss_attack_interval = 1200  # Start at 20 seconds (1200 frames at 60 FPS)
         self.boss_attack_interval_min = 180  # Fastest attack speed: 3 seconds
         self.boss_attack_interval_max = 1200  # Slowest attack speed: 20 seconds
+        self.boss_attack_interval_range = self.boss_attack_interval_max - self.boss_attack_interval_min
         self.boss_is_attacking = False  # Whether boss is currently in attack animation
         self.spewtums = []  # List of active spewtum projectiles
         self.boss_health = 50  # Boss health
         self.boss_max_health = 50  # Boss maximum health
         self.boss_damage_flash = 0  # Timer for red flash when boss is hit
         self.boss_damage_sound_cooldown = 0  # Cooldown to prevent damage sounds from overlapping
-        self.boss_super_attack_thresholds = [0.75, 0.5, 0.25]  # Health % thresholds for super attacks
-        self.boss_super_attacks_used = set()  # Track which thresholds have been used
+        self.boss_super_attack_thresholds = [0.75, 0.5, 0.25]  # Health % thresholds for super attacks (highest first)
+        self.boss_super_attacks_used = 0  # How many thresholds have fired (they always fire in order)
         self.boss_defeated = False  # Whether boss has been defeated
         self.boss_death_delay = 0  # Delay before level completion after death animation
         self.boss_death_phase = 0  # Current death animation phase (0=not started, 1-5=phases)
@@ -978,16 +1078,29 @@ class SnakeGame:
         self.boss_death_particle_timer = 0  # Timer for spawning particles during phase 3
         self.boss_slide_offset_y = 0  # Vertical offset for boss sliding during death
         self.boss_slide_timer = 0  # Timer for boss slide (4 seconds = 240 frames)
+        self.boss_death_phase1_timer = None  # Fallback phase 1 timer (None until phase 1 starts)
+        self.screen_shake_timer = 0  # Frames left on a timed shake (0 = untimed)
+        self.isotope_spawn_timer = 0  # Boss battle isotope spawn timer
+        self.isotope_spawn_interval = 300  # Spawn every 5 seconds (60 FPS * 5)
+        self.boss_egg_is_respawn = False  # Whether the current egg is a boss battle respawn
+        self.boss_egg_respawn_pos = None  # Random respawn position after a boss battle death
+        self.egg_timer = 0  # Frames spent waiting in a boss respawn egg
+        self.enemies = []  # Adventure mode enemies (ants, spiders, walls, ...)
         
         # Frog Boss state variables
         self.frog_state = 'waiting'  # States: 'waiting', 'falling', 'landed', 'jumping', 'airborne'
         self.frog_position = [GRID_WIDTH // 2, 2]  # Grid position (can be fractional during animation)
         self.frog_shadow_position = [GRID_WIDTH // 2, 2]  # Shadow grid position
+        self.frog_cells_anchor = None  # Grid cell get_frog_cells() was last built for
+        self.frog_cells = ()  # 4x4 cells covered by the frog, in row-major order
+        self.frog_cell_set = frozenset()  # Same cells, for membership tests
         self.frog_fall_timer = 0  # Animation timer for falling
         self.frog_initial_spawn_timer = 0  # Timer for 2-second delay before initial spawn
         self.frog_jump_timer = 0  # Timer between jumps
         self.frog_airborne_timer = 0  # How long frog has been in the air
         self.frog_tongue_segments = []  # List of tongue segment positions [(x, y), ...]
+        self.frog_tongue_cells_key = (0, None)  # (len, last segment) get_frog_tongue_cells() was built for
+        self.frog_tongue_cell_set = frozenset()  # Grid cells under the tongue segments
         self.frog_tongue_extending = False  # Whether tongue is extending
         self.frog_tongue_retracting = False  # Whether tongue is retracting
         self.frog_tongue_timer = 0  # Timer for tongue animation
@@ -1067,6 +1180,10 @@ class SnakeGame:
         
         # Controller mapping
         self.player_controllers = []  # List of (controller_type, controller_index) tuples
+        self.controller_inputs = []  # Per player: (controller_type, joystick or None, hat_id, has_axes)
+        # D-pad direction per joystick instance id, kept current from JOYHATMOTION events
+        # so steering doesn't have to call get_hat() every frame
+        self.hat_directions = {}
         self.detect_controllers()
         
         # Multiplayer menu
@@ -1077,6 +1194,7 @@ class SnakeGame:
         self.network_manager = NetworkManager()
         self.network_interpolator = NetworkInterpolator(buffer_time_ms=80)  # Lag compensation
         self.is_network_game = False  # True when playing over network
+        self.last_sent_direction = None  # Client: last direction sent to the host, to avoid resending it
         self.network_menu_selection = 0
         self.network_menu_options = ["Host Game", "Join Game", "Back"]
         self.network_host_ip = ""  # For displaying host IP
@@ -1084,6 +1202,7 @@ class SnakeGame:
         self.network_join_ip_cursor = len(self.network_join_ip) - 1  # Current digit position (0-indexed)
         self.network_status_message = ""  # Status messages for connection
         self.discovered_servers = []  # List of (name, ip, port) from LAN discovery
+        self.discovered_servers_version = 0  # Discovery list version the snapshot above was taken at
         self.server_selection = 0  # Currently selected server in list
         
         # Multiplayer level selection
@@ -1105,11 +1224,16 @@ class SnakeGame:
         # Player slot types: 'player', 'cpu', 'off'
         self.player_slots = ['player', 'player', 'cpu', 'cpu']  # Default setup
         # Egg respawn state for dead players
-        self.respawning_players = {}  # {player_id: {'pos': (x,y), 'timer': int, 'direction': Direction or None}}
+        self.respawning_players = {}  # {player_id: RespawnEgg}
         
         # Food system - list of (position, type) tuples
         # Types: 'worm' (regular), 'apple' (speed up), 'black_apple' (slow down)
         self.food_items = []  # List of (pos, type)
+        self.food_by_pos = {}  # pos -> type for food_items, so pickups are a dict lookup (see add/remove_food_item)
+        # Adventure pickup effects by food type ('worm' and anything unlisted go to eat_worm)
+        self.food_pickup_handlers = {'bonus': self.eat_bonus_fruit, 'coin': self.eat_coin,
+                                     'diamond': self.eat_diamond, 'isotope': self.eat_isotope}
+        self.isotope_count = 0  # Number of 'isotope' entries in food_items (kept in sync on spawn/pickup)
         self.food_pos = None  # Legacy for single player
         self.bonus_food_pos = None
         self.bonus_food_timer = 0
@@ -1121,24 +1245,102 @@ class SnakeGame:
         self.particles = []
         self.egg_pieces = []  # Track flying egg shell pieces
         self.bullets = []  # Track player bullets from isotope ability
+        self.free_bullets = []  # Spent Bullet objects for fire_bullet() to reuse
         self.scorpion_stingers = []  # Track scorpion projectiles
         self.beetle_larvae = []  # Track beetle larvae projectiles
         self.game_over_timer = 0
         self.game_over_delay = 180  # 3 seconds at 60 FPS
         self.multiplayer_end_timer = 0  # Timer for delay after last player dies in multiplayer
+        self.multiplayer_end_timer_phase = 0  # Network end-of-game phase (1 = client waiting, 2 = host showing game over)
+        self.network_game_over_auto_timer = 0  # Host auto-return to lobby countdown
         self.respawn_timer = 0  # Timer for delay before respawning in adventure mode
         self.respawn_delay = 60  # 1 second at 60 FPS
         
         self.joystick = None
         self.joystick_has_hat = False
+        self.joystick_hat_id = None  # Instance id to look up in hat_directions when it has a hat
+        self.joystick_has_axes = False  # At least an X/Y stick, checked once here instead of per frame
         self.axis_was_neutral = True  # Track if axis was in neutral position
+        self.blip_pending = False  # Menu blip requested this frame (see play_blip)
+        self.text_input_allowed = False  # Whether TEXTINPUT is currently let into the queue
+        self.lobby_state_pending = False  # Lobby changed this frame; sent once by flush_lobby_state
+        self.last_discovery_refresh_time = -DISCOVERY_REFRESH_MIN_MS  # Ticks of the last server-list refresh
+        self.last_axis_nav_time = 0  # Ticks when the stick last stepped a menu
+        # Wrap-around list menus the analog stick steps through:
+        # state -> (selection attribute, options list attribute)
+        self.axis_list_menus = {
+            GameState.MENU: ('menu_selection', 'menu_options'),
+            GameState.SINGLE_PLAYER_MENU: ('single_player_selection', 'single_player_options'),
+            GameState.MULTIPLAYER_MENU: ('multiplayer_menu_selection', 'multiplayer_menu_options'),
+            GameState.NETWORK_MENU: ('network_menu_selection', 'network_menu_options'),
+            GameState.EXTRAS_MENU: ('extras_menu_selection', 'extras_menu_options'),
+            GameState.MUSIC_PLAYER: ('music_player_selection', 'music_player_tracks'),
+        }
+        # KEYDOWN handlers by state (SPLASH/INTRO/OUTRO are handled inline in handle_event)
+        self.keydown_handlers = {
+            GameState.MENU: self.handle_menu_keydown,
+            GameState.SINGLE_PLAYER_MENU: self.handle_single_player_menu_keydown,
+            GameState.EXTRAS_MENU: self.handle_extras_menu_keydown,
+            GameState.ADVENTURE_LEVEL_SELECT: self.handle_adventure_level_select_keydown,
+            GameState.PLAYING: self.handle_playing_keydown,
+            GameState.PAUSED: self.handle_paused_keydown,
+            GameState.GAME_OVER: self.handle_game_over_keydown,
+            GameState.LEVEL_COMPLETE: self.handle_level_complete_keydown,
+            GameState.CREDITS: self.handle_credits_keydown,
+            GameState.ACHIEVEMENTS: self.handle_achievements_keydown,
+            GameState.MUSIC_PLAYER: self.handle_music_player_keydown,
+            GameState.LEVEL_EDITOR_MENU: self.handle_level_editor_menu_keydown,
+            GameState.HIGH_SCORE_ENTRY: self.handle_high_score_keyboard,
+            GameState.HIGH_SCORES: self.handle_high_scores_keydown,
+            GameState.MULTIPLAYER_MENU: self.handle_multiplayer_menu_keydown,
+            GameState.NETWORK_MENU: self.handle_network_menu_keydown,
+            GameState.NETWORK_HOST_LOBBY: self.handle_network_host_lobby_keydown,
+            GameState.NETWORK_CLIENT_LOBBY: self.handle_network_client_lobby_keydown,
+            GameState.MULTIPLAYER_LEVEL_SELECT: self.handle_multiplayer_level_select_keydown,
+            GameState.MULTIPLAYER_LOBBY: self.handle_multiplayer_lobby_keydown,
+            GameState.DIFFICULTY_SELECT: self.handle_difficulty_select_keydown,
+        }
+        # JOYBUTTONDOWN handlers by state, called with the button number
+        self.button_handlers = {
+            GameState.INTRO: self.handle_intro_button,
+            GameState.MENU: self.handle_menu_button,
+            GameState.SINGLE_PLAYER_MENU: self.handle_single_player_menu_button,
+            GameState.EXTRAS_MENU: self.handle_extras_menu_button,
+            GameState.ADVENTURE_LEVEL_SELECT: self.handle_adventure_level_select_button,
+            GameState.PLAYING: self.handle_playing_button,
+            GameState.PAUSED: self.handle_paused_button,
+            GameState.GAME_OVER: self.handle_game_over_button,
+            GameState.LEVEL_COMPLETE: self.handle_level_complete_button,
+            GameState.CREDITS: self.handle_credits_button,
+            GameState.ACHIEVEMENTS: self.handle_achievements_button,
+            GameState.MUSIC_PLAYER: self.handle_music_player_button,
+            GameState.LEVEL_EDITOR_MENU: self.handle_level_editor_menu_button,
+            GameState.HIGH_SCORE_ENTRY: self.handle_high_score_entry_button,
+            GameState.HIGH_SCORES: self.handle_high_scores_button,
+            GameState.MULTIPLAYER_MENU: self.handle_multiplayer_menu_button,
+            GameState.NETWORK_MENU: self.handle_network_menu_button,
+            GameState.NETWORK_CLIENT_LOBBY: self.handle_network_client_lobby_button,
+            GameState.MULTIPLAYER_LOBBY: self.handle_multiplayer_lobby_button,
+            GameState.DIFFICULTY_SELECT: self.handle_difficulty_select_button,
+            GameState.MULTIPLAYER_LEVEL_SELECT: self.handle_multiplayer_level_select_button,
+        }
+        # Cleanup run by go_back() when leaving these BACK_STATES screens
+        self.back_hooks = {
+            GameState.CREDITS: self.resume_theme_music,
+            GameState.MUSIC_PLAYER: self.leave_music_player,
+            GameState.NETWORK_HOST_LOBBY: self.cancel_hosting,
+            GameState.NETWORK_CLIENT_LOBBY: self.network_manager.cleanup,
+        }
+        
         if pygame.joystick.get_count() > 0:
             self.joystick = pygame.joystick.Joystick(0)
             # No need to call init() - it's deprecated and joystick is auto-initialized
             print("Gamepad connected: {}".format(self.joystick.get_name()))
+            self.joystick_has_axes = self.joystick.get_numaxes() >= 2
             # Check if joystick has a hat (D-pad)
             if self.joystick.get_numhats() > 0:
                 self.joystick_has_hat = True
+                self.joystick_hat_id = self.joystick.get_instance_id()
                 print("Joystick has {} hat(s)".format(self.joystick.get_numhats()))
             else:
                 print("Joystick has no hats, will use axes/buttons only")
@@ -1188,7 +1390,8 @@ class SnakeGame:
         # Adventure mode
         self.game_mode = "endless"  # "endless" or "adventure"
         self.current_level_data = None
-        self.level_walls = []  # List of (x, y) wall positions
+        self.level_walls = set()  # Set of (x, y) wall positions, tested every move
+        self.walls = set()  # Multiplayer level wall positions (replaced when a level starts)
         self.worms_collected = 0
         self.worms_required = 0
         self.adventure_level_selection = 0  # Which level is selected in level select
@@ -1587,6 +1790,20 @@ class SnakeGame:
             self.player_controllers.append(('keyboard', 0))
         
         print("Controller mapping: {}".format(self.player_controllers))
+        self.build_controller_inputs()
+    
+    def build_controller_inputs(self):
+        """Resolve player_controllers to joysticks and their hat/axis support once, for handle_input"""
+        self.controller_inputs = []
+        for controller_type, controller_index in self.player_controllers:
+            joystick = hat_id = None
+            has_axes = False
+            if controller_type == 'gamepad' and controller_index < len(self.joysticks):
+                joystick = self.joysticks[controller_index]
+                if joystick.get_numhats() > 0:
+                    hat_id = joystick.get_instance_id()
+                has_axes = joystick.get_numaxes() >= 2
+            self.controller_inputs.append((controller_type, joystick, hat_id, has_axes))
     
     def create_player_graphics(self):
         """Load graphics for each player (up to 4 players)."""
@@ -1615,18 +1832,19 @@ class SnakeGame:
             self.spawn_food_item('worm')
         else:
             # Single player - use legacy system
+            snake_cells = self.snake.get_body_cells()
             while True:
                 # Spawn food within playable area (avoid 1-grid-cell border)
                 x = random.randint(1, GRID_WIDTH - 2)
                 y = random.randint(1, GRID_HEIGHT - 2)
-                if (x, y) not in self.snake.body:
+                if (x, y) not in snake_cells:
                     self.food_pos = (x, y)
                     break
     
     def spawn_adventure_food(self):
         """Spawn a worm in adventure mode, avoiding occupied positions"""
         # Don't spawn worms during boss battles
-        if hasattr(self, 'boss_active') and self.boss_active:
+        if self.boss_active:
             return
         
         occupied_positions = set()
@@ -1637,19 +1855,19 @@ class SnakeGame:
         occupied_positions.update([pos for pos, _ in self.food_items])
         
         # Add boss minion positions
-        if hasattr(self, 'boss_minions'):
+        if self.boss_minions:
             for minion in self.boss_minions:
                 if minion.alive:
                     occupied_positions.update(minion.body)
         
         # Add enemy snake positions
-        if hasattr(self, 'enemy_snakes'):
+        if self.enemy_snakes:
             for enemy_snake in self.enemy_snakes:
                 if enemy_snake.alive:
                     occupied_positions.update(enemy_snake.body)
         
         # Add enemy positions (including enemy walls from super attacks)
-        if hasattr(self, 'enemies'):
+        if self.enemies:
             for enemy in self.enemies:
                 if enemy.alive:
                     occupied_positions.add((enemy.grid_x, enemy.grid_y))
@@ -1661,25 +1879,44 @@ class SnakeGame:
             y = random.randint(1, GRID_HEIGHT - 2)
             
             # Avoid lower right quadrant during boss battles (boss zone)
-            if hasattr(self, 'boss_active') and self.boss_active and self.boss_spawned:
+            if self.boss_active and self.boss_spawned:
                 # Lower right quadrant: x >= 8 and y >= 8 (roughly half of 15x15 grid)
                 if x >= 8 and y >= 8:
                     continue  # Skip this position, try again
             
             if (x, y) not in occupied_positions:
-                self.food_items.append(((x, y), 'worm'))
+                self.add_food_item((x, y), 'worm')
                 print("Spawned new worm at ({}, {})".format(x, y))
                 return
         
         # Debug: Show why spawning failed
         available_spaces = (GRID_WIDTH - 2) * (GRID_HEIGHT - 2)
-        if hasattr(self, 'boss_active') and self.boss_active and self.boss_spawned:
+        if self.boss_active and self.boss_spawned:
             # Subtract boss zone (roughly 7x7 = 49 spaces)
             available_spaces -= 49
         occupied_count = len(occupied_positions)
         print("Warning: Could not find valid position to spawn worm after 100 attempts")
         print("  Occupied positions: {}, Available spaces (approx): {}".format(occupied_count, available_spaces))
     
+    def get_frog_cells(self):
+        """Grid cells covered by the 4x4 frog boss, rebuilt only when it moves cell"""
+        frog_x = int(self.frog_position[0])
+        frog_y = int(self.frog_position[1])
+        if (frog_x, frog_y) != self.frog_cells_anchor:
+            self.frog_cells_anchor = (frog_x, frog_y)
+            self.frog_cells = tuple((frog_x + dx, frog_y + dy) for dx in range(4) for dy in range(4))
+            self.frog_cell_set = frozenset(self.frog_cells)
+        return self.frog_cells
+    
+    def get_frog_tongue_cells(self):
+        """Grid cells under the tongue, rebuilt only when a segment is added or removed"""
+        segments = self.frog_tongue_segments
+        key = (len(segments), segments[-1] if segments else None)
+        if key != self.frog_tongue_cells_key:
+            self.frog_tongue_cells_key = key
+            self.frog_tongue_cell_set = frozenset((int(round(x)), int(round(y))) for x, y in segments)
+        return self.frog_tongue_cell_set
+    
     def find_random_unoccupied_position(self):
         """Find a random unoccupied position for boss egg respawning."""
         occupied_positions = set()
@@ -1687,28 +1924,22 @@ class SnakeGame:
         occupied_positions.update(self.level_walls)
         
         # Add existing food items
-        occupied_positions.update([pos for pos, _ in self.food_items])
+        occupied_positions.update(self.food_by_pos)
         
         # Add boss minion positions
-        if hasattr(self, 'boss_minions'):
+        if self.boss_minions:
             for minion in self.boss_minions:
                 if minion.alive:
                     occupied_positions.update(minion.body)
         
         # Add enemy positions
-        if hasattr(self, 'enemies'):
-            for enemy in self.enemies:
-                if enemy.alive:
-                    occupied_positions.add((enemy.grid_x, enemy.grid_y))
+        if self.enemies:
+            occupied_positions.update((enemy.grid_x, enemy.grid_y) for enemy in self.enemies if enemy.alive)
         
         # Add frog boss position if present
         if hasattr(self, 'boss_type') and self.boss_type == 'frog' and hasattr(self, 'frog_position'):
-            frog_x = int(self.frog_position[0])
-            frog_y = int(self.frog_position[1])
             # Frog occupies 4x4 grid cells
-            for dx in range(4):
-                for dy in range(4):
-                    occupied_positions.add((frog_x + dx, frog_y + dy))
+            occupied_positions.update(self.get_frog_cells())
         
         # Try to find a valid spawn position
         max_attempts = 100
@@ -1717,16 +1948,8 @@ class SnakeGame:
             y = random.randint(2, GRID_HEIGHT - 3)
             
             # Check if position and surrounding 2x2 area are clear (for egg size)
-            position_clear = True
-            for dx in range(2):
-                for dy in range(2):
-                    if (x + dx, y + dy) in occupied_positions:
-                        position_clear = False
-                        break
-                if not position_clear:
-                    break
-            
-            if position_clear:
+            if ((x, y) not in occupied_positions and (x + 1, y) not in occupied_positions and
+                    (x, y + 1) not in occupied_positions and (x + 1, y + 1) not in occupied_positions):
                 return (x, y)
         
         # Fallback to center if no position found
@@ -1801,9 +2024,6 @@ class SnakeGame:
             print("Warning: No spewtum frames loaded, cannot spawn spewtums")
             return
         
-        import math
-        import random
-        
         # Safety check: Don't spawn if player has no body (died)
         if not self.snake.body or len(self.snake.body) == 0:
             print("Boss attack skipped: player has no body")
@@ -1815,8 +2035,7 @@ class SnakeGame:
         
         # Player head position (convert to pixel coordinates)
         player_head = self.snake.body[0]
-        player_x = player_head[0] * GRID_SIZE + GRID_SIZE // 2
-        player_y = player_head[1] * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y
+        player_x, player_y = grid_to_pixel_center(*player_head)
         
         # Calculate direction from boss to player
         dx = player_x - boss_center_x
@@ -1869,8 +2088,6 @@ class SnakeGame:
     
     def spawn_boss_super_attack(self):
         """Boss super attack: spawns 3 destroyable enemy walls around the arena"""
-        import random
-        
         print("BOSS SUPER ATTACK: Spawning enemy walls!")
         
         # Create a small pattern of enemy walls (just 3 walls)
@@ -1879,6 +2096,7 @@ class SnakeGame:
         # Spawn 3 random walls in strategic positions
         attempts = 0
         max_attempts = 50
+        snake_cells = self.snake.get_body_cells()
         
         while len(wall_positions) < 3 and attempts < max_attempts:
             attempts += 1
@@ -1890,7 +2108,7 @@ class SnakeGame:
             
             # Make sure not spawning on player, existing walls, or too close to boss
             # Boss is in bottom right corner, so avoid that area
-            if (pos not in self.snake.body and 
+            if (pos not in snake_cells and 
                 pos not in self.level_walls and
                 pos not in wall_positions and
                 x < GRID_WIDTH - 4 and  # Keep away from boss area
@@ -1903,7 +2121,7 @@ class SnakeGame:
             existing_enemy_positions = [(e.grid_x, e.grid_y) for e in self.enemies if e.alive]
             food_positions = [food_pos for food_pos, _ in self.food_items]
             
-            if (pos not in self.snake.body and 
+            if (pos not in snake_cells and 
                 pos not in existing_enemy_positions and
                 pos not in food_positions):
                 
@@ -1917,7 +2135,7 @@ class SnakeGame:
         self.screen_shake_intensity = 5
         self.screen_shake_timer = 30  # Frames to shake
         
-        print("Spawned {} enemy walls in super attack pattern".format(len([e for e in self.enemies if e.enemy_type == 'enemy_wall' and e.alive])))
+        print("Spawned {} enemy walls in super attack pattern".format(len([e for e in self.enemies if e.kind == EnemyKind.WALL and e.alive])))
     
     def update_frog_boss(self):
         """Update Frog Boss behavior: falling entrance, jumping, shadow movement, tongue attacks"""
@@ -1963,7 +2181,6 @@ class SnakeGame:
                     frog_center_y = self.frog_position[1] + 2
                     dx = player_head[0] - frog_center_x
                     dy = player_head[1] - frog_center_y
-                    import math
                     angle_rad = math.atan2(dy, dx)
                     angle_deg = math.degrees(angle_rad)
                     if angle_deg < 0:
@@ -2059,21 +2276,14 @@ class SnakeGame:
             self.frog_jump_timer = 0  # Reset jump timer to prevent jumping during death
             self.frog_landed_timer = 0  # Reset landed timer
             # Destroy all enemy walls immediately
-            if hasattr(self, 'enemies') and self.enemies:
-                for enemy in self.enemies:
-                    if enemy.alive and enemy.enemy_type == 'enemy_wall':
-                        enemy.alive = False
-                        self.create_particles(enemy.grid_x * GRID_SIZE + GRID_SIZE // 2,
-                                            enemy.grid_y * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y,
-                                            GRAY, 12)
-                print("All enemy walls destroyed!")
+            self.destroy_enemy_walls()
         
         # Death sequence phases
         if self.boss_defeated:
             # Phase 1: Brief pause (1 second)
             if self.boss_death_phase == 1:
                 # Initialize timer if it doesn't exist (safety check)
-                if not hasattr(self, 'boss_death_phase1_timer'):
+                if self.boss_death_phase1_timer is None:
                     self.boss_death_phase1_timer = 60  # 1 second
                 
                 if self.boss_death_phase1_timer > 0:
@@ -2087,8 +2297,7 @@ class SnakeGame:
                     # Play death sound now that music has faded
                     self.sound_manager.play('frogBossDeath')
                     # Clear any existing shake timer
-                    if hasattr(self, 'screen_shake_timer'):
-                        self.screen_shake_timer = 0
+                    self.screen_shake_timer = 0
             
             # Phase 2: Shake with continuous explosions (4 seconds)
             elif self.boss_death_phase == 2 and self.boss_slide_timer > 0:
@@ -2101,9 +2310,8 @@ class SnakeGame:
                     frog_center_x = int((self.frog_position[0] + 2) * GRID_SIZE)
                     frog_center_y = int((self.frog_position[1] + 2) * GRID_SIZE + GAME_OFFSET_Y)
                     # Spawn particles randomly within frog sprite (4x4 grid cells = 128x128 pixels)
-                    import random
-                    rand_x = frog_center_x + random.randint(-GRID_SIZE * 2, GRID_SIZE * 2)
-                    rand_y = frog_center_y + random.randint(-GRID_SIZE * 2, GRID_SIZE * 2)
+                    rand_x = frog_center_x + self.effect_randrange(-GRID_SIZE * 2, GRID_SIZE * 2 + 1)
+                    rand_y = frog_center_y + self.effect_randrange(-GRID_SIZE * 2, GRID_SIZE * 2 + 1)
                     self.create_particles(rand_x, rand_y, None, None, particle_type='white')
                 
                 # When timer expires, move to phase 3
@@ -2161,14 +2369,11 @@ class SnakeGame:
                     self.boss_active = False
         
         # Periodic isotope spawning - maintain 2 isotopes on the field
-        if self.boss_spawned and hasattr(self, 'isotope_spawn_timer'):
+        if self.boss_spawned:
             self.isotope_spawn_timer += 1
             if self.isotope_spawn_timer >= self.isotope_spawn_interval:
-                isotope_count = sum(1 for _, food_type in self.food_items if food_type == 'isotope')
-                while isotope_count < 2:
-                    if self.spawn_isotope():
-                        isotope_count += 1
-                    else:
+                while self.isotope_count < 2:
+                    if not self.spawn_isotope():
                         break  # Stop if we can't find a valid spawn location
                 self.isotope_spawn_timer = 0
     
@@ -2193,7 +2398,6 @@ class SnakeGame:
             dy = player_head[1] - frog_center_y
             
             # Calculate angle in degrees (0 = right, 90 = down, 180 = left, 270 = up)
-            import math
             angle_rad = math.atan2(dy, dx)
             angle_deg = math.degrees(angle_rad)
             
@@ -2256,7 +2460,7 @@ class SnakeGame:
                     if dist < 0.1:  # Very close to last segment
                         hit_obstacle = True
                 # Check for wall collision (use rounded grid position)
-                if not hit_obstacle and hasattr(self, 'level_walls') and grid_pos in self.level_walls:
+                if not hit_obstacle and grid_pos in self.level_walls:
                     hit_obstacle = True
                 
                 if not hit_obstacle:
@@ -2291,11 +2495,11 @@ class SnakeGame:
         
         elif self.frog_tongue_retracting:
             # Retract tongue - remove segment every 8 frames (much slower)
-            if self.frog_tongue_timer % 8 == 0 and len(self.frog_tongue_segments) > 0:
+            if self.frog_tongue_timer % 8 == 0 and self.frog_tongue_segments:
                 self.frog_tongue_segments.pop()  # Remove last segment
             
             # Tongue fully retracted
-            if len(self.frog_tongue_segments) == 0:
+            if not self.frog_tongue_segments:
                 self.frog_tongue_retracting = False
                 self.frog_tongue_timer = 0
                 self.frog_jump_timer = 0  # Reset jump timer
@@ -2307,10 +2511,9 @@ class SnakeGame:
         
         # Check collision with player body (not head) - check if within same grid cell
         tongue_grid_pos = (int(round(tongue_pos[0])), int(round(tongue_pos[1])))
-        if tongue_grid_pos in self.snake.body[1:]:
-            # Find which body segment was hit
-            body_segment_index = self.snake.body.index(tongue_grid_pos)
-            
+        # Find which body segment was hit (-1 if none)
+        body_segment_index = self.snake.tail_index(tongue_grid_pos)
+        if body_segment_index > 0:
             # Destroy tongue segments from this point onwards
             tongue_segment_index = self.frog_tongue_segments.index(tongue_pos)
             destroyed_tongue_segments = self.frog_tongue_segments[tongue_segment_index:]
@@ -2318,7 +2521,7 @@ class SnakeGame:
             
             # Remove player body segments from hit point to tail
             removed_body_count = len(self.snake.body) - body_segment_index
-            self.snake.body = self.snake.body[:body_segment_index]
+            del self.snake.body[body_segment_index:]
             
             # Start retracting immediately
             self.frog_tongue_extending = False
@@ -2326,13 +2529,14 @@ class SnakeGame:
             self.frog_tongue_timer = 0
             
             # Create particles at hit location
-            hit_x = int(tongue_pos[0] * GRID_SIZE + GRID_SIZE // 2)
-            hit_y = int(tongue_pos[1] * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y)
+            hit_x = int(tongue_pos[0] * GRID_SIZE + HALF_GRID)
+            hit_y = int(tongue_pos[1] * GRID_SIZE + CENTER_Y_OFFSET)
             self.create_particles(hit_x, hit_y, RED, 10)
             self.sound_manager.play('eat_fruit')
             
-            print("Frog tongue hit player body! {} tongue segments destroyed, {} body segments lost".format(
-                len(destroyed_tongue_segments), removed_body_count))
+            if DEBUG_COMBAT:
+                print("Frog tongue hit player body! {} tongue segments destroyed, {} body segments lost".format(
+                    len(destroyed_tongue_segments), removed_body_count))
     
     def start_frog_jump(self):
         """Start frog jump sequence"""
@@ -2450,25 +2654,136 @@ class SnakeGame:
                 continue
             
             # Check multiplayer walls
-            if hasattr(self, 'walls') and self.walls and (x, y) in self.walls:
+            if self.walls and (x, y) in self.walls:
                 continue
             
             # Check adventure mode walls
-            if hasattr(self, 'level_walls') and (x, y) in self.level_walls:
+            if (x, y) in self.level_walls:
                 continue
             
             # Valid spawn position found!
-            self.food_items.append(((x, y), food_type))
+            self.add_food_item((x, y), food_type)
             print("Spawned {} at {}".format(food_type, (x, y)))
             return
         print("Warning: Could not spawn {}".format(food_type))
     
+    def add_food_item(self, pos, food_type):
+        """Add a pickup to food_items and index its cell"""
+        self.food_items.append((pos, food_type))
+        self.food_by_pos[pos] = food_type
+    
+    def remove_food_item(self, index):
+        """Remove food_items[index] and drop its cell from food_by_pos.
+        
+        The last item is moved into the gap, so callers must stop iterating
+        food_items after removing (every pickup loop breaks right away).
+        """
+        food_items = self.food_items
+        food_pos, _ = food_items[index]
+        # Nothing depends on food_items order, so swap-pop instead of shifting the tail
+        food_items[index] = food_items[-1]
+        food_items.pop()
+        # Keep the cell if another item still sits on it (level data may stack them)
+        for other_pos, other_type in self.food_items:
+            if other_pos == food_pos:
+                self.food_by_pos[food_pos] = other_type
+                return
+        del self.food_by_pos[food_pos]
+    
+    def eat_bonus_fruit(self, food_pos):
+        """Adventure pickup: bonus fruit gives extra points and special effects"""
+        self.sound_manager.play('powerup')
+        self.snake.grow(self.get_difficulty_length_modifier())
+        base_points = (47 + len(self.snake.body)) * self.level
+        self.score += int(base_points * self.get_score_multiplier())
+        self.create_particles(*grid_to_pixel_center(*food_pos), None, None, particle_type='rainbow')
+        self.bonus_fruits_collected += 1
+        # Bonus fruit doesn't count toward worms_required
+    
+    def eat_coin(self, food_pos):
+        """Adventure pickup: coin adds 1 coin to the persistent total"""
+        self.sound_manager.play('pickupCoin')
+        self.total_coins += 1
+        self.save_unlocked_levels()  # Save coins immediately
+        
+        # Check for Gold Farmer achievement (1000 coins)
+        if self.total_coins >= 1000:
+            self.unlock_achievement(6)
+        
+        self.create_particles(*grid_to_pixel_center(*food_pos), None, None, particle_type='yellow')
+        # Coins don't grow snake or count toward completion
+    
+    def eat_diamond(self, food_pos):
+        """Adventure pickup: diamond adds 10 coins to the persistent total"""
+        self.sound_manager.play('pickupDiamond')
+        self.total_coins += 10
+        self.save_unlocked_levels()  # Save coins immediately
+        self.create_particles(*grid_to_pixel_center(*food_pos), None, None, particle_type='yellow')
+        # Diamonds don't grow snake or count toward completion
+    
+    def eat_isotope(self, food_pos):
+        """Adventure pickup: isotope grants shooting ability"""
+        self.sound_manager.play('powerup')
+        self.snake.can_shoot = True
+        # Grow snake when collecting isotope
+        if self.game_mode == 'adventure':
+            self.snake.grow(5)  # Grant 5 segments in adventure mode
+        else:
+            self.snake.grow(10)  # Grant 10 segments in boss mode
+        self.create_particles(*grid_to_pixel_center(*food_pos), NEON_PURPLE, 15)
+        self.isotope_count -= 1
+        # Show "Press A to Fire" message for 5 seconds
+        self.isotope_message_timer = 300  # 5 seconds at 60 FPS
+        # Isotope doesn't count toward worms collected for level completion
+    
+    def eat_worm(self, food_pos):
+        """Adventure pickup: regular worm, counts toward level completion"""
+        self.sound_manager.play('eat_fruit')
+        self.snake.grow(1)
+        self.create_particles(*grid_to_pixel_center(*food_pos), RED, 10)
+        self.worms_collected += 1
+        
+        # In boss battles, respawn worms less frequently (30% chance)
+        if self.boss_active:
+            if random.random() < 0.3:  # 30% chance to spawn worm
+                self.spawn_adventure_food()
+        
+        # Check if all worms collected (but not in boss mode)
+        # In boss mode, level only ends when boss is defeated
+        if self.worms_collected >= self.worms_required and not (self.boss_active):
+            self.sound_manager.play('level_up')
+            
+            # Calculate completion percentage for adventure mode
+            # Starting length is 3 segments
+            starting_length = 3
+            # Include pending growth segments in the final count
+            current_segments = len(self.snake.body) + self.snake.grow_pending
+            segments_gained = current_segments - starting_length
+            
+            total_items = self.worms_required + self.total_bonus_fruits
+            items_collected = self.worms_collected + self.bonus_fruits_collected
+            
+            # Completion = (items + segments) / (total_items * 2) * 100
+            max_possible = total_items + total_items
+            actual_earned = items_collected + segments_gained
+            self.completion_percentage = int((actual_earned / max_possible) * 100) if max_possible > 0 else 0
+            self.final_segments = current_segments
+            
+            # Save level score for adventure mode (still track for backwards compatibility)
+            self.is_new_level_high_score = self.update_level_score(self.current_adventure_level, self.completion_percentage)
+            # Unlock next level
+            self.unlock_level(self.current_adventure_level + 1)
+            # Play victory jingle
+            self.music_manager.play_victory_jingle()
+            self.state = GameState.LEVEL_COMPLETE
+    
     def spawn_bonus_food(self):
+        snake_cells = self.snake.get_body_cells()
         while True:
             # Spawn bonus food within playable area (avoid 1-grid-cell border)
             x = random.randint(1, GRID_WIDTH - 2)
             y = random.randint(1, GRID_HEIGHT - 2)
-            if (x, y) not in self.snake.body and (x, y) != self.food_pos:
+            if (x, y) not in snake_cells and (x, y) != self.food_pos:
                 self.bonus_food_pos = (x, y)
                 self.bonus_food_timer = 600
                 break
@@ -2480,7 +2795,7 @@ class SnakeGame:
         occupied_positions.update(self.snake.body)
         
         # Add boss minion positions if they exist
-        if hasattr(self, 'boss_minions'):
+        if self.boss_minions:
             for minion in self.boss_minions:
                 if minion and minion.alive:
                     occupied_positions.update(minion.body)
@@ -2488,12 +2803,11 @@ class SnakeGame:
         # Add existing food items
         occupied_positions.update([pos for pos, _ in self.food_items])
         
-        # Add level walls if they exist
-        if hasattr(self, 'level_walls'):
-            occupied_positions.update(self.level_walls)
+        # Add level walls
+        occupied_positions.update(self.level_walls)
         
         # Add enemy positions (including enemy walls from super attacks)
-        if hasattr(self, 'enemies'):
+        if self.enemies:
             for enemy in self.enemies:
                 if enemy.alive:
                     occupied_positions.add((enemy.grid_x, enemy.grid_y))
@@ -2505,19 +2819,20 @@ class SnakeGame:
             y = random.randint(2, GRID_HEIGHT - 3)
             
             # Avoid lower right quadrant during boss battles (boss zone)
-            if hasattr(self, 'boss_active') and self.boss_active and self.boss_spawned:
+            if self.boss_active and self.boss_spawned:
                 # Lower right quadrant: x >= 8 and y >= 8
                 if x >= 8 and y >= 8:
                     continue  # Skip this position, try again
             
             if (x, y) not in occupied_positions:
-                self.food_items.append(((x, y), 'isotope'))
+                self.add_food_item((x, y), 'isotope')
+                self.isotope_count += 1
                 print("Spawned isotope at ({}, {})".format(x, y))
                 return True
         
         # Debug: Show why spawning failed
         available_spaces = (GRID_WIDTH - 4) * (GRID_HEIGHT - 4)
-        if hasattr(self, 'boss_active') and self.boss_active and self.boss_spawned:
+        if self.boss_active and self.boss_spawned:
             # Subtract boss zone (roughly 7x7 = 49 spaces)
             available_spaces -= 49
         occupied_count = len(occupied_positions)
@@ -2534,22 +2849,11 @@ class SnakeGame:
     
     def get_score_multiplier(self):
         """Get the score multiplier based on difficulty."""
-        if self.difficulty == Difficulty.EASY:
-            return 0.5
-        elif self.difficulty == Difficulty.MEDIUM:
-            return 1.0
-        elif self.difficulty == Difficulty.HARD:
-            return 2.0
-        return 1.0
+        return SCORE_MULTIPLIERS.get(self.difficulty, 1.0)
     def get_difficulty_length_modifier(self):
-        # In endless mode, growth varies by difficulty
+        # In endless mode, growth varies by difficulty (EASY 1, MEDIUM 2, HARD 4)
         if self.game_mode == "endless":
-            if self.difficulty == Difficulty.HARD:
-                return 4
-            elif self.difficulty == Difficulty.MEDIUM:
-                return 2
-            else:  # EASY
-                return 1
+            return ENDLESS_GROWTH_BY_DIFFICULTY.get(self.difficulty, 1)
         
         # In other modes (adventure/multiplayer), keep original behavior
         # Hard mode: grow by 2 instead of 1 (fills faster)
@@ -2558,6 +2862,65 @@ class SnakeGame:
         # Medium mode: normal growth
         return 1
     
+    def handle_snake_death(self, mark_boss_respawn=True):
+        """Kill the single-player snake: lose a life, then game over or respawn.
+        
+        Adventure mode clears the body and waits out respawn_delay before the egg;
+        other modes go straight to EGG_HATCHING, flagged as a boss respawn if
+        mark_boss_respawn is set.
+        """
+        self.sound_manager.play('die')
+        self.lives -= 1
+        
+        # Spawn white particles on all snake body segments
+        self.create_particles_batch(self.snake.body, particle_type='white')
+        
+        if self.lives < 0:
+            self.sound_manager.play('no_lives')
+            self.music_manager.play_game_over_music()
+            self.state = GameState.GAME_OVER
+            self.game_over_timer = self.game_over_delay
+        else:
+            # In adventure mode, wait before going to egg hatching to clear visuals
+            if self.game_mode == "adventure":
+                self.respawn_timer = self.respawn_delay
+                # Clear the snake body immediately
+                self.snake.body = []
+            else:
+                # Go to egg hatching state for respawn
+                self.state = GameState.EGG_HATCHING
+                # Mark this as a respawn for boss battles
+                if mark_boss_respawn and self.boss_active:
+                    self.boss_egg_is_respawn = True
+                    self.egg_timer = 0
+    
+    def handle_frog_boss_death(self, cause):
+        """Kill the single-player snake on head contact with the Frog Boss or its tongue.
+        
+        Unlike handle_snake_death, the last life ends the game at zero and the
+        egg goes straight to EGG_HATCHING at a random free spot, clear of the frog.
+        """
+        self.sound_manager.play('die')
+        self.lives -= 1
+        
+        # Spawn white particles on all snake body segments
+        self.create_particles_batch(self.snake.body, particle_type='white')
+        
+        if self.lives <= 0:
+            self.music_manager.play_game_over_music()
+            self.state = GameState.GAME_OVER
+            self.game_over_timer = self.game_over_delay
+        else:
+            self.state = GameState.EGG_HATCHING
+            if self.boss_active:
+                self.boss_egg_is_respawn = True
+                self.egg_timer = 0
+                # Generate random egg respawn position
+                self.boss_egg_respawn_pos = self.find_random_unoccupied_position()
+                if DEBUG_COMBAT:
+                    print("Generated random egg respawn position: {}".format(self.boss_egg_respawn_pos))
+        print("Player died from touching {}!".format(cause))
+    
     def handle_player_death(self, snake):
         """Handle a player's death in multiplayer mode."""
         if not snake.alive:
@@ -2568,10 +2931,7 @@ class SnakeGame:
         self.sound_manager.play('die')
         
         # Spawn white particles on all body segments
-        for segment_x, segment_y in snake.body:
-            self.create_particles(segment_x * GRID_SIZE + GRID_SIZE // 2,
-                                segment_y * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y, 
-                                None, None, particle_type='white')
+        self.create_particles_batch(snake.body, particle_type='white')
         
         print("Player {} died! Lives remaining: {}".format(snake.player_id + 1, snake.lives))
         
@@ -2646,8 +3006,7 @@ class SnakeGame:
         
         # Spawn egg crack particles and egg pieces
         self.sound_manager.play('crack')
-        center_x = pos[0] * GRID_SIZE + GRID_SIZE // 2
-        center_y = pos[1] * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y
+        center_x, center_y = grid_to_pixel_center(*pos)
         
         # Spawn particle effect
         self.create_particles(center_x, center_y, None, None, particle_type='white')
@@ -2670,12 +3029,12 @@ class SnakeGame:
     def get_safe_cpu_direction(self, pos):
         """Find a safe direction for CPU to hatch from egg."""
         x, y = pos
-        directions = [Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT]
+        directions = CARDINAL_DIRECTIONS
         
         # Check which directions are safe
         safe_dirs = []
         for direction in directions:
-            dx, dy = direction.value
+            dx, dy = direction.delta
             new_x, new_y = x + dx, y + dy
             
             # Check if in bounds and not occupied
@@ -2683,7 +3042,7 @@ class SnakeGame:
                 is_safe = True
                 # Check against all snake bodies
                 for snake in self.snakes:
-                    if snake.alive and (new_x, new_y) in snake.body:
+                    if snake.alive and (new_x, new_y) in snake.get_body_cells():
                         is_safe = False
                         break
                 if is_safe:
@@ -2701,9 +3060,9 @@ class SnakeGame:
         
         # Get all possible directions (excluding opposite of current direction)
         possible_directions = []
-        for direction in [Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT]:
+        for direction in CARDINAL_DIRECTIONS:
             # Can't go opposite direction
-            if direction.value == (-snake.direction.value[0], -snake.direction.value[1]):
+            if direction is snake.direction.opposite:
                 continue
             possible_directions.append(direction)
         
@@ -2713,7 +3072,7 @@ class SnakeGame:
         safe_moves = []  # Track moves that don't immediately kill
         
         for direction in possible_directions:
-            dx, dy = direction.value
+            dx, dy = direction.delta
             new_x = head_x + dx
             new_y = head_y + dy
             
@@ -2728,10 +3087,10 @@ class SnakeGame:
             elif (new_x, new_y) in self.level_walls:
                 score -= 10000  # Adventure mode level wall collision
                 is_immediately_fatal = True
-            elif hasattr(self, 'walls') and self.walls and (new_x, new_y) in self.walls:
+            elif self.walls and (new_x, new_y) in self.walls:
                 score -= 10000  # Multiplayer level wall collision
                 is_immediately_fatal = True
-            elif (new_x, new_y) in snake.body:
+            elif (new_x, new_y) in snake.get_body_cells():
                 score -= 10000  # Self collision
                 is_immediately_fatal = True
             else:
@@ -2740,7 +3099,7 @@ class SnakeGame:
                 # Check collision with other snakes
                 for other_snake in self.snakes:
                     if other_snake.player_id != snake.player_id and other_snake.alive:
-                        if (new_x, new_y) in other_snake.body:
+                        if (new_x, new_y) in other_snake.get_body_cells():
                             score -= 10000
                             is_immediately_fatal = True
                             break
@@ -2790,8 +3149,8 @@ class SnakeGame:
                     # Avoid danger zones (look ahead)
                     if difficulty >= 2:
                         danger_count = 0
-                        for check_dir in [Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT]:
-                            cdx, cdy = check_dir.value
+                        for check_dir in CARDINAL_DIRECTIONS:
+                            cdx, cdy = check_dir.delta
                             check_x = new_x + cdx
                             check_y = new_y + cdy
                             
@@ -2800,7 +3159,7 @@ class SnakeGame:
                                 danger_count += 1
                             else:
                                 for other_snake in self.snakes:
-                                    if other_snake.alive and (check_x, check_y) in other_snake.body:
+                                    if other_snake.alive and (check_x, check_y) in other_snake.get_body_cells():
                                         danger_count += 1
                                         break
                         
@@ -2809,15 +3168,15 @@ class SnakeGame:
                     # Brutal: avoid corners and tight spaces
                     if difficulty >= 3:
                         open_spaces = 0
-                        for check_dir in [Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT]:
-                            cdx, cdy = check_dir.value
+                        for check_dir in CARDINAL_DIRECTIONS:
+                            cdx, cdy = check_dir.delta
                             check_x = new_x + cdx
                             check_y = new_y + cdy
                             
                             if 0 <= check_x < GRID_WIDTH and 0 <= check_y < GRID_HEIGHT:
                                 is_open = True
                                 for check_snake in self.snakes:
-                                    if check_snake.alive and (check_x, check_y) in check_snake.body:
+                                    if check_snake.alive and (check_x, check_y) in check_snake.get_body_cells():
                                         is_open = False
                                         break
                                 if is_open:
@@ -2855,7 +3214,7 @@ class SnakeGame:
         
         # Final validation: Make sure the chosen direction won't immediately kill us
         if best_direction:
-            dx, dy = best_direction.value
+            dx, dy = best_direction.delta
             next_x = head_x + dx
             next_y = head_y + dy
             
@@ -2865,12 +3224,12 @@ class SnakeGame:
                 is_safe = False
             elif (next_x, next_y) in self.level_walls:
                 is_safe = False  # Check level walls
-            elif (next_x, next_y) in snake.body:
+            elif (next_x, next_y) in snake.get_body_cells():
                 is_safe = False
             else:
                 for other_snake in self.snakes:
                     if other_snake.player_id != snake.player_id and other_snake.alive:
-                        if (next_x, next_y) in other_snake.body:
+                        if (next_x, next_y) in other_snake.get_body_cells():
                             is_safe = False
                             break
             
@@ -2887,7 +3246,7 @@ class SnakeGame:
             if snake.alive:
                 occupied_positions.update(snake.body)
         occupied_positions.update([pos for pos, _ in self.food_items])
-        occupied_positions.update([data['pos'] for data in self.respawning_players.values()])
+        occupied_positions.update([egg.pos for egg in self.respawning_players.values()])
         
         max_attempts = 100
         for _ in range(max_attempts):
@@ -2899,20 +3258,16 @@ class SnakeGame:
                 continue
             
             # Check multiplayer walls
-            if hasattr(self, 'walls') and self.walls and (x, y) in self.walls:
+            if self.walls and (x, y) in self.walls:
                 continue
             
             # Check adventure mode walls
-            if hasattr(self, 'level_walls') and (x, y) in self.level_walls:
+            if (x, y) in self.level_walls:
                 continue
             
             # Valid spawn position found!
             # Spawn egg with 5 second timer (5 * 60 = 300 frames at 60fps)
-            self.respawning_players[player_id] = {
-                'pos': (x, y),
-                'timer': 300,  # 5 seconds
-                'direction': None
-            }
+            self.respawning_players[player_id] = RespawnEgg((x, y), 300)  # 5 seconds
             print("Spawned respawn egg for Player {} at ({}, {})".format(player_id + 1, x, y))
             return
         
@@ -2922,15 +3277,92 @@ class SnakeGame:
     def create_particles(self, x, y, color=None, count=None, particle_type='red'):
         # Spawn a single GIF particle effect based on type
         # particle_type can be 'red', 'white', 'rainbow', or 'yellow'
+        frames = self.get_particle_frames(particle_type)
+        if frames:
+            self.particles.append(GifParticle(x, y, frames))
+        # If particle frames not loaded, do nothing (silent fail for better performance)
+    
+    def get_particle_frames(self, particle_type='red'):
+        # Resolve the GIF frame list for a particle type (same fallback as create_particles)
         if particle_type == 'white' and self.particle_white_frames:
-            self.particles.append(GifParticle(x, y, self.particle_white_frames))
+            return self.particle_white_frames
         elif particle_type == 'rainbow' and self.particle_rainbow_frames:
-            self.particles.append(GifParticle(x, y, self.particle_rainbow_frames))
+            return self.particle_rainbow_frames
         elif particle_type == 'yellow' and self.particle_yellow_frames:
-            self.particles.append(GifParticle(x, y, self.particle_yellow_frames))
-        elif self.particle_frames:  # Default to red particles
-            self.particles.append(GifParticle(x, y, self.particle_frames))
-        # If particle frames not loaded, do nothing (silent fail for better performance)
+            return self.particle_yellow_frames
+        return self.particle_frames
+    
+    def create_particles_batch(self, cells, particle_type='red'):
+        """Spawn one particle effect centered on each grid cell in a single pass."""
+        frames = self.get_particle_frames(particle_type)
+        if not frames:
+            return
+        self.particles.extend([GifParticle(x * GRID_SIZE + HALF_GRID, y * GRID_SIZE + CENTER_Y_OFFSET, frames)
+                               for x, y in cells])
+    
+    def destroy_enemy_walls(self):
+        """Remove every live enemy wall, with one particle burst per wall."""
+        if not self.enemies:
+            return
+        wall_cells = []
+        for enemy in self.enemies:
+            if enemy.alive and enemy.kind == EnemyKind.WALL:
+                enemy.alive = False
+                wall_cells.append((enemy.grid_x, enemy.grid_y))
+        # Create particles where the walls were
+        self.create_particles_batch(wall_cells)
+        print("All enemy walls destroyed!")
+    
+    def get_boss_hitbox(self):
+        """Boss bullet hitbox as (left, top, right, bottom) in game-area pixels.
+        
+        Returns None while the boss can't be hit.
+        """
+        hitbox_getter = self.boss_hitbox_getters.get(self.boss_data)
+        return hitbox_getter() if hitbox_getter else None
+    
+    def get_worm_boss_hitbox(self):
+        """wormBoss hitbox: the 128x128 sprite"""
+        boss_left = self.boss_position[0]
+        boss_top = self.boss_position[1]
+        return (boss_left, boss_top, boss_left + 128, boss_top + 128)
+    
+    def get_frog_hitbox(self):
+        """Frog Boss hitbox: 2x2 grid cells, only vulnerable when on ground (not jumping/airborne)"""
+        if not self.frog_is_invulnerable and self.frog_state in ('landed', 'falling'):
+            frog_left = self.frog_position[0] * GRID_SIZE
+            frog_top = self.frog_position[1] * GRID_SIZE
+            return (frog_left, frog_top, frog_left + GRID_SIZE * 2, frog_top + GRID_SIZE * 2)
+        return None
+    
+    def build_bullet_hit_grid(self):
+        """Bucket bullet-hittable cells by grid position for this frame.
+        
+        Returns {(x, y): [(kind, target, index), ...]} with kind 'minion'
+        (target = minion index, index = segment), 'enemy_snake' or 'enemy'.
+        Entries keep list order so the first target still wins a shared cell.
+        Look cells up with .get() so misses don't add empty buckets.
+        """
+        # defaultdict only allocates a bucket for a new cell, unlike
+        # setdefault(cell, []) which builds a throwaway list on every call
+        hit_grid = defaultdict(list)
+        if self.boss_active and self.boss_minions:
+            for minion_idx, minion in enumerate(self.boss_minions):
+                if minion.alive:
+                    for segment_index, cell in enumerate(minion.body):
+                        hit_grid[cell].append(('minion', minion_idx, segment_index))
+        for enemy_snake in self.enemy_snakes:
+            if enemy_snake.alive:
+                hit = ('enemy_snake', enemy_snake, 0)  # Same entry for every segment
+                for cell in enemy_snake.body:
+                    hit_grid[cell].append(hit)
+        for enemy in self.enemies:
+            if enemy.alive and enemy.kind in SHOOTABLE_ENEMY_KINDS:
+                # Scorpions are 2x2 and register all four cells
+                hit = ('enemy', enemy, 0)
+                for cell in enemy.occupied_cells:
+                    hit_grid[cell].append(hit)
+        return hit_grid
     
     def get_interpolated_snake_positions(self):
         """Calculate smooth interpolated positions for snake segments"""
@@ -2987,19 +3419,15 @@ class SnakeGame:
                         snake.move_timer = 0
             
             # Update local effects (particles, animations) on client
-            self.particles = [p for p in self.particles if p.is_alive()]
-            for particle in self.particles:
-                particle.update()
+            self.particles = update_entities(self.particles)
             
-            self.egg_pieces = [p for p in self.egg_pieces if p.is_alive()]
-            for piece in self.egg_pieces:
-                piece.update()
+            self.egg_pieces = update_entities(self.egg_pieces)
             
             # Handle multiplayer end timer for client (game over transition)
-            if hasattr(self, 'multiplayer_end_timer') and self.multiplayer_end_timer > 0:
+            if self.multiplayer_end_timer > 0:
                 self.multiplayer_end_timer -= 1
                 if self.multiplayer_end_timer == 0:
-                    phase = getattr(self, 'multiplayer_end_timer_phase', 0)
+                    phase = self.multiplayer_end_timer_phase
                     if phase == 1:
                         # Phase 1 (client): Show game over screen after delay
                         self.music_manager.play_game_over_music()
@@ -3009,7 +3437,7 @@ class SnakeGame:
             
             # Handle network game over auto-progress timer for client
             if self.state == GameState.GAME_OVER:
-                if hasattr(self, 'network_game_over_auto_timer') and self.network_game_over_auto_timer > 0:
+                if self.network_game_over_auto_timer > 0:
                     self.network_game_over_auto_timer -= 1
             
             # Skip all other game logic updates for clients
@@ -3031,17 +3459,16 @@ class SnakeGame:
             # Increment boss timer (60 frames per second)
             self.boss_spawn_timer += 1 / 60.0
             
-            # At 16 seconds, start screen shake (only if boss hasn't spawned yet)
-            if self.boss_spawn_timer >= 14.0 and self.boss_spawn_timer < 28.0 and not self.boss_spawned:
-                
-                self.screen_shake_intensity = 2  # Shake intensity in pixels
-                        # At 16 seconds, start screen shake (only if boss hasn't spawned yet)
-            if self.boss_spawn_timer >= 17.0 and self.boss_spawn_timer < 28.0 and not self.boss_spawned:
-                
-                self.screen_shake_intensity = 4  # Shake intensity in pixels
-            if self.boss_spawn_timer >= 21.0 and self.boss_spawn_timer < 28.0 and not self.boss_spawned:
-                
-                self.screen_shake_intensity = 8  # Shake intensity in pixels
+            # Before the boss spawns, shake the screen harder as it gets closer
+            # (single compare ladder on the timer instead of re-testing every range each frame)
+            if not self.boss_spawned:
+                spawn_time = self.boss_spawn_timer
+                if spawn_time >= 21.0:
+                    self.screen_shake_intensity = 8  # Shake intensity in pixels
+                elif spawn_time >= 17.0:
+                    self.screen_shake_intensity = 4
+                elif spawn_time >= 14.0:
+                    self.screen_shake_intensity = 2
             
             # At 28 seconds, spawn the boss
             if self.boss_spawn_timer >= 28.0 and not self.boss_spawned:
@@ -3115,12 +3542,13 @@ class SnakeGame:
             # Update screen shake
             if self.screen_shake_intensity > 0:
                 # Random shake offset
-                shake_x = random.randint(-self.screen_shake_intensity, self.screen_shake_intensity)
-                shake_y = random.randint(-self.screen_shake_intensity, self.screen_shake_intensity)
+                shake = self.screen_shake_intensity
+                shake_x = self.effect_randrange(-shake, shake + 1)
+                shake_y = self.effect_randrange(-shake, shake + 1)
                 self.screen_shake_offset = (shake_x, shake_y)
                 
                 # Count down shake timer if it exists (for timed shakes like super attack)
-                if hasattr(self, 'screen_shake_timer') and self.screen_shake_timer > 0:
+                if self.screen_shake_timer > 0:
                     self.screen_shake_timer -= 1
                     if self.screen_shake_timer <= 0:
                         self.screen_shake_intensity = 0
@@ -3161,15 +3589,16 @@ class SnakeGame:
                                         else:
                                             self.state = GameState.EGG_HATCHING
                                             # Mark this as a respawn for boss battles
-                                            if hasattr(self, 'boss_active') and self.boss_active:
+                                            if self.boss_active:
                                                 self.boss_egg_is_respawn = True
                                                 self.egg_timer = 0
-                                elif minion.body[0] in self.snake.body[1:]:
+                                elif self.snake.tail_contains(minion.body[0]):
                                     # Minion head hit player's body - minion dies
                                     minion.alive = False
                                     self.boss_minion_respawn_timers[minion_idx] = 900  # 15 seconds at 60 FPS
                                     self.sound_manager.play('eat')
-                                    print("Boss minion {} killed, will respawn in 15 seconds".format(minion_idx + 1))
+                                    if DEBUG_COMBAT:
+                                        print("Boss minion {} killed, will respawn in 15 seconds".format(minion_idx + 1))
                             
                             # Boss minions don't eat food - they just wander as obstacles
                     else:
@@ -3202,10 +3631,9 @@ class SnakeGame:
                 # Phase 1: If death animation 1 doesn't exist or failed to load, auto-advance after short delay
                 if self.boss_death_phase == 1:
                     # Check if animation exists and has frames
-                    has_death_anim = 'wormBossDeath1' in self.boss_animations and len(self.boss_animations['wormBossDeath1']) > 0
-                    if not has_death_anim:
+                    if not self.boss_has_death1_anim:
                         # No phase 1 animation, use a timer instead
-                        if not hasattr(self, 'boss_death_phase1_timer'):
+                        if self.boss_death_phase1_timer is None:
                             self.boss_death_phase1_timer = 60  # 1 second
                         if self.boss_death_phase1_timer > 0:
                             self.boss_death_phase1_timer -= 1
@@ -3235,8 +3663,8 @@ class SnakeGame:
                         boss_x = self.boss_position[0]
                         boss_y = self.boss_position[1] + self.boss_slide_offset_y
                         # Random position within boss sprite (128x128)
-                        rand_x = boss_x + random.randint(15, 113)
-                        rand_y = boss_y + random.randint(15, 113)
+                        rand_x = boss_x + self.effect_randrange(15, 114)
+                        rand_y = boss_y + self.effect_randrange(15, 114)
                         # Create white explosion particles
                         self.create_particles(rand_x, rand_y, None, None, particle_type='white')
                     
@@ -3252,18 +3680,22 @@ class SnakeGame:
                         self.boss_death_delay = 120  # 2 seconds wait before victory jingle
             
             # Update spewtum projectiles
-            self.spewtums = [s for s in self.spewtums if s.alive]
+            spewtum_dead_count = 0
             for spewtum in self.spewtums:
                 spewtum.update()
+                if not spewtum.alive:
+                    spewtum_dead_count += 1
+                    continue
                 
                 # Check collision with player snake (only if snake has a body)
-                if len(self.snake.body) == 0:
+                player_body = self.snake.body
+                if not player_body:
                     continue
                 
                 spewtum_pos = (spewtum.grid_x, spewtum.grid_y)
                 
                 # Check if hit player head
-                if spewtum_pos == self.snake.body[0]:
+                if spewtum_pos == player_body[0]:
                     # Player dies
                     spewtum.alive = False
                     self.sound_manager.play('die')
@@ -3275,35 +3707,38 @@ class SnakeGame:
                     else:
                         self.state = GameState.EGG_HATCHING
                         # Mark this as a respawn for boss battles
-                        if hasattr(self, 'boss_active') and self.boss_active:
+                        if self.boss_active:
                             self.boss_egg_is_respawn = True
                             self.egg_timer = 0
                     print("Player hit by spewtum in the head!")
-                # Check if hit player body
-                elif spewtum_pos in self.snake.body[1:]:
-                    # Player loses segments from hit point to tail
-                    segment_index = self.snake.body.index(spewtum_pos)
-                    spewtum.alive = False
-                    self.sound_manager.play('eat_fruit')
-                    # Remove all segments from hit point to tail
-                    removed_count = len(self.snake.body) - segment_index
-                    self.snake.body = self.snake.body[:segment_index]
-                    # Create particles at hit location
-                    hit_x = spewtum_pos[0] * GRID_SIZE + GRID_SIZE // 2
-                    hit_y = spewtum_pos[1] * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y
-                    self.create_particles(hit_x, hit_y, RED, 10)
-                    print("Player hit by spewtum in body! Lost {} segments".format(removed_count))
+                else:
+                    # Check if hit player body (-1 if not on a body segment)
+                    segment_index = self.snake.tail_index(spewtum_pos)
+                    if segment_index > 0:
+                        # Player loses segments from hit point to tail
+                        spewtum.alive = False
+                        self.sound_manager.play('eat_fruit')
+                        # Remove all segments from hit point to tail
+                        removed_count = len(player_body) - segment_index
+                        del player_body[segment_index:]
+                        # Create particles at hit location
+                        hit_x, hit_y = grid_to_pixel_center(*spewtum_pos)
+                        self.create_particles(hit_x, hit_y, RED, 10)
+                        if DEBUG_COMBAT:
+                            print("Player hit by spewtum in body! Lost {} segments".format(removed_count))
+            
+            # Only rebuild the list on frames where a spewtum expired
+            # (ones destroyed by a hit above are swept on the next frame)
+            if spewtum_dead_count:
+                self.spewtums = [s for s in self.spewtums if s.alive]
             
             # Periodic isotope spawning for boss battles - maintain 2 isotopes
-            if self.boss_spawned and hasattr(self, 'isotope_spawn_timer'):
+            if self.boss_spawned:
                 self.isotope_spawn_timer += 1
                 if self.isotope_spawn_timer >= self.isotope_spawn_interval:
                     # Spawn isotopes until we have 2 on the field
-                    isotope_count = sum(1 for _, food_type in self.food_items if food_type == 'isotope')
-                    while isotope_count < 2:
-                        if self.spawn_isotope():
-                            isotope_count += 1
-                        else:
+                    while self.isotope_count < 2:
+                        if not self.spawn_isotope():
                             break  # Stop if we can't find a valid spawn location
                     # Reset timer
                     self.isotope_spawn_timer = 0
@@ -3327,8 +3762,8 @@ class SnakeGame:
                             self.update_cpu_decision(enemy_snake)
                             enemy_snake.move_timer = 0
                             enemy_snake.last_move_interval = move_interval
-                            enemy_snake.previous_body = enemy_snake.body.copy()
-                            enemy_snake.move()
+                            enemy_snake.move()  # move() snapshots previous_body itself
+                            enemy_snake.bounds = enemy_snake.get_bounds()
                             
                             # Enemy snakes with can_eat=False should not eat food (to preserve scoring)
                             # They roam around but never consume food items
@@ -3340,15 +3775,15 @@ class SnakeGame:
                             enemy_head = enemy_snake.body[0]
                             
                             # Check if player head hits enemy snake (any part) - player dies
-                            if player_head in enemy_snake.body:
+                            # (bounding box gate skips the body scan when the snakes are apart)
+                            min_x, min_y, max_x, max_y = enemy_snake.bounds
+                            if (min_x <= player_head[0] <= max_x and min_y <= player_head[1] <= max_y and
+                                    player_head in enemy_snake.get_body_cells()):
                                 self.sound_manager.play('die')
                                 self.lives -= 1
                                 
                                 # Spawn white particles on all body segments including head
-                                for segment_x, segment_y in self.snake.body:
-                                    self.create_particles(segment_x * GRID_SIZE + GRID_SIZE // 2,
-                                                        segment_y * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y,
-                                                        None, None, particle_type='white')
+                                self.create_particles_batch(self.snake.body, particle_type='white')
                                 
                                 if self.lives <= 0:
                                     self.music_manager.play_game_over_music()
@@ -3364,31 +3799,31 @@ class SnakeGame:
                                         self.respawn_snake()
                                 print("Player head hit enemy snake!")
                             # Check if enemy snake head hits player body - enemy snake dies
-                            elif enemy_head in self.snake.body[1:]:
+                            elif self.snake.tail_contains(enemy_head):
                                 enemy_snake.alive = False
                                 self.sound_manager.play('die')
                                 
                                 # Spawn white particles on all enemy snake body segments
-                                for segment_x, segment_y in enemy_snake.body:
-                                    self.create_particles(segment_x * GRID_SIZE + GRID_SIZE // 2,
-                                                        segment_y * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y,
-                                                        None, None, particle_type='white')
+                                self.create_particles_batch(enemy_snake.body, particle_type='white')
                                 
-                                print("Enemy snake head hit player body - enemy snake dies!")
+                                if DEBUG_COMBAT:
+                                    print("Enemy snake head hit player body - enemy snake dies!")
                     else:
                         # Not in PLAYING state - sync previous_body to prevent flickering
-                        enemy_snake.previous_body = enemy_snake.body.copy()
+                        # (shared reference is safe: move() re-snapshots before mutating body)
+                        enemy_snake.previous_body = enemy_snake.body
                         enemy_snake.move_timer = 0
         
         # Update screen shake (works for all boss types)
         if self.screen_shake_intensity > 0:
             # Random shake offset
-            shake_x = random.randint(-self.screen_shake_intensity, self.screen_shake_intensity)
-            shake_y = random.randint(-self.screen_shake_intensity, self.screen_shake_intensity)
+            shake = self.screen_shake_intensity
+            shake_x = self.effect_randrange(-shake, shake + 1)
+            shake_y = self.effect_randrange(-shake, shake + 1)
             self.screen_shake_offset = (shake_x, shake_y)
             
             # Count down shake timer if it exists (for timed shakes like super attack)
-            if hasattr(self, 'screen_shake_timer') and self.screen_shake_timer > 0:
+            if self.screen_shake_timer > 0:
                 self.screen_shake_timer -= 1
                 if self.screen_shake_timer <= 0:
                     self.screen_shake_intensity = 0
@@ -3396,10 +3831,10 @@ class SnakeGame:
             self.screen_shake_offset = (0, 0)
         
         # Handle multiplayer end timer (delay after last player dies)
-        if hasattr(self, 'multiplayer_end_timer') and self.multiplayer_end_timer > 0:
+        if self.multiplayer_end_timer > 0:
             self.multiplayer_end_timer -= 1
             if self.multiplayer_end_timer == 0:
-                phase = getattr(self, 'multiplayer_end_timer_phase', 0)
+                phase = self.multiplayer_end_timer_phase
                 
                 if phase == 1:
                     # Phase 1 (client only): Show game over screen after delay
@@ -3422,7 +3857,7 @@ class SnakeGame:
         
         # Handle network multiplayer auto-progress to lobby (10 second timer)
         if self.state == GameState.GAME_OVER and self.is_network_game:
-            if hasattr(self, 'network_game_over_auto_timer') and self.network_game_over_auto_timer > 0:
+            if self.network_game_over_auto_timer > 0:
                 self.network_game_over_auto_timer -= 1
                 if self.network_game_over_auto_timer == 0:
                     # Auto-progress to lobby after 10 seconds
@@ -3484,7 +3919,7 @@ class SnakeGame:
                 # Timer expired, transition to egg hatching
                 self.state = GameState.EGG_HATCHING
                 # Mark this as a respawn for boss battles
-                if hasattr(self, 'boss_active') and self.boss_active:
+                if self.boss_active:
                     self.boss_egg_is_respawn = True
                     self.egg_timer = 0
         
@@ -3508,24 +3943,19 @@ class SnakeGame:
                     self.current_hint = random.choice(hints)
                 # Otherwise stay in GAME_OVER state for player to press button
         
-        self.particles = [p for p in self.particles if p.is_alive()]
-        for particle in self.particles:
-            particle.update()
+        self.particles = update_entities(self.particles)
         
         # Update egg pieces
-        self.egg_pieces = [p for p in self.egg_pieces if p.is_alive()]
-        for piece in self.egg_pieces:
-            piece.update()
+        self.egg_pieces = update_entities(self.egg_pieces)
         
-        # Update bullets
-        self.bullets = [b for b in self.bullets if b.alive]
-        for bullet in self.bullets:
-            bullet.update()
+        # Update bullets; spent ones go back to free_bullets for reuse
+        bullets = update_entities(self.bullets)
+        if bullets is not self.bullets:
+            self.free_bullets.extend(bullet for bullet in self.bullets if not bullet.alive)
+            self.bullets = bullets
         
         # Update scorpion stingers
-        self.scorpion_stingers = [s for s in self.scorpion_stingers if s.alive]
-        for stinger in self.scorpion_stingers:
-            stinger.update()
+        self.scorpion_stingers = update_entities(self.scorpion_stingers)
         
         # Check scorpion stinger collisions with player
         for stinger in self.scorpion_stingers:
@@ -3538,35 +3968,11 @@ class SnakeGame:
             if len(self.snake.body) > 0 and stinger_pos == self.snake.body[0]:
                 # Player head hit by stinger - dies
                 stinger.alive = False
-                self.sound_manager.play('die')
-                self.lives -= 1
-                
-                # Spawn white particles on all snake body segments
-                for segment_x, segment_y in self.snake.body:
-                    self.create_particles(segment_x * GRID_SIZE + GRID_SIZE // 2,
-                                        segment_y * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y, 
-                                        None, None, particle_type='white')
-                
-                if self.lives < 0:
-                    self.sound_manager.play('no_lives')
-                    self.music_manager.play_game_over_music()
-                    self.state = GameState.GAME_OVER
-                    self.game_over_timer = self.game_over_delay
-                else:
-                    # In adventure mode, wait before going to egg hatching to clear visuals
-                    if self.game_mode == "adventure":
-                        self.respawn_timer = self.respawn_delay
-                        # Clear the snake body immediately
-                        self.snake.body = []
-                    else:
-                        # Go to egg hatching state for respawn
-                        self.state = GameState.EGG_HATCHING
+                self.handle_snake_death(mark_boss_respawn=False)
                 break  # Don't check more stingers this frame
         
         # Update beetle larvae
-        self.beetle_larvae = [l for l in self.beetle_larvae if l.alive]
-        for larvae in self.beetle_larvae:
-            larvae.update()
+        self.beetle_larvae = update_entities(self.beetle_larvae)
         
         # Check beetle larvae collisions with player
         for larvae in self.beetle_larvae:
@@ -3576,235 +3982,152 @@ class SnakeGame:
             larvae_pos = (larvae.grid_x, larvae.grid_y)
             
             # Check if larvae hit player snake (only if snake has a body)
-            if len(self.snake.body) > 0 and larvae_pos in self.snake.body:
+            if larvae_pos in self.snake.get_body_cells():
                 # Player hit by larvae - dies
                 larvae.alive = False
-                self.sound_manager.play('die')
-                self.lives -= 1
-                
-                # Spawn white particles on all snake body segments
-                for segment_x, segment_y in self.snake.body:
-                    self.create_particles(segment_x * GRID_SIZE + GRID_SIZE // 2,
-                                        segment_y * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y, 
-                                        None, None, particle_type='white')
-                
-                if self.lives < 0:
-                    self.sound_manager.play('no_lives')
-                    self.music_manager.play_game_over_music()
-                    self.state = GameState.GAME_OVER
-                    self.game_over_timer = self.game_over_delay
-                else:
-                    # In adventure mode, wait before going to egg hatching to clear visuals
-                    if self.game_mode == "adventure":
-                        self.respawn_timer = self.respawn_delay
-                        # Clear the snake body immediately
-                        self.snake.body = []
-                    else:
-                        # Go to egg hatching state for respawn
-                        self.state = GameState.EGG_HATCHING
+                self.handle_snake_death(mark_boss_respawn=False)
                 break  # Don't check more larvae this frame
         
-        # Check bullet collisions with boss minions
-        if self.boss_active and hasattr(self, 'boss_minions') and self.boss_minions:
-            for bullet in self.bullets:
-                if not bullet.alive:
-                    continue
-                
-                bullet_pos = (bullet.grid_x, bullet.grid_y)
-                
-                for minion_idx, minion in enumerate(self.boss_minions):
-                    if not minion.alive:
+        # Bucket every bullet-hittable cell once so each bullet does a single dict lookup
+        hit_grid = self.build_bullet_hit_grid() if self.bullets else {}
+        
+        # Check bullet collisions with boss minions, enemy snakes and regular enemies
+        # in one pass; hit_grid entries are ordered minions, enemy snakes, enemies
+        for bullet in self.bullets:
+            if not bullet.alive:
+                continue
+            
+            bullet_pos = (bullet.grid_x, bullet.grid_y)
+            
+            for kind, target, segment_index in hit_grid.get(bullet_pos, ()):
+                if kind == 'minion':
+                    minion_idx = target
+                    minion = self.boss_minions[minion_idx]
+                    # Skip minions killed or cut short by an earlier bullet this frame
+                    if not minion.alive or segment_index >= len(minion.body):
                         continue
                     
                     # Check if bullet hit minion head (instant kill)
-                    if bullet_pos == minion.body[0]:
+                    if segment_index == 0:
                         # Headshot - kill the minion
                         minion.alive = False
                         bullet.alive = False
                         self.boss_minion_respawn_timers[minion_idx] = 900  # 15 seconds respawn
                         self.sound_manager.play('die')
                         # Create particles at hit location
-                        hit_x = bullet_pos[0] * GRID_SIZE + GRID_SIZE // 2
-                        hit_y = bullet_pos[1] * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y
+                        hit_x, hit_y = grid_to_pixel_center(*bullet_pos)
                         self.create_particles(hit_x, hit_y, RED, 15)
-                        print("Boss minion {} headshot! Respawning in 15 seconds.".format(minion_idx + 1))
-                        break
+                        if DEBUG_COMBAT:
+                            print("Boss minion {} headshot! Respawning in 15 seconds.".format(minion_idx + 1))
                     
-                    # Check if bullet hit minion body (remove segment)
-                    elif bullet_pos in minion.body[1:]:
-                        # Body shot - remove the segment that was hit
-                        segment_index = minion.body.index(bullet_pos)
-                        # Remove all segments from hit point to tail
-                        minion.body = minion.body[:segment_index]
+                    # Bullet hit minion body (remove segment)
+                    else:
+                        # Body shot - remove all segments from hit point to tail
+                        del minion.body[segment_index:]
                         bullet.alive = False
                         self.sound_manager.play('eat_fruit')
                         # Create particles at hit location
-                        hit_x = bullet_pos[0] * GRID_SIZE + GRID_SIZE // 2
-                        hit_y = bullet_pos[1] * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y
+                        hit_x, hit_y = grid_to_pixel_center(*bullet_pos)
                         self.create_particles(hit_x, hit_y, NEON_ORANGE, 8)
-                        print("Boss minion {} hit! Reduced to {} segments.".format(minion_idx + 1, len(minion.body)))
+                        if DEBUG_COMBAT:
+                            print("Boss minion {} hit! Reduced to {} segments.".format(minion_idx + 1, len(minion.body)))
                         
                         # If minion is too small, kill it
                         if len(minion.body) < 2:
                             minion.alive = False
                             self.boss_minion_respawn_timers[minion_idx] = 900
                             self.sound_manager.play('die')
-                            print("Boss minion {} destroyed! Respawning in 15 seconds.".format(minion_idx + 1))
-                        break
-        
-        # Check bullet collisions with enemy snakes
-        if hasattr(self, 'enemy_snakes') and self.enemy_snakes:
-            for bullet in self.bullets:
-                if not bullet.alive:
-                    continue
-                
-                bullet_pos = (bullet.grid_x, bullet.grid_y)
+                            if DEBUG_COMBAT:
+                                print("Boss minion {} destroyed! Respawning in 15 seconds.".format(minion_idx + 1))
+                    break
                 
-                for enemy_snake in self.enemy_snakes:
+                elif kind == 'enemy_snake':
+                    enemy_snake = target
                     if not enemy_snake.alive:
                         continue
                     
-                    # Check if bullet hit anywhere - kill instantly (per user request)
-                    if bullet_pos in enemy_snake.body:
-                        enemy_snake.alive = False
-                        bullet.alive = False
-                        self.sound_manager.play('die')
-                        # Spawn particles on all segments
-                        for segment_x, segment_y in enemy_snake.body:
-                            self.create_particles(segment_x * GRID_SIZE + GRID_SIZE // 2,
-                                                segment_y * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y, 
-                                                None, None, particle_type='white')
+                    # Bullet hit anywhere - kill instantly (per user request)
+                    enemy_snake.alive = False
+                    bullet.alive = False
+                    self.sound_manager.play('die')
+                    # Spawn particles on all segments
+                    self.create_particles_batch(enemy_snake.body, particle_type='white')
+                    if DEBUG_COMBAT:
                         print("Enemy snake destroyed by bullet!")
-                        break
-        
-        # Check bullet collisions with regular enemies (ants, spiders, wasps, scorpions, beetles)
-        for bullet in self.bullets:
-            if not bullet.alive:
-                continue
-            
-            bullet_pos = (bullet.grid_x, bullet.grid_y)
-            
-            for enemy in self.enemies:
-                if not enemy.alive:
-                    continue
-                
-                # Skip enemy walls (they have separate collision below)
-                if enemy.enemy_type == 'enemy_wall':
-                    continue
+                    break
                 
-                # Check if enemy is a regular enemy type
-                if enemy.enemy_type.startswith(('enemy_ant', 'enemy_spider', 'enemy_wasp', 'enemy_scorpion', 'enemy_beetle')):
-                    enemy_pos = (enemy.grid_x, enemy.grid_y)
+                else:
+                    # Regular enemies (ants, spiders, wasps, scorpions, beetles)
+                    enemy = target
+                    if not enemy.alive:
+                        continue
                     
-                    # For scorpions (2x2), check all grid cells they occupy
-                    if enemy.enemy_type.startswith('enemy_scorpion'):
-                        scorpion_cells = [
-                            (enemy.grid_x, enemy.grid_y),
-                            (enemy.grid_x + 1, enemy.grid_y),
-                            (enemy.grid_x, enemy.grid_y + 1),
-                            (enemy.grid_x + 1, enemy.grid_y + 1)
-                        ]
-                        if bullet_pos in scorpion_cells:
-                            # Instant kill
-                            enemy.alive = False
-                            bullet.alive = False
-                            self.sound_manager.play('die')
-                            # Spawn particles at all 4 grid cells
-                            for dx in range(2):
-                                for dy in range(2):
-                                    self.create_particles(
-                                        (enemy.grid_x + dx) * GRID_SIZE + GRID_SIZE // 2,
-                                        (enemy.grid_y + dy) * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y,
-                                        None, None, particle_type='white')
+                    # Instant kill
+                    enemy.alive = False
+                    bullet.alive = False
+                    self.sound_manager.play('die')
+                    # Spawn particles on every cell the enemy covers (all 4 for scorpions)
+                    self.create_particles_batch(enemy.occupied_cells, particle_type='white')
+                    if DEBUG_COMBAT:
+                        if enemy.kind == EnemyKind.SCORPION:
                             print("Scorpion destroyed by bullet!")
-                            break
-                    else:
-                        # Regular 1x1 enemies (ants, spiders, wasps, beetles)
-                        if bullet_pos == enemy_pos:
-                            # Instant kill
-                            enemy.alive = False
-                            bullet.alive = False
-                            self.sound_manager.play('die')
-                            # Spawn white particle
-                            self.create_particles(
-                                enemy.grid_x * GRID_SIZE + GRID_SIZE // 2,
-                                enemy.grid_y * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y,
-                                None, None, particle_type='white')
+                        else:
+                            # Regular 1x1 enemies (ants, spiders, wasps, beetles)
                             print(f"{enemy.enemy_type} destroyed by bullet!")
-                            break
-            
-            if not bullet.alive:
-                break  # Bullet hit something, stop checking
+                    break
+        
+        # Bullets spent in the pass above stay in self.bullets (and are drawn)
+        # until the next frame's update; the remaining passes skip them up front
+        live_bullets = [bullet for bullet in self.bullets if bullet.alive]
         
         # Check bullet collisions with enemy walls (destroyable)
-        for bullet in self.bullets:
-            if not bullet.alive:
-                continue
-            
-            bullet_pos = (bullet.grid_x, bullet.grid_y)
-            
-            for enemy in self.enemies:
-                if not enemy.alive or enemy.enemy_type != 'enemy_wall':
+        # Map each wall cell once so every bullet needs a single lookup
+        enemy_wall_cells = {}
+        for enemy in self.enemies:
+            if enemy.alive and enemy.kind == EnemyKind.WALL:
+                enemy_wall_cells.setdefault((enemy.grid_x, enemy.grid_y), enemy)
+        
+        if enemy_wall_cells and live_bullets:
+            for bullet in live_bullets:
+                bullet_pos = (bullet.grid_x, bullet.grid_y)
+                enemy = enemy_wall_cells.get(bullet_pos)
+                if enemy is None or not enemy.alive:
                     continue
                 
-                enemy_pos = (enemy.grid_x, enemy.grid_y)
-                if bullet_pos == enemy_pos:
-                    # Hit enemy wall!
-                    bullet.alive = False
-                    enemy.health -= 1
-                    self.sound_manager.play('eat_fruit')
-                    
-                    # Create particles at hit location
-                    hit_x = bullet_pos[0] * GRID_SIZE + GRID_SIZE // 2
-                    hit_y = bullet_pos[1] * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y
-                    self.create_particles(hit_x, hit_y, GRAY, 8)
-                    
-                    # Check if wall is destroyed
-                    if enemy.health <= 0:
-                        enemy.alive = False
-                        self.sound_manager.play('coin')
+                # Hit enemy wall!
+                bullet.alive = False
+                enemy.health -= 1
+                self.sound_manager.play('eat_fruit')
+                
+                # Create particles at hit location
+                hit_x, hit_y = grid_to_pixel_center(*bullet_pos)
+                self.create_particles(hit_x, hit_y, GRAY, 8)
+                
+                # Check if wall is destroyed
+                if enemy.health <= 0:
+                    enemy.alive = False
+                    self.sound_manager.play('coin')
+                    if DEBUG_COMBAT:
                         print("Enemy wall destroyed!")
-                    else:
-                        print("Enemy wall hit! Health remaining: {}".format(enemy.health))
-                    break
+                elif DEBUG_COMBAT:
+                    print("Enemy wall hit! Health remaining: {}".format(enemy.health))
         
         # Check bullet collisions with boss
-        if self.boss_active and self.boss_spawned and self.boss_health > 0:
-            for bullet in self.bullets:
-                if not bullet.alive:
+        # The boss doesn't move during this pass, so its hitbox is looked up once
+        boss_hitbox = None
+        if live_bullets and self.boss_active and self.boss_spawned and self.boss_health > 0:
+            boss_hitbox = self.get_boss_hitbox()
+        if boss_hitbox is not None:
+            boss_left, boss_top, boss_right, boss_bottom = boss_hitbox
+            for bullet in live_bullets:
+                if not bullet.alive:  # Stopped by an enemy wall above
                     continue
                 
-                hit_boss = False
                 bullet_pixel_x = bullet.pixel_x
                 bullet_pixel_y = bullet.pixel_y - GAME_OFFSET_Y  # Adjust for HUD offset
                 
-                # Check wormBoss collision (128x128 sprite)
-                if self.boss_data == 'wormBoss':
-                    boss_left = self.boss_position[0]
-                    boss_right = self.boss_position[0] + 128
-                    boss_top = self.boss_position[1]
-                    boss_bottom = self.boss_position[1] + 128
-                    
-                    if (boss_left <= bullet_pixel_x <= boss_right and
-                        boss_top <= bullet_pixel_y <= boss_bottom):
-                        hit_boss = True
-                
-                # Check Frog Boss collision (2x2 grid cells = 64x64 pixels)
-                elif self.boss_data == 'frog':
-                    # Only vulnerable when on ground (not jumping/airborne)
-                    if not self.frog_is_invulnerable and self.frog_state in ['landed', 'falling']:
-                        frog_pixel_x = self.frog_position[0] * GRID_SIZE
-                        frog_pixel_y = self.frog_position[1] * GRID_SIZE
-                        frog_left = frog_pixel_x
-                        frog_right = frog_pixel_x + GRID_SIZE * 2
-                        frog_top = frog_pixel_y
-                        frog_bottom = frog_pixel_y + GRID_SIZE * 2
-                        
-                        if (frog_left <= bullet_pixel_x <= frog_right and
-                            frog_top <= bullet_pixel_y <= frog_bottom):
-                            hit_boss = True
-                
-                if hit_boss:
+                if (boss_left <= bullet_pixel_x <= boss_right and
+                    boss_top <= bullet_pixel_y <= boss_bottom):
                     # Boss hit!
                     bullet.alive = False
                     self.boss_health -= 1
@@ -3821,19 +4144,21 @@ class SnakeGame:
                     # Update attack interval based on health (gets faster as health drops)
                     # Linear interpolation from max interval (at full health) to min interval (at 0 health)
                     health_percent = self.boss_health / self.boss_max_health
-                    self.boss_attack_interval = int(self.boss_attack_interval_min + 
-                                                   (self.boss_attack_interval_max - self.boss_attack_interval_min) * health_percent)
+                    self.boss_attack_interval = int(self.boss_attack_interval_min +
+                                                   self.boss_attack_interval_range * health_percent)
                     
-                    print("Boss hit! Health: {}/{} - Attack interval now: {:.1f}s".format(
-                        self.boss_health, self.boss_max_health, self.boss_attack_interval / 60.0))
+                    if DEBUG_COMBAT:
+                        print("Boss hit! Health: {}/{} - Attack interval now: {:.1f}s".format(
+                            self.boss_health, self.boss_max_health, self.boss_attack_interval / 60.0))
                     
                     # Check if boss should trigger super attack at health threshold
-                    for threshold in self.boss_super_attack_thresholds:
-                        if health_percent <= threshold and threshold not in self.boss_super_attacks_used:
-                            # Trigger super attack!
-                            self.boss_super_attacks_used.add(threshold)
-                            self.spawn_boss_super_attack()
-                            break  # Only one super attack per hit
+                    # Health only drops, so only the next unused threshold can be crossed
+                    # (one super attack per hit; a skipped threshold fires on the next hit)
+                    if (self.boss_super_attacks_used < len(self.boss_super_attack_thresholds) and
+                            health_percent <= self.boss_super_attack_thresholds[self.boss_super_attacks_used]):
+                        # Trigger super attack!
+                        self.boss_super_attacks_used += 1
+                        self.spawn_boss_super_attack()
                     
                     # Check if boss is defeated
                     if self.boss_health <= 0 and not self.boss_defeated:
@@ -3844,7 +4169,7 @@ class SnakeGame:
                         # Start death animation phase 1
                         self.boss_death_phase = 1
                         # Try to use death animation, fallback to idle if not available
-                        if 'wormBossDeath1' in self.boss_animations and self.boss_animations['wormBossDeath1']:
+                        if self.boss_has_death1_anim:
                             self.boss_current_animation = 'wormBossDeath1'
                             self.boss_animation_loop = False  # Play once
                         else:
@@ -3860,28 +4185,17 @@ class SnakeGame:
                         pygame.mixer.music.fadeout(2000)  # 2000ms = 2 seconds
                         self.music_manager.silent_mode = True  # Prevent auto-play during death sequence
                         # Kill all boss minions
-                        if hasattr(self, 'boss_minions') and self.boss_minions:
+                        if self.boss_minions:
                             for minion in self.boss_minions:
                                 if minion.alive:
                                     minion.alive = False
                                     # Create death particles for each minion
-                                    for segment_x, segment_y in minion.body:
-                                        self.create_particles(segment_x * GRID_SIZE + GRID_SIZE // 2,
-                                                            segment_y * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y,
-                                                            None, None, particle_type='white')
+                                    self.create_particles_batch(minion.body, particle_type='white')
                             # Clear respawn timers
                             self.boss_minion_respawn_timers.clear()
                             print("All boss minions eliminated!")
                         # Destroy all enemy walls immediately
-                        if hasattr(self, 'enemies') and self.enemies:
-                            for enemy in self.enemies:
-                                if enemy.alive and enemy.enemy_type == 'enemy_wall':
-                                    enemy.alive = False
-                                    # Create particles where wall was
-                                    self.create_particles(enemy.grid_x * GRID_SIZE + GRID_SIZE // 2,
-                                                        enemy.grid_y * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y,
-                                                        GRAY, 12)
-                            print("All enemy walls destroyed!")
+                        self.destroy_enemy_walls()
                     
                     break
         
@@ -3890,45 +4204,50 @@ class SnakeGame:
             if self.bonus_food_timer == 0:
                 self.bonus_food_pos = None
         
-        # Update respawn eggs in multiplayer
-        if self.is_multiplayer and self.state == GameState.PLAYING:
-            for player_id in list(self.respawning_players.keys()):
+        # Update respawn eggs in multiplayer (skipped outright in the usual no-egg case)
+        if self.is_multiplayer and self.state == GameState.PLAYING and self.respawning_players:
+            # Iterate a snapshot: respawn_player() removes the hatched player's entry
+            for player_id in list(self.respawning_players):
                 egg_data = self.respawning_players[player_id]
-                egg_data['timer'] -= 1
+                egg_data.timer -= 1
                 
                 # Find the snake for this player
                 snake = next((s for s in self.snakes if s.player_id == player_id), None)
                 
                 # CPU players hatch immediately with smart direction
-                if snake and snake.is_cpu and egg_data['direction'] is None:
-                    egg_data['direction'] = self.get_safe_cpu_direction(egg_data['pos'])
-                    self.respawn_player(player_id, egg_data['pos'], egg_data['direction'])
+                if snake and snake.is_cpu and egg_data.direction is None:
+                    egg_data.direction = self.get_safe_cpu_direction(egg_data.pos)
+                    self.respawn_player(player_id, egg_data.pos, egg_data.direction)
                     continue
                 
                 # Auto-hatch human players when timer expires (reaches 0)
-                if egg_data['timer'] <= 0 and egg_data['direction'] is None:
+                if egg_data.timer <= 0 and egg_data.direction is None:
                     # Choose a safe direction for auto-hatch
-                    safe_direction = self.get_safe_cpu_direction(egg_data['pos'])
-                    self.respawn_player(player_id, egg_data['pos'], safe_direction)
-                    print(f"Auto-hatched player {player_id} with direction {safe_direction.name}")  # DEBUG
+                    safe_direction = self.get_safe_cpu_direction(egg_data.pos)
+                    self.respawn_player(player_id, egg_data.pos, safe_direction)
+                    if DEBUG_NETWORK:
+                        print(f"Auto-hatched player {player_id} with direction {safe_direction.name}")
                     continue
                 
                 # Auto-hatch in boss mode
                 if self.state == GameState.EGG_HATCHING:
-                    if hasattr(self, 'boss_active') and self.boss_active:
+                    if self.boss_active:
                         self.hatch_egg(Direction.RIGHT)
                     else:
                         # Immediately hatch with random direction after 1 second
-                        self.egg_timer = getattr(self, 'egg_timer', 0) + 1
+                        self.egg_timer = self.egg_timer + 1
                         if self.egg_timer > 60:  # 1 second
                             # Auto-hatch with a random direction
-                            direction = random.choice([Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT])
+                            direction = random.choice(CARDINAL_DIRECTIONS)
                             self.hatch_egg(direction)    
-                            self.respawn_player(player_id, egg_data['pos'], egg_data['direction'])
+                            self.respawn_player(player_id, egg_data.pos, egg_data.direction)
         
         self.move_timer += 1
         
         if self.is_multiplayer:
+            # Enemy wall cells, collected on first use and shared by every snake this frame
+            enemy_wall_cells = None
+            
             # In multiplayer, each snake moves at its own pace based on speed_modifier
             for snake in self.snakes:
                 if not snake.alive:
@@ -3956,31 +4275,26 @@ class SnakeGame:
                     # Check wall and self-collision
                     # In adventure mode, check for level walls only; otherwise check boundaries
                     hit_wall = False
+                    head = snake.body[0]
                     if self.game_mode == "adventure":
-                        head = snake.body[0]
-                        if head in self.level_walls:
+                        if enemy_wall_cells is None:
+                            enemy_wall_cells = {(enemy.grid_x, enemy.grid_y) for enemy in self.enemies
+                                                if enemy.alive and enemy.kind == EnemyKind.WALL}
+                        # Check level walls and enemy walls (destroyable walls from boss super attack)
+                        if head in self.level_walls or head in enemy_wall_cells:
                             hit_wall = True
-                        # Check enemy walls (destroyable walls from boss super attack)
-                        if hasattr(self, 'enemies') and self.enemies:
-                            for enemy in self.enemies:
-                                if enemy.alive and enemy.enemy_type == 'enemy_wall':
-                                    if head == (enemy.grid_x, enemy.grid_y):
-                                        hit_wall = True
-                                        break
                         # Check self-collision
-                        if snake.body[0] in snake.body[1:]:
+                        if snake.tail_contains(head):
                             hit_wall = True
                     else:
                         # Multiplayer mode - check walls and self-collision
-                        head = snake.body[0]
-                        
                         # Check multiplayer level walls
-                        if hasattr(self, 'walls') and self.walls:
+                        if self.walls:
                             if head in self.walls:
                                 hit_wall = True
                         
                         # Check self-collision
-                        if snake.body[0] in snake.body[1:]:
+                        if snake.tail_contains(head):
                             hit_wall = True
                         
                         # Wrap around screen edges (no death from edges)
@@ -3993,7 +4307,7 @@ class SnakeGame:
                     # Check collision with other snakes' bodies
                     for other_snake in self.snakes:
                         if other_snake.player_id != snake.player_id and other_snake.alive:
-                            if snake.body[0] in other_snake.body:
+                            if head in other_snake.get_body_cells():
                                 self.handle_player_death(snake)
                                 break
         else:
@@ -4015,7 +4329,7 @@ class SnakeGame:
                 hit_wall = False
                 
                 # Check if player entered the boss zone (lower right quadrant - wormBoss only)
-                if hasattr(self, 'boss_active') and self.boss_active and self.boss_spawned and self.boss_data == 'wormBoss':
+                if self.boss_active and self.boss_spawned and self.boss_data == 'wormBoss':
                     head_x, head_y = head
                     # Lower right quadrant: x >= 8 and y >= 8
                     if head_x >= 8 and head_y >= 8:
@@ -4023,9 +4337,10 @@ class SnakeGame:
                         print("Player entered boss zone and was crushed!")
                 
                 # Check collision with boss minions (player head hitting any part of minion)
+                # Each minion keeps its cell counts current as it moves, so this is a hash hit per minion
                 if self.boss_minions:
                     for minion in self.boss_minions:
-                        if minion.alive and head in minion.body:
+                        if minion.alive and head in minion.get_body_cells():
                             hit_wall = True
                             print("Player collided with boss minion!")
                             break
@@ -4035,43 +4350,20 @@ class SnakeGame:
                     if head in self.level_walls:
                         hit_wall = True
                     # Only check self-collision, not boundary walls
-                    if self.snake.body[0] in self.snake.body[1:]:
+                    if self.snake.tail_contains(head):
                         hit_wall = True
                 else:
                     # In endless mode, wrap around screen edges (no death from edges)
                     hit_wall = self.snake.check_collision(wrap_around=True)
                 
                 if hit_wall:
-                    self.sound_manager.play('die')
-                    self.lives -= 1
-                    
-                    # Spawn white particles on all body segments including head
-                    for segment_x, segment_y in self.snake.body:
-                        self.create_particles(segment_x * GRID_SIZE + GRID_SIZE // 2,
-                                            segment_y * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y, 
-                                            None, None, particle_type='white')
-                    
-                    if self.lives < 0:
-                        self.sound_manager.play('no_lives')
-                        self.music_manager.play_game_over_music()
-                        self.state = GameState.GAME_OVER
-                        self.game_over_timer = self.game_over_delay
-                    else:
-                        # In adventure mode, wait before going to egg hatching to clear visuals
-                        if self.game_mode == "adventure":
-                            self.respawn_timer = self.respawn_delay
-                            # Clear the snake body immediately
-                            self.snake.body = []
-                        else:
-                            # Go to egg hatching state for respawn
-                            self.state = GameState.EGG_HATCHING
-                            # Mark this as a respawn for boss battles
-                            if hasattr(self, 'boss_active') and self.boss_active:
-                                self.boss_egg_is_respawn = True
-                                self.egg_timer = 0
+                    self.handle_snake_death()
                 
                 # Update enemies in adventure mode
-                if self.game_mode == "adventure" and hasattr(self, 'enemies'):
+                if self.game_mode == "adventure" and self.enemies:
+                    # Drop enemies killed since the last frame once here, so the
+                    # spawn, bullet and draw passes only walk live ones
+                    self.enemies = [enemy for enemy in self.enemies if enemy.alive]
                     for enemy in self.enemies:
                         if enemy.alive:
                             # Skip collision check if snake body is empty (during respawn delay)
@@ -4082,23 +4374,22 @@ class SnakeGame:
                                 enemy.update([], self.level_walls, self.food_items)
                             
                             # Update enemy animation
-                            if enemy.enemy_type.startswith('enemy_ant') and self.ant_frames:
+                            if enemy.kind == EnemyKind.ANT and self.ant_frames:
                                 # Ants only animate when moving
                                 enemy.update_animation(len(self.ant_frames), self.ant_animation_speed)
-                            elif enemy.enemy_type.startswith('enemy_spider') and self.spider_frames:
+                            elif enemy.kind == EnemyKind.SPIDER and self.spider_frames:
                                 # Spiders only animate when moving
                                 enemy.update_animation(len(self.spider_frames), self.spider_animation_speed)
-                            elif enemy.enemy_type.startswith('enemy_scorpion') and self.scorpion_frames:
+                            elif enemy.kind == EnemyKind.SCORPION and self.scorpion_frames:
                                 # Scorpions only animate when moving
                                 enemy.update_animation(len(self.scorpion_frames), self.scorpion_animation_speed)
-                            elif enemy.enemy_type.startswith('enemy_wasp') and self.wasp_frames:
+                            elif enemy.kind == EnemyKind.WASP and self.wasp_frames:
                                 # Wasps animate freely every frame (rapid wing flapping)
                                 enemy.animation_frame = (enemy.animation_frame + 1) % len(self.wasp_frames)
                             
                             # Check if scorpion should fire stinger (when attack_charge_time hits 15, halfway through attack)
-                            if enemy.enemy_type.startswith('enemy_scorpion') and enemy.is_attacking and enemy.attack_charge_time == 15:
+                            if enemy.kind == EnemyKind.SCORPION and enemy.is_attacking and enemy.attack_charge_time == 15:
                                 # Spawn stinger projectile from scorpion's center
-                                from game_core import ScorpionStinger
                                 stinger = ScorpionStinger(
                                     enemy.grid_x + 1,  # Center of 2x2 scorpion
                                     enemy.grid_y + 1,
@@ -4108,74 +4399,33 @@ class SnakeGame:
                                 self.scorpion_stingers.append(stinger)
                             
                             # Check if beetle should launch larvae (when attack_charge_time hits 30, halfway through attack)
-                            if enemy.enemy_type.startswith('enemy_beetle') and enemy.is_attacking and enemy.attack_charge_time == 30:
+                            if enemy.kind == EnemyKind.BEETLE and enemy.is_attacking and enemy.attack_charge_time == 30:
                                 # Spawn larvae projectiles in 4 cardinal directions
-                                from game_core import BeetleLarvae, Direction
-                                for direction in [Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT]:
-                                    larvae = BeetleLarvae(
-                                        enemy.grid_x,
-                                        enemy.grid_y,
-                                        direction,
-                                        self.beetle_larvae_frames
-                                    )
-                                    self.beetle_larvae.append(larvae)
-                                print("Beetle launched 4 larvae projectiles!")
+                                self.beetle_larvae.extend(
+                                    BeetleLarvae(enemy.grid_x, enemy.grid_y, direction, self.beetle_larvae_frames)
+                                    for direction in CARDINAL_DIRECTIONS
+                                )
+                                if DEBUG_COMBAT:
+                                    print("Beetle launched 4 larvae projectiles!")
                             
                             # Check collision with snake (only if snake has a body)
                             if len(self.snake.body) > 0:
-                                collision_type = enemy.check_collision_with_snake(self.snake.body[0], self.snake.body)
+                                collision_type = enemy.check_collision_with_snake(self.snake.body[0], self.snake.body,
+                                                                                  self.snake.get_body_cells())
                             else:
                                 collision_type = None
                             
                             if collision_type == 'head':
                                 # Snake head hit enemy - snake dies
-                                self.sound_manager.play('die')
-                                self.lives -= 1
-                                
-                                # Spawn white particles on all snake body segments
-                                for segment_x, segment_y in self.snake.body:
-                                    self.create_particles(segment_x * GRID_SIZE + GRID_SIZE // 2,
-                                                        segment_y * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y, 
-                                                        None, None, particle_type='white')
-                                
-                                if self.lives < 0:
-                                    self.sound_manager.play('no_lives')
-                                    self.music_manager.play_game_over_music()
-                                    self.state = GameState.GAME_OVER
-                                    self.game_over_timer = self.game_over_delay
-                                else:
-                                    # In adventure mode, wait before going to egg hatching to clear visuals
-                                    if self.game_mode == "adventure":
-                                        self.respawn_timer = self.respawn_delay
-                                        # Clear the snake body immediately
-                                        self.snake.body = []
-                                    else:
-                                        # Go to egg hatching state for respawn
-                                        self.state = GameState.EGG_HATCHING
-                                        # Mark this as a respawn for boss battles
-                                        if hasattr(self, 'boss_active') and self.boss_active:
-                                            self.boss_egg_is_respawn = True
-                                            self.egg_timer = 0
+                                self.handle_snake_death()
                                 break  # Don't check more enemies this frame
                             
                             elif collision_type == 'body':
                                 # Enemy hit snake body - enemy dies
                                 enemy.alive = False
                                 # Spawn white particles where enemy died
-                                # Scorpions are 2x2, so spawn 4 particles across their body
-                                if enemy.enemy_type.startswith('enemy_scorpion'):
-                                    # Spawn particles at all 4 grid cells the scorpion occupies
-                                    for dx in range(2):
-                                        for dy in range(2):
-                                            self.create_particles(
-                                                (enemy.grid_x + dx) * GRID_SIZE + GRID_SIZE // 2,
-                                                (enemy.grid_y + dy) * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y,
-                                                None, None, particle_type='white')
-                                else:
-                                    # Regular enemies spawn 1 particle
-                                    self.create_particles(enemy.grid_x * GRID_SIZE + GRID_SIZE // 2,
-                                                        enemy.grid_y * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y, 
-                                                        None, None, particle_type='white')
+                                # (scorpions are 2x2, so they spawn 4 particles across their body)
+                                self.create_particles_batch(enemy.occupied_cells, particle_type='white')
         
         # Check Frog Boss collision with player
         # Don't check collision during egg hatching
@@ -4191,89 +4441,37 @@ class SnakeGame:
                     # Only check collision if frog is within valid grid bounds
                     if (0 <= frog_x < GRID_WIDTH - 3 and 0 <= frog_y < GRID_HEIGHT - 3):
                         # Frog occupies 4x4 grid cells (200% size)
-                        frog_cells = []
-                        for dx in range(4):
-                            for dy in range(4):
-                                frog_cells.append((frog_x + dx, frog_y + dy))
+                        frog_cells = self.get_frog_cells()
                         
                         # Check head collision - instant death
-                        if player_head in frog_cells:
+                        if player_head in self.frog_cell_set:
                             # Player dies from touching frog with head
-                            self.sound_manager.play('die')
-                            self.lives -= 1
-                            
-                            # Spawn white particles on all snake body segments
-                            for segment_x, segment_y in self.snake.body:
-                                self.create_particles(segment_x * GRID_SIZE + GRID_SIZE // 2,
-                                                    segment_y * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y, 
-                                                    None, None, particle_type='white')
-                            
-                            if self.lives <= 0:
-                                self.music_manager.play_game_over_music()
-                                self.state = GameState.GAME_OVER
-                                self.game_over_timer = self.game_over_delay
-                            else:
-                                self.state = GameState.EGG_HATCHING
-                                if hasattr(self, 'boss_active') and self.boss_active:
-                                    self.boss_egg_is_respawn = True
-                                    self.egg_timer = 0
-                                    # Generate random egg respawn position
-                                    self.boss_egg_respawn_pos = self.find_random_unoccupied_position()
-                                    print("Generated random egg respawn position: {}".format(self.boss_egg_respawn_pos))
-                            print("Player died from touching Frog Boss!")
+                            self.handle_frog_boss_death('Frog Boss')
                         else:
                             # Check body collision - remove segments from hit point to tail
                             for frog_cell in frog_cells:
-                                if frog_cell in self.snake.body[1:]:
-                                    # Find which body segment was hit
-                                    body_segment_index = self.snake.body.index(frog_cell)
-                                    
+                                # Find which body segment was hit (-1 if none)
+                                body_segment_index = self.snake.tail_index(frog_cell)
+                                if body_segment_index > 0:
                                     # Remove player body segments from hit point to tail
                                     removed_body_count = len(self.snake.body) - body_segment_index
-                                    self.snake.body = self.snake.body[:body_segment_index]
+                                    del self.snake.body[body_segment_index:]
                                     
                                     # Create particles at hit location
-                                    hit_x = frog_cell[0] * GRID_SIZE + GRID_SIZE // 2
-                                    hit_y = frog_cell[1] * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y
+                                    hit_x, hit_y = grid_to_pixel_center(*frog_cell)
                                     self.create_particles(hit_x, hit_y, RED, 10)
                                     self.sound_manager.play('eat_fruit')
                                     
-                                    print("Frog landed on player body! {} body segments lost".format(removed_body_count))
+                                    if DEBUG_COMBAT:
+                                        print("Frog landed on player body! {} body segments lost".format(removed_body_count))
                                     break  # Only process one collision per frame
                 
                 # Check collision with tongue (any segment kills on head contact)
-                if len(self.frog_tongue_segments) > 0:
+                if self.frog_tongue_segments:
                     # Check if any tongue segment is in the same grid cell as player head
-                    tongue_hit = False
-                    for tongue_seg in self.frog_tongue_segments:
-                        tongue_grid = (int(round(tongue_seg[0])), int(round(tongue_seg[1])))
-                        if tongue_grid == player_head:
-                            tongue_hit = True
-                            break
-                    if tongue_hit:
+                    if player_head in self.get_frog_tongue_cells():
                         # Player dies from touching tongue with head
-                        self.sound_manager.play('die')
-                        self.lives -= 1
-                        
-                        # Spawn white particles on all snake body segments
-                        for segment_x, segment_y in self.snake.body:
-                            self.create_particles(segment_x * GRID_SIZE + GRID_SIZE // 2,
-                                                segment_y * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y, 
-                                                None, None, particle_type='white')
-                        
-                        if self.lives <= 0:
-                            self.music_manager.play_game_over_music()
-                            self.state = GameState.GAME_OVER
-                            self.game_over_timer = self.game_over_delay
-                        else:
-                            self.state = GameState.EGG_HATCHING
-                            if hasattr(self, 'boss_active') and self.boss_active:
-                                self.boss_egg_is_respawn = True
-                                self.egg_timer = 0
-                                # Generate random egg respawn position
-                                self.boss_egg_respawn_pos = self.find_random_unoccupied_position()
-                                print("Generated random egg respawn position: {}".format(self.boss_egg_respawn_pos))
-                        print("Player died from touching tongue!")
+                        self.handle_frog_boss_death('tongue')
         
         # Food collection (outside movement block)
         if self.is_multiplayer:
@@ -4282,6 +4480,10 @@ class SnakeGame:
                 if not snake.alive:
                     continue
                 
+                # Most heads aren't on food, skip the scan for those
+                if snake.body[0] not in self.food_by_pos:
+                    continue
+                
                 # Check all food items
                 for i, (food_pos, food_type) in enumerate(self.food_items):
                     if snake.body[0] == food_pos:
@@ -4291,52 +4493,30 @@ class SnakeGame:
                             # Regular worm - grow normally
                             self.sound_manager.play('eat_fruit')
                             snake.grow(1)
-                            self.create_particles(fx * GRID_SIZE + GRID_SIZE // 2,
-                                                fy * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y, RED, 10)
+                            self.create_particles(*grid_to_pixel_center(fx, fy), RED, 10)
                         elif food_type == 'apple':
                             # Apple - speed up
                             self.sound_manager.play('powerup')
                             snake.speed_modifier -= 2  # Faster (lower interval)
                             print("Player {} ate apple, speed_modifier: {}".format(snake.player_id + 1, snake.speed_modifier))
-                            self.create_particles(fx * GRID_SIZE + GRID_SIZE // 2,
-                                                fy * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y, 
+                            self.create_particles(*grid_to_pixel_center(fx, fy),
                                                 None, None, particle_type='rainbow')
                         elif food_type == 'black_apple':
                             # Black apple - slow down
                             self.sound_manager.play('power_down')
                             snake.speed_modifier += 3  # Slower (higher interval)
                             print("Player {} ate black apple, speed_modifier: {}".format(snake.player_id + 1, snake.speed_modifier))
-                            self.create_particles(fx * GRID_SIZE + GRID_SIZE // 2,
-                                                fy * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y, 
+                            self.create_particles(*grid_to_pixel_center(fx, fy),
                                                 None, None, particle_type='white')
                         
                         # Remove eaten food
-                        self.food_items.pop(i)
+                        self.remove_food_item(i)
                         
                         # Spawn replacement food based on item frequency setting
-                        freq = self.lobby_settings['item_frequency']
-                        ran = random.random()
-                        
-                        if freq == 0:  # Low - mostly worms
-                            if ran < 0.75:
-                                self.spawn_food_item('worm')
-                            elif ran < 0.95:
-                                self.spawn_food_item('apple')
-                            # Black apples rare
-                        elif freq == 1:  # Normal
-                            if ran < 0.6:
-                                self.spawn_food_item('worm')
-                            elif ran < 0.85:
-                                self.spawn_food_item('apple')
-                            else:
-                                self.spawn_food_item('black_apple')
-                        else:  # High - more variety
-                            if ran < 0.5:
-                                self.spawn_food_item('worm')
-                            elif ran < 0.8:
-                                self.spawn_food_item('apple')
-                            else:
-                                self.spawn_food_item('black_apple')
+                        thresholds, food_types = FOOD_RESPAWN_ODDS[self.lobby_settings['item_frequency']]
+                        replacement_type = food_types[bisect_right(thresholds, random.random())]
+                        if replacement_type:
+                            self.spawn_food_item(replacement_type)
                         
                         break  # Only eat one food per frame
         else:
@@ -4347,117 +4527,15 @@ class SnakeGame:
                 
                 if self.game_mode == "adventure":
                     # In Adventure mode, check food_items list for worms and bonus fruits
-                    for i, (food_pos, food_type) in enumerate(self.food_items):
-                        if self.snake.body[0] == food_pos:
-                            # Handle different food types
-                            if food_type == 'bonus':
-                                # Bonus fruit gives extra points and special effects
-                                self.sound_manager.play('powerup')
-                                self.snake.grow(self.get_difficulty_length_modifier())
-                                base_points = (47 + len(self.snake.body)) * self.level
-                                self.score += int(base_points * self.get_score_multiplier())
-                                fx, fy = food_pos
-                                self.create_particles(fx * GRID_SIZE + GRID_SIZE // 2,
-                                                    fy * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y, 
-                                                    None, None, particle_type='rainbow')
-                                # Remove bonus fruit from list
-                                self.food_items.pop(i)
-                                self.bonus_fruits_collected += 1
-                                # Bonus fruit doesn't count toward worms_required
-                            elif food_type == 'coin':
-                                # Coin collectible - adds 1 coin to persistent total
-                                self.sound_manager.play('pickupCoin')
-                                self.total_coins += 1
-                                self.save_unlocked_levels()  # Save coins immediately
-                                
-                                # Check for Gold Farmer achievement (1000 coins)
-                                if self.total_coins >= 1000:
-                                    self.unlock_achievement(6)
-                                
-                                fx, fy = food_pos
-                                self.create_particles(fx * GRID_SIZE + GRID_SIZE // 2,
-                                                    fy * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y, 
-                                                    None, None, particle_type='yellow')
-                                # Remove coin from list
-                                self.food_items.pop(i)
-                                # Coins don't grow snake or count toward completion
-                            elif food_type == 'diamond':
-                                # Diamond collectible - adds 10 coins to persistent total
-                                self.sound_manager.play('pickupDiamond')
-                                self.total_coins += 10
-                                self.save_unlocked_levels()  # Save coins immediately
-                                fx, fy = food_pos
-                                self.create_particles(fx * GRID_SIZE + GRID_SIZE // 2,
-                                                    fy * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y, 
-                                                    None, None, particle_type='yellow')
-                                # Remove diamond from list
-                                self.food_items.pop(i)
-                                # Diamonds don't grow snake or count toward completion
-                            elif food_type == 'isotope':
-                                # Isotope collectible - grants shooting ability
-                                self.sound_manager.play('powerup')
-                                self.snake.can_shoot = True
-                                # Grow snake when collecting isotope
-                                if self.game_mode == 'adventure':
-                                    self.snake.grow(5)  # Grant 5 segments in adventure mode
-                                else:
-                                    self.snake.grow(10)  # Grant 10 segments in boss mode
-                                fx, fy = food_pos
-                                self.create_particles(fx * GRID_SIZE + GRID_SIZE // 2,
-                                                    fy * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y, 
-                                                    NEON_PURPLE, 15)
-                                # Remove isotope from list
-                                self.food_items.pop(i)
-                                # Show "Press A to Fire" message for 5 seconds
-                                self.isotope_message_timer = 300  # 5 seconds at 60 FPS
-                                # Isotope doesn't count toward worms collected for level completion
-                            else:
-                                # Regular worm
-                                self.sound_manager.play('eat_fruit')
-                                self.snake.grow(1)
-                                fx, fy = food_pos
-                                self.create_particles(fx * GRID_SIZE + GRID_SIZE // 2,
-                                                    fy * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y, RED, 10)
-                                # Remove worm from list
-                                self.food_items.pop(i)
-                                self.worms_collected += 1
-                                
-                                # In boss battles, respawn worms less frequently (30% chance)
-                                if hasattr(self, 'boss_active') and self.boss_active:
-                                    if random.random() < 0.3:  # 30% chance to spawn worm
-                                        self.spawn_adventure_food()
-                                
-                                # Check if all worms collected (but not in boss mode)
-                                # In boss mode, level only ends when boss is defeated
-                                if self.worms_collected >= self.worms_required and not (hasattr(self, 'boss_active') and self.boss_active):
-                                    self.sound_manager.play('level_up')
-                                    
-                                    # Calculate completion percentage for adventure mode
-                                    # Starting length is 3 segments
-                                    starting_length = 3
-                                    # Include pending growth segments in the final count
-                                    current_segments = len(self.snake.body) + self.snake.grow_pending
-                                    segments_gained = current_segments - starting_length
-                                    
-                                    total_items = self.worms_required + self.total_bonus_fruits
-                                    items_collected = self.worms_collected + self.bonus_fruits_collected
-                                    
-                                    # Completion = (items + segments) / (total_items * 2) * 100
-                                    max_possible = total_items + total_items
-                                    actual_earned = items_collected + segments_gained
-                                    self.completion_percentage = int((actual_earned / max_possible) * 100) if max_possible > 0 else 0
-                                    self.final_segments = current_segments
-                                    
-                                    # Save level score for adventure mode (still track for backwards compatibility)
-                                    self.is_new_level_high_score = self.update_level_score(self.current_adventure_level, self.completion_percentage)
-                                    # Unlock next level
-                                    self.unlock_level(self.current_adventure_level + 1)
-                                    # Play victory jingle
-                                    self.music_manager.play_victory_jingle()
-                                    self.state = GameState.LEVEL_COMPLETE
-                            
-                            food_eaten = True
-                            break
+                    # food_by_pos skips the scan on the usual move onto an empty cell
+                    if self.snake.body[0] in self.food_by_pos:
+                        for i, (food_pos, food_type) in enumerate(self.food_items):
+                            if self.snake.body[0] == food_pos:
+                                self.remove_food_item(i)
+                                # Handle different food types (anything unlisted is a regular worm)
+                                self.food_pickup_handlers.get(food_type, self.eat_worm)(food_pos)
+                                food_eaten = True
+                                break
                 else:
                     # Endless mode - original logic
                     if self.snake.body[0] == self.food_pos:
@@ -4466,8 +4544,7 @@ class SnakeGame:
                         base_points = (7 + len(self.snake.body)) *  self.level
                         self.score += int(base_points * self.get_score_multiplier())
                         fx, fy = self.food_pos
-                        self.create_particles(fx * GRID_SIZE + GRID_SIZE // 2,
-                                            fy * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y, RED, 10)
+                        self.create_particles(*grid_to_pixel_center(fx, fy), RED, 10)
                         self.spawn_food()
                         food_eaten = True
                 
@@ -4478,10 +4555,7 @@ class SnakeGame:
                     if len(self.snake.body) >= max_snake_length:
                         self.sound_manager.play('fullSnake')
                         # Spawn rainbow particles on all body segments including head
-                        for segment_x, segment_y in self.snake.body:
-                            self.create_particles(segment_x * GRID_SIZE + GRID_SIZE // 2,
-                                                segment_y * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y, 
-                                                None, None, particle_type='rainbow')
+                        self.create_particles_batch(self.snake.body, particle_type='rainbow')
                         self.score += int(1000 * self.level * self.get_score_multiplier())
                         self.lives = min(99, self.lives + 10)  # Award 10 extra lives
                         # Reset snake after this incredible achievement
@@ -4508,38 +4582,65 @@ class SnakeGame:
                         self.spawn_bonus_food()
             
             # Bonus food collection
-            if self.bonus_food_pos:
+            bonus_pos = self.bonus_food_pos
+            if bonus_pos:
                 if self.is_multiplayer:
+                    # Only one bonus exists, so the first head on it wins
                     for snake in self.snakes:
-                        if not snake.alive:
-                            continue
-                        if snake.body[0] == self.bonus_food_pos:
+                        if snake.alive and snake.body[0] == bonus_pos:
                             self.sound_manager.play('powerup')
                             snake.grow(self.get_difficulty_length_modifier())
                             base_points = (47 + len(snake.body)) * self.level
                             snake.score += int(base_points * self.get_score_multiplier())
-                            bx, by = self.bonus_food_pos
-                            self.create_particles(bx * GRID_SIZE + GRID_SIZE // 2,
-                                                by * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y, 
+                            self.create_particles(*grid_to_pixel_center(*bonus_pos),
                                                 None, None, particle_type='rainbow')
                             self.bonus_food_pos = None
                             self.bonus_food_timer = 0
                             break
                 else:
-                    if self.snake.body[0] == self.bonus_food_pos:
+                    if self.snake.body[0] == bonus_pos:
                         self.sound_manager.play('powerup')
                         self.snake.grow(self.get_difficulty_length_modifier())
                         base_points = (47 + len(self.snake.body)) * self.level
                         self.score += int(base_points * self.get_score_multiplier())
-                        bx, by = self.bonus_food_pos
-                        self.create_particles(bx * GRID_SIZE + GRID_SIZE // 2,
-                                            by * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y, 
+                        self.create_particles(*grid_to_pixel_center(*bonus_pos),
                                             None, None, particle_type='rainbow')
                         self.bonus_food_pos = None
                         self.bonus_food_timer = 0
                 
                 # Note: Bonus food gives extra points but doesn't count toward level progression
     
+    def get_key_direction(self, keys):
+        """Direction of the first held arrow key (see DIRECTION_KEYS), or None"""
+        # keys[K_UP] would map the keycode to a scancode on every lookup; the wrapper is
+        # a tuple indexed by scancode, so read that tuple directly
+        for scancode, direction in DIRECTION_KEYS:
+            if tuple.__getitem__(keys, scancode):
+                return direction
+        return None
+    
+    def get_stick_direction(self, axis_x, axis_y, dead_zone=0.5):
+        """Direction of an analog stick past dead_zone along its dominant axis, or None"""
+        if axis_x * axis_x > axis_y * axis_y:
+            if axis_x < -dead_zone:
+                return Direction.LEFT
+            if axis_x > dead_zone:
+                return Direction.RIGHT
+        elif axis_y < -dead_zone:
+            return Direction.UP
+        elif axis_y > dead_zone:
+            return Direction.DOWN
+        return None
+    
+    def get_pad_direction(self, joystick, hat_id, has_axes):
+        """Direction from a gamepad's D-pad, falling back to its left stick when the D-pad is centered"""
+        direction = None
+        if hat_id is not None:
+            direction = self.hat_directions.get(hat_id)
+        if direction is None and has_axes:
+            direction = self.get_stick_direction(joystick.get_axis(0), joystick.get_axis(1))
+        return direction
+    
     def handle_input(self):
         # Check for Start + Select combo to quit (gamepad)
         if self.joystick:
@@ -4550,93 +4651,48 @@ class SnakeGame:
                 pygame.quit()
                 exit()
         
-        keys = pygame.key.get_pressed()
+        if self.state in UNPOLLED_STATES:
+            return
+        
+        # Arrow keys decoded once; every branch below reads key_direction
+        key_direction = self.get_key_direction(pygame.key.get_pressed())
         
         if self.state == GameState.EGG_HATCHING:
             # Egg hatching - choose direction
             # Network clients send hatch input to host
             if self.is_network_game and self.network_manager.is_client():
                 if hasattr(self, 'network_player_id'):
-                    new_direction = None
-                    if keys[pygame.K_UP]:
-                        new_direction = Direction.UP
-                    elif keys[pygame.K_DOWN]:
-                        new_direction = Direction.DOWN
-                    elif keys[pygame.K_LEFT]:
-                        new_direction = Direction.LEFT
-                    elif keys[pygame.K_RIGHT]:
-                        new_direction = Direction.RIGHT
+                    new_direction = key_direction
                     
                     if new_direction:
-                        print(f"Client sending hatch input: {new_direction.name}")  # DEBUG
+                        if DEBUG_NETWORK:
+                            print(f"Client sending hatch input: {new_direction.name}")
                         self.send_input_to_host(new_direction)  # Send hatch direction
                 return
             
             # Local game or host: directly hatch
-            if keys[pygame.K_UP]:
-                self.hatch_egg(Direction.UP)
-            elif keys[pygame.K_DOWN]:
-                self.hatch_egg(Direction.DOWN)
-            elif keys[pygame.K_LEFT]:
-                self.hatch_egg(Direction.LEFT)
-            elif keys[pygame.K_RIGHT]:
-                self.hatch_egg(Direction.RIGHT)
+            # (single player can also hatch from the gamepad; multiplayer pads only steer)
+            hatch_direction = key_direction
+            if hatch_direction is None and not self.is_multiplayer and self.joystick:
+                hatch_direction = self.get_pad_direction(self.joystick, self.joystick_hat_id, self.joystick_has_axes)
+            if hatch_direction:
+                self.hatch_egg(hatch_direction)
         elif self.state == GameState.PLAYING:
             # Special handling for network clients - they ALWAYS send inputs to host
             if self.is_network_game and self.network_manager.is_client():
                 # Client: Send input to host instead of controlling locally
                 if hasattr(self, 'network_player_id'):
-                    # Track last sent direction to avoid spamming same input
-                    if not hasattr(self, 'last_sent_direction'):
-                        self.last_sent_direction = None
-                    
-                    new_direction = None
-                    
                     # Check keyboard input
-                    if keys[pygame.K_UP]:
-                        new_direction = Direction.UP
-                    elif keys[pygame.K_DOWN]:
-                        new_direction = Direction.DOWN
-                    elif keys[pygame.K_LEFT]:
-                        new_direction = Direction.LEFT
-                    elif keys[pygame.K_RIGHT]:
-                        new_direction = Direction.RIGHT
+                    new_direction = key_direction
                     
                     # Check gamepad input (D-pad and analog stick)
                     if new_direction is None and self.joystick:
-                        # Check D-pad (hat)
-                        if self.joystick.get_numhats() > 0:
-                            hat = self.joystick.get_hat(0)
-                            if hat[1] == 1:
-                                new_direction = Direction.UP
-                            elif hat[1] == -1:
-                                new_direction = Direction.DOWN
-                            elif hat[0] == -1:
-                                new_direction = Direction.LEFT
-                            elif hat[0] == 1:
-                                new_direction = Direction.RIGHT
-                        
-                        # Check analog stick if no D-pad input
-                        if new_direction is None and self.joystick.get_numaxes() >= 2:
-                            axis_x = self.joystick.get_axis(0)
-                            axis_y = self.joystick.get_axis(1)
-                            dead_zone = 0.5
-                            
-                            if abs(axis_x) > dead_zone or abs(axis_y) > dead_zone:
-                                if abs(axis_x) > abs(axis_y):
-                                    if axis_x < -dead_zone:
-                                        new_direction = Direction.LEFT
-                                    elif axis_x > dead_zone:
-                                        new_direction = Direction.RIGHT
-                                else:
-                                    if axis_y < -dead_zone:
-                                        new_direction = Direction.UP
-                                    elif axis_y > dead_zone:
-                                        new_direction = Direction.DOWN
+                        new_direction = self.get_pad_direction(self.joystick, self.joystick_hat_id, self.joystick_has_axes)
                     
                     # Only send if direction changed
                     if new_direction and new_direction != self.last_sent_direction:
-                        print(f"Client sending input: {new_direction.name}")  # DEBUG
+                        if DEBUG_NETWORK:
+                            print(f"Client sending input: {new_direction.name}")
                         self.send_input_to_host(new_direction)
                         self.last_sent_direction = new_direction
                 return  # Don't process local input for clients
@@ -4649,91 +4705,23 @@ class SnakeGame:
                     # Check if host is respawning
                     if snake.player_id in self.respawning_players:
                         egg_data = self.respawning_players[snake.player_id]
-                        chosen_direction = None
                         
                         # Keyboard
-                        if keys[pygame.K_UP]:
-                            chosen_direction = Direction.UP
-                        elif keys[pygame.K_DOWN]:
-                            chosen_direction = Direction.DOWN
-                        elif keys[pygame.K_LEFT]:
-                            chosen_direction = Direction.LEFT
-                        elif keys[pygame.K_RIGHT]:
-                            chosen_direction = Direction.RIGHT
+                        chosen_direction = key_direction
                         
-                        # Gamepad D-pad
+                        # Gamepad D-pad or analog stick
                         if chosen_direction is None and self.joystick:
-                            if self.joystick.get_numhats() > 0:
-                                hat = self.joystick.get_hat(0)
-                                if hat[1] == 1:
-                                    chosen_direction = Direction.UP
-                                elif hat[1] == -1:
-                                    chosen_direction = Direction.DOWN
-                                elif hat[0] == -1:
-                                    chosen_direction = Direction.LEFT
-                                elif hat[0] == 1:
-                                    chosen_direction = Direction.RIGHT
-                            
-                            # Analog stick
-                            if chosen_direction is None and self.joystick.get_numaxes() >= 2:
-                                axis_x = self.joystick.get_axis(0)
-                                axis_y = self.joystick.get_axis(1)
-                                dead_zone = 0.5
-                                if abs(axis_x) > dead_zone or abs(axis_y) > dead_zone:
-                                    if abs(axis_x) > abs(axis_y):
-                                        if axis_x < -dead_zone:
-                                            chosen_direction = Direction.LEFT
-                                        elif axis_x > dead_zone:
-                                            chosen_direction = Direction.RIGHT
-                                    else:
-                                        if axis_y < -dead_zone:
-                                            chosen_direction = Direction.UP
-                                        elif axis_y > dead_zone:
-                                            chosen_direction = Direction.DOWN
+                            chosen_direction = self.get_pad_direction(self.joystick, self.joystick_hat_id, self.joystick_has_axes)
                         
                         if chosen_direction:
-                            self.respawn_player(snake.player_id, egg_data['pos'], chosen_direction)
+                            self.respawn_player(snake.player_id, egg_data.pos, chosen_direction)
                     elif snake.alive:
                         # Normal movement - check keyboard first
-                        if keys[pygame.K_UP]:
-                            snake.change_direction(Direction.UP)
-                        elif keys[pygame.K_DOWN]:
-                            snake.change_direction(Direction.DOWN)
-                        elif keys[pygame.K_LEFT]:
-                            snake.change_direction(Direction.LEFT)
-                        elif keys[pygame.K_RIGHT]:
-                            snake.change_direction(Direction.RIGHT)
-                        # Gamepad D-pad
+                        if key_direction:
+                            snake.change_direction(key_direction)
+                        # Gamepad D-pad or analog stick
                         elif self.joystick:
-                            chosen_direction = None
-                            if self.joystick.get_numhats() > 0:
-                                hat = self.joystick.get_hat(0)
-                                if hat[1] == 1:
-                                    chosen_direction = Direction.UP
-                                elif hat[1] == -1:
-                                    chosen_direction = Direction.DOWN
-                                elif hat[0] == -1:
-                                    chosen_direction = Direction.LEFT
-                                elif hat[0] == 1:
-                                    chosen_direction = Direction.RIGHT
-                            
-                            # Analog stick
-                            if chosen_direction is None and self.joystick.get_numaxes() >= 2:
-                                axis_x = self.joystick.get_axis(0)
-                                axis_y = self.joystick.get_axis(1)
-                                dead_zone = 0.5
-                                if abs(axis_x) > dead_zone or abs(axis_y) > dead_zone:
-                                    if abs(axis_x) > abs(axis_y):
-                                        if axis_x < -dead_zone:
-                                            chosen_direction = Direction.LEFT
-                                        elif axis_x > dead_zone:
-                                            chosen_direction = Direction.RIGHT
-                                    else:
-                                        if axis_y < -dead_zone:
-                                            chosen_direction = Direction.UP
-                                        elif axis_y > dead_zone:
-                                            chosen_direction = Direction.DOWN
-                            
+                            chosen_direction = self.get_pad_direction(self.joystick, self.joystick_hat_id, self.joystick_has_axes)
                             if chosen_direction:
                                 snake.change_direction(chosen_direction)
                 return  # Host input handled
@@ -4741,348 +4729,792 @@ class SnakeGame:
             if self.is_multiplayer:
                 
                 # Handle input for each player based on their controller
-                for i, snake in enumerate(self.snakes):
+                # (players past the end of controller_inputs have no controller)
+                for snake, controller_input in zip(self.snakes, self.controller_inputs):
+                    controller_type, joystick, hat_id, has_axes = controller_input
+                    
                     # Check if this player is respawning (has an egg)
                     if snake.player_id in self.respawning_players:
                         egg_data = self.respawning_players[snake.player_id]
                         
-                        if i < len(self.player_controllers):
-                            controller_type, controller_index = self.player_controllers[i]
-                            
-                            if controller_type == 'keyboard':
-                                # Handle egg direction selection with keyboard
-                                if keys[pygame.K_UP]:
-                                    egg_data['direction'] = Direction.UP
-                                    self.respawn_player(snake.player_id, egg_data['pos'], egg_data['direction'])
-                                elif keys[pygame.K_DOWN]:
-                                    egg_data['direction'] = Direction.DOWN
-                                    self.respawn_player(snake.player_id, egg_data['pos'], egg_data['direction'])
-                                elif keys[pygame.K_LEFT]:
-                                    egg_data['direction'] = Direction.LEFT
-                                    self.respawn_player(snake.player_id, egg_data['pos'], egg_data['direction'])
-                                elif keys[pygame.K_RIGHT]:
-                                    egg_data['direction'] = Direction.RIGHT
-                                    self.respawn_player(snake.player_id, egg_data['pos'], egg_data['direction'])
+                        if controller_type == 'keyboard':
+                            # Handle egg direction selection with keyboard
+                            if key_direction:
+                                egg_data.direction = key_direction
+                                self.respawn_player(snake.player_id, egg_data.pos, egg_data.direction)
                         continue
                     
                     if not snake.alive:
                         continue
                     
-                    if i < len(self.player_controllers):
-                        controller_type, controller_index = self.player_controllers[i]
+                    if controller_type == 'keyboard':
+                        # Keyboard controls for this player
+                        if key_direction:
+                            snake.change_direction(key_direction)
+                    elif joystick is not None:
+                        # Gamepad controls for this player
+                        chosen_direction = self.get_pad_direction(joystick, hat_id, has_axes)
                         
-                        if controller_type == 'keyboard':
-                            # Keyboard controls for this player
-                            if keys[pygame.K_UP]:
-                                snake.change_direction(Direction.UP)
-                            elif keys[pygame.K_DOWN]:
-                                snake.change_direction(Direction.DOWN)
-                            elif keys[pygame.K_LEFT]:
-                                snake.change_direction(Direction.LEFT)
-                            elif keys[pygame.K_RIGHT]:
-                                snake.change_direction(Direction.RIGHT)
-                        elif controller_type == 'gamepad' and controller_index < len(self.joysticks):
-                            # Gamepad controls for this player
-                            joystick = self.joysticks[controller_index]
-                            chosen_direction = None
-                            
-                            # Check hat (D-pad) if available
-                            if joystick.get_numhats() > 0:
-                                hat = joystick.get_hat(0)
-                                if hat[1] == 1:
-                                    chosen_direction = Direction.UP
-                                elif hat[1] == -1:
-                                    chosen_direction = Direction.DOWN
-                                elif hat[0] == -1:
-                                    chosen_direction = Direction.LEFT
-                                elif hat[0] == 1:
-                                    chosen_direction = Direction.RIGHT
-                            # Otherwise use analog stick
-                            elif joystick.get_numaxes() >= 2:
-                                axis_x = joystick.get_axis(0)
-                                axis_y = joystick.get_axis(1)
-                                dead_zone = 0.5
-                                
-                                if abs(axis_x) > dead_zone or abs(axis_y) > dead_zone:
-                                    if abs(axis_x) > abs(axis_y):
-                                        if axis_x < -dead_zone:
-                                            chosen_direction = Direction.LEFT
-                                        elif axis_x > dead_zone:
-                                            chosen_direction = Direction.RIGHT
-                                    else:
-                                        if axis_y < -dead_zone:
-                                            chosen_direction = Direction.UP
-                                        elif axis_y > dead_zone:
-                                            chosen_direction = Direction.DOWN
-                            
-                            # Apply direction (either for egg or snake)
-                            if chosen_direction:
-                                if snake.player_id in self.respawning_players:
-                                    egg_data = self.respawning_players[snake.player_id]
-                                    egg_data['direction'] = chosen_direction
-                                    self.respawn_player(snake.player_id, egg_data['pos'], chosen_direction)
-                                else:
-                                    snake.change_direction(chosen_direction)
+                        # Apply direction (either for egg or snake)
+                        if chosen_direction:
+                            if snake.player_id in self.respawning_players:
+                                egg_data = self.respawning_players[snake.player_id]
+                                egg_data.direction = chosen_direction
+                                self.respawn_player(snake.player_id, egg_data.pos, chosen_direction)
+                            else:
+                                snake.change_direction(chosen_direction)
             else:
-                # Single player mode - use original controls
-                if keys[pygame.K_UP]:
-                    self.snake.change_direction(Direction.UP)
-                elif keys[pygame.K_DOWN]:
-                    self.snake.change_direction(Direction.DOWN)
-                elif keys[pygame.K_LEFT]:
-                    self.snake.change_direction(Direction.LEFT)
-                elif keys[pygame.K_RIGHT]:
-                    self.snake.change_direction(Direction.RIGHT)
-        
-        # Only poll hat if joystick has one (otherwise rely on JOYHATMOTION events or axes)
-        # But skip this in multiplayer mode - controller mapping is handled above
-        if not self.is_multiplayer and self.joystick and self.joystick_has_hat:
-            hat = self.joystick.get_hat(0)
-            if self.state == GameState.EGG_HATCHING:
-                if hat[1] == 1:
-                    self.hatch_egg(Direction.UP)
-                elif hat[1] == -1:
-                    self.hatch_egg(Direction.DOWN)
-                elif hat[0] == -1:
-                    self.hatch_egg(Direction.LEFT)
-                elif hat[0] == 1:
-                    self.hatch_egg(Direction.RIGHT)
-            elif self.state == GameState.PLAYING:
-                if hat[1] == 1:
-                    self.snake.change_direction(Direction.UP)
-                elif hat[1] == -1:
-                    self.snake.change_direction(Direction.DOWN)
-                elif hat[0] == -1:
-                    self.snake.change_direction(Direction.LEFT)
-                elif hat[0] == 1:
-                    self.snake.change_direction(Direction.RIGHT)
-        
-        # For joysticks without hats, use axes (analog stick)
-        # Skip gameplay states in multiplayer mode - controller mapping is handled above
-        # But allow menu navigation in lobby states even during multiplayer
-        elif self.joystick and not self.joystick_has_hat:
-            if self.joystick.get_numaxes() >= 2:
+                # Single player mode - keyboard first, then the gamepad
+                direction = key_direction
+                if direction is None and self.joystick:
+                    direction = self.get_pad_direction(self.joystick, self.joystick_hat_id, self.joystick_has_axes)
+                if direction:
+                    self.snake.change_direction(direction)
+        
+        # For joysticks without hats, use axes (analog stick) for menu navigation
+        # (gameplay steering is handled above; hat menus use JOYHATMOTION events)
+        if self.joystick and not self.joystick_has_hat:
+            if self.joystick_has_axes:
                 axis_x = self.joystick.get_axis(0)
                 axis_y = self.joystick.get_axis(1)
                 
-                # Use a threshold to avoid drift
+                # Use a threshold to avoid drift. Magnitudes are compared squared
+                # so this per-frame block makes no abs() calls.
                 threshold = 0.5
+                threshold_sq = threshold * threshold
+                axis_x_sq = axis_x * axis_x
+                axis_y_sq = axis_y * axis_y
                 
                 # Check if axis is in neutral position
-                is_neutral = abs(axis_x) < threshold and abs(axis_y) < threshold
-                
-                # Skip gameplay states in multiplayer - they have their own controller handling
-                if not self.is_multiplayer and self.state == GameState.EGG_HATCHING:
-                    # Prioritize the axis with larger absolute value
-                    if abs(axis_y) > abs(axis_x) and abs(axis_y) > threshold:
-                        if axis_y < -threshold:
-                            self.hatch_egg(Direction.UP)
-                        elif axis_y > threshold:
-                            self.hatch_egg(Direction.DOWN)
-                    elif abs(axis_x) > threshold:
-                        if axis_x < -threshold:
-                            self.hatch_egg(Direction.LEFT)
-                        elif axis_x > threshold:
-                            self.hatch_egg(Direction.RIGHT)
-                elif not self.is_multiplayer and self.state == GameState.PLAYING:
-                    # Prioritize the axis with larger absolute value
-                    if abs(axis_y) > abs(axis_x) and abs(axis_y) > threshold:
-                        if axis_y < -threshold:
-                            self.snake.change_direction(Direction.UP)
-                        elif axis_y > threshold:
-                            self.snake.change_direction(Direction.DOWN)
-                    elif abs(axis_x) > threshold:
-                        if axis_x < -threshold:
-                            self.snake.change_direction(Direction.LEFT)
-                        elif axis_x > threshold:
-                            self.snake.change_direction(Direction.RIGHT)
+                is_neutral = axis_x_sq < threshold_sq and axis_y_sq < threshold_sq
+                was_neutral = self.axis_was_neutral
                 
                 # Handle menu navigation with debouncing
-                elif self.state == GameState.MENU:
-                    if self.axis_was_neutral and abs(axis_y) > threshold:
-                        if axis_y < -threshold:
-                            self.menu_selection = (self.menu_selection - 1) % len(self.menu_options)
-                            self.sound_manager.play('blip_select')
-                            self.axis_was_neutral = False
-                        elif axis_y > threshold:
-                            self.menu_selection = (self.menu_selection + 1) % len(self.menu_options)
-                            self.sound_manager.play('blip_select')
-                            self.axis_was_neutral = False
-                
-                elif self.state == GameState.SINGLE_PLAYER_MENU:
-                    if self.axis_was_neutral and abs(axis_y) > threshold:
-                        if axis_y < -threshold:
-                            self.single_player_selection = (self.single_player_selection - 1) % len(self.single_player_options)
-                            self.sound_manager.play('blip_select')
-                            self.axis_was_neutral = False
-                        elif axis_y > threshold:
-                            self.single_player_selection = (self.single_player_selection + 1) % len(self.single_player_options)
-                            self.sound_manager.play('blip_select')
-                            self.axis_was_neutral = False
-                
-                elif self.state == GameState.MULTIPLAYER_MENU:
-                    if self.axis_was_neutral and abs(axis_y) > threshold:
-                        if axis_y < -threshold:
-                            self.multiplayer_menu_selection = (self.multiplayer_menu_selection - 1) % len(self.multiplayer_menu_options)
-                            self.sound_manager.play('blip_select')
-                            self.axis_was_neutral = False
-                        elif axis_y > threshold:
-                            self.multiplayer_menu_selection = (self.multiplayer_menu_selection + 1) % len(self.multiplayer_menu_options)
-                            self.sound_manager.play('blip_select')
-                            self.axis_was_neutral = False
-                
-                elif self.state == GameState.NETWORK_MENU:
-                    if self.axis_was_neutral and abs(axis_y) > threshold:
-                        if axis_y < -threshold:
-                            self.network_menu_selection = (self.network_menu_selection - 1) % len(self.network_menu_options)
-                            self.sound_manager.play('blip_select')
-                            self.axis_was_neutral = False
-                        elif axis_y > threshold:
-                            self.network_menu_selection = (self.network_menu_selection + 1) % len(self.network_menu_options)
-                            self.sound_manager.play('blip_select')
-                            self.axis_was_neutral = False
-                
-                elif self.state == GameState.MULTIPLAYER_LOBBY:
+                state = self.state
+                if state in self.axis_list_menus:
+                    if self.axis_was_neutral and axis_y_sq > threshold_sq:
+                        selection_attr, options_attr = self.axis_list_menus[self.state]
+                        step = -1 if axis_y < -threshold else 1
+                        self.step_selection(selection_attr, len(getattr(self, options_attr)), step)
+                        self.axis_was_neutral = False
+                
+                elif state == GameState.MULTIPLAYER_LOBBY:
                     # Only host can navigate and change settings in network games
                     can_change = not self.is_network_game or self.network_manager.is_host()
                     if can_change and self.axis_was_neutral:
-                        if abs(axis_y) > threshold:
+                        if axis_y_sq > threshold_sq:
                             if axis_y < -threshold:
-                                self.lobby_selection = (self.lobby_selection - 1) % 8  # 4 settings + 4 players
-                                self.sound_manager.play('blip_select')
+                                self.step_selection('lobby_selection', 8, -1)  # 4 settings + 4 players
                                 self.axis_was_neutral = False
                             elif axis_y > threshold:
-                                self.lobby_selection = (self.lobby_selection + 1) % 8
-                                self.sound_manager.play('blip_select')
+                                self.step_selection('lobby_selection', 8, 1)
                                 self.axis_was_neutral = False
-                        elif abs(axis_x) > threshold:
+                        elif axis_x_sq > threshold_sq:
                             # Left/right to change settings
                             direction = 1 if axis_x > threshold else -1
                             self.change_lobby_setting(self.lobby_selection, direction)
                             self.axis_was_neutral = False
                 
-                elif self.state == GameState.NETWORK_CLIENT_LOBBY:
+                elif state == GameState.NETWORK_CLIENT_LOBBY:
                     # Analog stick for server list navigation
-                    if self.axis_was_neutral and abs(axis_y) > threshold:
+                    if self.axis_was_neutral and axis_y_sq > threshold_sq:
                         if axis_y < -threshold:
                             # Up - navigate up in server list
                             if len(self.discovered_servers) > 0 and self.server_selection > 0:
                                 self.server_selection -= 1
-                                self.sound_manager.play('blip_select')
+                                self.play_blip()
                                 self.axis_was_neutral = False
                         elif axis_y > threshold:
                             # Down - navigate down in server list
                             if len(self.discovered_servers) > 0 and self.server_selection < len(self.discovered_servers) - 1:
                                 self.server_selection += 1
-                                self.sound_manager.play('blip_select')
+                                self.play_blip()
                                 self.axis_was_neutral = False
                 
-                elif self.state == GameState.EXTRAS_MENU:
-                    if self.axis_was_neutral and abs(axis_y) > threshold:
-                        if axis_y < -threshold:
-                            self.extras_menu_selection = (self.extras_menu_selection - 1) % len(self.extras_menu_options)
-                            self.sound_manager.play('blip_select')
-                            self.axis_was_neutral = False
-                        elif axis_y > threshold:
-                            self.extras_menu_selection = (self.extras_menu_selection + 1) % len(self.extras_menu_options)
-                            self.sound_manager.play('blip_select')
+                elif state == GameState.ACHIEVEMENTS:
+                    # Only count the list on frames where the stick actually steps it
+                    if self.axis_was_neutral and axis_y_sq > threshold_sq:
+                        achievement_count = len(self.get_achievement_list())
+                        if achievement_count:
+                            self.step_selection('achievement_selection', achievement_count, 1 if axis_y > 0 else -1)
                             self.axis_was_neutral = False
                 
-                elif self.state == GameState.ACHIEVEMENTS:
-                    achievements = self.get_achievement_list()
-                    if self.axis_was_neutral and abs(axis_y) > threshold and achievements:
-                        if axis_y < -threshold:
-                            self.achievement_selection = (self.achievement_selection - 1) % len(achievements)
-                            self.sound_manager.play('blip_select')
+                elif state == GameState.ADVENTURE_LEVEL_SELECT:
+                    if self.axis_was_neutral:
+                        # Grid navigation (LEVEL_SELECT_COLUMNS per row), horizontal first
+                        if axis_x_sq > threshold_sq:
+                            self.move_level_selection(1 if axis_x > 0 else -1)
                             self.axis_was_neutral = False
-                        elif axis_y > threshold:
-                            self.achievement_selection = (self.achievement_selection + 1) % len(achievements)
-                            self.sound_manager.play('blip_select')
+                        elif axis_y_sq > threshold_sq:
+                            self.move_level_selection(LEVEL_SELECT_COLUMNS if axis_y > 0 else -LEVEL_SELECT_COLUMNS)
                             self.axis_was_neutral = False
                 
-                elif self.state == GameState.MUSIC_PLAYER:
-                    if self.axis_was_neutral and abs(axis_y) > threshold:
+                elif state == GameState.DIFFICULTY_SELECT:
+                    if self.axis_was_neutral and axis_y_sq > threshold_sq:
                         if axis_y < -threshold:
-                            self.music_player_selection = (self.music_player_selection - 1) % len(self.music_player_tracks)
-                            self.sound_manager.play('blip_select')
+                            self.step_selection('difficulty_selection', 3, -1)
                             self.axis_was_neutral = False
                         elif axis_y > threshold:
-                            self.music_player_selection = (self.music_player_selection + 1) % len(self.music_player_tracks)
-                            self.sound_manager.play('blip_select')
+                            self.step_selection('difficulty_selection', 3, 1)
                             self.axis_was_neutral = False
                 
-                elif self.state == GameState.ADVENTURE_LEVEL_SELECT:
-                    if self.axis_was_neutral:
-                        # Grid navigation (8 columns)
-                        cols = 8
-                        if abs(axis_x) > threshold:
-                            if axis_x < -threshold:
-                                self.adventure_level_selection = max(0, self.adventure_level_selection - 1)
-                                self.sound_manager.play('blip_select')
-                                self.axis_was_neutral = False
-                            elif axis_x > threshold:
-                                self.adventure_level_selection = min(self.total_levels - 1, self.adventure_level_selection + 1)
-                                self.sound_manager.play('blip_select')
-                                self.axis_was_neutral = False
-                        elif abs(axis_y) > threshold:
-                            if axis_y < -threshold:
-                                self.adventure_level_selection = max(0, self.adventure_level_selection - cols)
-                                self.sound_manager.play('blip_select')
-                                self.axis_was_neutral = False
-                            elif axis_y > threshold:
-                                self.adventure_level_selection = min(self.total_levels - 1, self.adventure_level_selection + cols)
-                                self.sound_manager.play('blip_select')
-                                self.axis_was_neutral = False
-                
-                elif self.state == GameState.DIFFICULTY_SELECT:
-                    if self.axis_was_neutral and abs(axis_y) > threshold:
-                        if axis_y < -threshold:
-                            self.difficulty_selection = (self.difficulty_selection - 1) % 3
-                            self.sound_manager.play('blip_select')
-                            self.axis_was_neutral = False
-                        elif axis_y > threshold:
-                            self.difficulty_selection = (self.difficulty_selection + 1) % 3
-                            self.sound_manager.play('blip_select')
-                            self.axis_was_neutral = False
-                
-                elif self.state == GameState.MULTIPLAYER_LEVEL_SELECT:
-                    levels_unlocked = self.get_multiplayer_levels_unlocked()
-                    max_level = min(levels_unlocked, len(self.multiplayer_levels))
-                    if max_level > 0 and self.axis_was_neutral and abs(axis_y) > threshold:
-                        if axis_y < -threshold:
-                            self.multiplayer_level_selection = (self.multiplayer_level_selection - 1) % max_level
-                            self.sound_manager.play('blip_select')
-                            self.axis_was_neutral = False
-                        elif axis_y > threshold:
-                            self.multiplayer_level_selection = (self.multiplayer_level_selection + 1) % max_level
-                            self.sound_manager.play('blip_select')
+                elif state == GameState.MULTIPLAYER_LEVEL_SELECT:
+                    # Only look up the unlocked count on frames where the stick actually steps it
+                    if self.axis_was_neutral and axis_y_sq > threshold_sq:
+                        max_level = min(self.get_multiplayer_levels_unlocked(), len(self.multiplayer_levels))
+                        if max_level > 0:
+                            self.step_selection('multiplayer_level_selection', max_level, 1 if axis_y > 0 else -1)
                             self.axis_was_neutral = False
                 
-                elif self.state == GameState.HIGH_SCORE_ENTRY:
+                elif state == GameState.HIGH_SCORE_ENTRY:
                     if self.axis_was_neutral:
-                        if abs(axis_x) > threshold:
+                        if axis_x_sq > threshold_sq:
                             if axis_x < -threshold:
                                 self.keyboard_selection[1] = max(0, self.keyboard_selection[1] - 1)
-                                self.sound_manager.play('blip_select')
+                                self.play_blip()
                                 self.axis_was_neutral = False
                             elif axis_x > threshold:
                                 self.keyboard_selection[1] = min(9, self.keyboard_selection[1] + 1)
-                                self.sound_manager.play('blip_select')
+                                self.play_blip()
                                 self.axis_was_neutral = False
-                        elif abs(axis_y) > threshold:
+                        elif axis_y_sq > threshold_sq:
                             if axis_y < -threshold:
                                 self.keyboard_selection[0] = max(0, self.keyboard_selection[0] - 1)
-                                self.sound_manager.play('blip_select')
+                                self.play_blip()
                                 self.axis_was_neutral = False
                             elif axis_y > threshold:
                                 self.keyboard_selection[0] = min(3, self.keyboard_selection[0] + 1)
-                                self.sound_manager.play('blip_select')
+                                self.play_blip()
                                 self.axis_was_neutral = False
                 
-                # Reset neutral flag when axis returns to center
-                if is_neutral:
+                # Reset neutral flag when axis returns to center, once the debounce
+                # time since the last menu step has passed
+                now = pygame.time.get_ticks()
+                if was_neutral and not self.axis_was_neutral:
+                    self.last_axis_nav_time = now
+                elif is_neutral and now - self.last_axis_nav_time >= AXIS_NAV_DEBOUNCE_MS:
                     self.axis_was_neutral = True
     
+    def play_blip(self):
+        """Request the menu blip; run() plays it once per frame however many times it's asked for"""
+        self.blip_pending = True
+    
+    def go_back(self):
+        """Leave the current screen for its BACK_STATES parent, running its back hook first"""
+        self.play_blip()
+        back_hook = self.back_hooks.get(self.state)
+        if back_hook:
+            back_hook()
+        self.state = BACK_STATES[self.state]
+    
+    def resume_theme_music(self):
+        """Start the menu theme unless it's already playing"""
+        if not self.music_manager.theme_mode:
+            self.music_manager.play_theme()
+    
+    def leave_music_player(self):
+        """Stop the music player and resume the theme"""
+        self.music_player_stop()
+        self.music_manager.play_theme()
+    
+    def cancel_hosting(self):
+        """Shut down the host lobby's server"""
+        self.network_manager.cleanup()
+        self.is_multiplayer = False
+        self.is_network_game = False
+    
+    def step_selection(self, selection_attr, count, step):
+        """Move a wrap-around menu selection one entry up (step -1) or down (step 1) and play the blip"""
+        selection = getattr(self, selection_attr)
+        # Compare-and-wrap instead of modulo; an out-of-range selection snaps back to an end
+        if step > 0:
+            selection = selection + 1 if selection < count - 1 else 0
+        else:
+            selection = selection - 1 if 0 < selection < count else count - 1
+        setattr(self, selection_attr, selection)
+        self.play_blip()
+
+    def handle_menu_keydown(self, event):
+        if event.key == pygame.K_UP:
+            self.step_selection('menu_selection', len(self.menu_options), -1)
+        elif event.key == pygame.K_DOWN:
+            self.step_selection('menu_selection', len(self.menu_options), 1)
+        elif event.key == pygame.K_RETURN:
+            self.select_menu_option()
+
+    def handle_single_player_menu_keydown(self, event):
+        if event.key == pygame.K_UP:
+            self.step_selection('single_player_selection', len(self.single_player_options), -1)
+        elif event.key == pygame.K_DOWN:
+            self.step_selection('single_player_selection', len(self.single_player_options), 1)
+        elif event.key == pygame.K_RETURN:
+            self.select_single_player_option()
+
+    def handle_extras_menu_keydown(self, event):
+        if event.key == pygame.K_UP:
+            self.step_selection('extras_menu_selection', len(self.extras_menu_options), -1)
+        elif event.key == pygame.K_DOWN:
+            self.step_selection('extras_menu_selection', len(self.extras_menu_options), 1)
+        elif event.key == pygame.K_RETURN:
+            self.select_extras_option()
+
+    def move_level_selection(self, step):
+        """Move the adventure level grid selection by step, clamped to the level range"""
+        self.adventure_level_selection = max(0, min(self.total_levels - 1, self.adventure_level_selection + step))
+        self.play_blip()
+    
+    def handle_adventure_level_select_keydown(self, event):
+        key = event.key
+        if key == pygame.K_LEFT:
+            self.move_level_selection(-1)
+        elif key == pygame.K_RIGHT:
+            self.move_level_selection(1)
+        elif key == pygame.K_UP:
+            self.move_level_selection(-LEVEL_SELECT_COLUMNS)
+        elif key == pygame.K_DOWN:
+            self.move_level_selection(LEVEL_SELECT_COLUMNS)
+        elif key == pygame.K_RETURN:
+            # Load and start the selected level
+            level_num = self.adventure_level_selection + 1
+            # Only allow playing unlocked levels
+            if self.is_level_unlocked(level_num):
+                if self.load_level(level_num):
+                    self.sound_manager.play('start_game')
+                    self.lives = 3  # Reset lives when starting a level
+                    self.state = GameState.EGG_HATCHING
+                    self.score = 0
+                    self.level = level_num
+            else:
+                # Play error sound if level is locked
+                self.play_blip()
+        elif key == pygame.K_y:
+            # View intro if available
+            if len(self.intro_images) > 0:
+                self.play_blip()
+                self.start_intro()
+
+    def fire_bullet(self):
+        """Launch a bullet from the snake's head, reusing a spent one when available"""
+        head_x, head_y = self.snake.body[0]
+        if self.free_bullets:
+            bullet = self.free_bullets.pop()
+            bullet.reset(head_x, head_y, self.snake.direction)
+        else:
+            bullet = Bullet(head_x, head_y, self.snake.direction)
+        self.bullets.append(bullet)
+    
+    def handle_playing_keydown(self, event):
+        if event.key == pygame.K_RETURN:
+            self.state = GameState.PAUSED
+        elif event.key == pygame.K_SPACE:
+            # Shooting in adventure mode
+            if self.game_mode == "adventure" and self.snake.can_shoot:
+                # Check if player has enough segments (need more than 3)
+                if len(self.snake.body) > 3:
+                    # Fire a bullet in the current direction
+                    self.fire_bullet()
+                    # Remove a segment from the snake
+                    if self.snake.body:
+                        self.snake.body.pop()
+                    # Play laser shoot sound
+                    self.sound_manager.play('laser_shoot')
+                    # If segments are now 3 or less, lose shooting ability
+                    if len(self.snake.body) <= 3:
+                        self.snake.can_shoot = False
+
+    def handle_paused_keydown(self, event):
+        if event.key == pygame.K_RETURN:
+            self.state = GameState.PLAYING
+        elif event.key == pygame.K_ESCAPE:
+            # Exit game - for network games, use special handling
+            if self.is_network_game:
+                self.exit_network_game()
+            elif self.is_multiplayer:
+                # Local multiplayer - return to multiplayer menu
+                self.state = GameState.MULTIPLAYER_MENU
+            else:
+                # Single player - return to appropriate menu
+                self.music_manager.play_theme()
+                if self.game_mode == "adventure":
+                    self.state = GameState.ADVENTURE_LEVEL_SELECT
+                else:
+                    self.state = GameState.MENU
+
+    def handle_game_over_keydown(self, event):
+        # Only allow input after the 3-second timer expires
+        if self.game_over_timer == 0 and event.key == pygame.K_RETURN:
+            if self.is_network_game:
+                # Network game - only host can progress
+                if self.network_manager.is_host():
+                    self.play_blip()
+                    return_msg = create_return_to_lobby_message()
+                    self.network_manager.broadcast_to_clients(return_msg)
+                    self.state = GameState.MULTIPLAYER_LOBBY
+                    self.multiplayer_end_timer_phase = 0
+                    self.broadcast_lobby_state()
+                # Client ignores input - waits for host
+            elif self.is_multiplayer:
+                # Local multiplayer - go back to lobby
+                self.play_blip()
+                self.state = GameState.MULTIPLAYER_LOBBY
+            elif self.game_mode == "adventure":
+                # Adventure mode - reset lives and go back to level select
+                self.play_blip()
+                self.lives = 3
+                self.music_manager.stop_game_over_music()
+                self.music_manager.play_theme()
+                self.state = GameState.ADVENTURE_LEVEL_SELECT
+                # Clean up memory after game over to prevent slowdown on Pi
+                gc.collect()
+            else:
+                # Endless mode - reset game and go to menu
+                self.reset_game()
+                self.state = GameState.MENU
+                # Returning to menu - play theme music
+                self.music_manager.stop_game_over_music()
+                self.music_manager.play_theme()
+
+    def handle_level_complete_keydown(self, event):
+        if event.key == pygame.K_RETURN:
+            # Adventure mode returns to level select, endless continues to next level
+            if self.game_mode == "adventure":
+                self.lives = 3  # Reset lives after completing a level
+                self.state = GameState.ADVENTURE_LEVEL_SELECT
+                # Stop victory jingle and start theme music
+                pygame.mixer.music.stop()
+                self.music_manager.play_theme()
+                # Clean up memory between levels to prevent slowdown on Pi
+                gc.collect()
+            else:
+                self.next_level()
+
+    def handle_credits_keydown(self, event):
+        if event.key == pygame.K_RETURN:
+            self.go_back()
+
+    def handle_achievements_keydown(self, event):
+        achievements = self.get_achievement_list()
+        if event.key == pygame.K_UP and achievements:
+            self.step_selection('achievement_selection', len(achievements), -1)
+        elif event.key == pygame.K_DOWN and achievements:
+            self.step_selection('achievement_selection', len(achievements), 1)
+        elif event.key == pygame.K_RETURN:
+            self.go_back()
+
+    def handle_music_player_keydown(self, event):
+        key = event.key
+        if key == pygame.K_UP:
+            self.step_selection('music_player_selection', len(self.music_player_tracks), -1)
+        elif key == pygame.K_DOWN:
+            self.step_selection('music_player_selection', len(self.music_player_tracks), 1)
+        elif key == pygame.K_RETURN or key == pygame.K_SPACE:
+            # Play/Pause or select track
+            self.toggle_music_player_track()
+        elif key == pygame.K_LEFT:
+            # Previous track
+            self.music_player_previous_track()
+        elif key == pygame.K_RIGHT:
+            # Next track
+            self.music_player_next_track()
+
+    def handle_level_editor_menu_keydown(self, event):
+        if event.key == pygame.K_RETURN:
+            self.go_back()
+
+    def handle_high_scores_keydown(self, event):
+        if event.key == pygame.K_RETURN:
+            self.state = GameState.MENU
+            # Ensure theme music is playing when returning to menu
+            if not self.music_manager.theme_mode:
+                self.music_manager.play_theme()
+
+    def handle_multiplayer_menu_keydown(self, event):
+        if event.key == pygame.K_UP:
+            self.step_selection('multiplayer_menu_selection', len(self.multiplayer_menu_options), -1)
+        elif event.key == pygame.K_DOWN:
+            self.step_selection('multiplayer_menu_selection', len(self.multiplayer_menu_options), 1)
+        elif event.key == pygame.K_RETURN:
+            self.select_multiplayer_menu_option()
+
+    def handle_network_menu_keydown(self, event):
+        if event.key == pygame.K_UP:
+            self.step_selection('network_menu_selection', len(self.network_menu_options), -1)
+        elif event.key == pygame.K_DOWN:
+            self.step_selection('network_menu_selection', len(self.network_menu_options), 1)
+        elif event.key == pygame.K_RETURN:
+            self.select_network_menu_option()
+
+    def handle_network_host_lobby_keydown(self, event):
+        # Host lobby - waiting for players to join
+        if event.key == pygame.K_RETURN:
+            # Start game if we have at least 2 players (host + 1 client)
+            if self.network_manager.get_connected_players() >= 2:
+                self.sound_manager.play('start_game')
+                # Start game on host first (this selects music)
+                self.music_manager.stop_game_over_music()
+                self.reset_game()
+                # Broadcast game start to all clients WITH current music track
+                self.broadcast_game_start(self.network_manager.get_connected_players())
+            else:
+                self.network_status_message = "Need at least 2 players"
+
+    def handle_network_client_lobby_keydown(self, event):
+        key = event.key
+        # Client - server list navigation and connection
+        if key == pygame.K_UP:
+            # Navigate up in server list
+            if len(self.discovered_servers) > 0 and self.server_selection > 0:
+                self.server_selection -= 1
+                self.play_blip()
+        elif key == pygame.K_DOWN:
+            # Navigate down in server list
+            if len(self.discovered_servers) > 0 and self.server_selection < len(self.discovered_servers) - 1:
+                self.server_selection += 1
+                self.play_blip()
+        elif key == pygame.K_RETURN:
+            self.connect_to_selected_server()
+        elif key == pygame.K_r:
+            self.refresh_server_list()
+
+    def handle_multiplayer_level_select_keydown(self, event):
+        levels_unlocked = self.get_multiplayer_levels_unlocked()
+        max_level = min(levels_unlocked, len(self.multiplayer_levels))
+        if event.key == pygame.K_UP:
+            if max_level > 0:
+                self.step_selection('multiplayer_level_selection', max_level, -1)
+        elif event.key == pygame.K_DOWN:
+            if max_level > 0:
+                self.step_selection('multiplayer_level_selection', max_level, 1)
+        elif event.key == pygame.K_RETURN:
+            # Select level and return to lobby
+            if len(self.multiplayer_levels) > 0:
+                self.play_blip()
+                # Update lobby level setting
+                self.lobby_settings['level'] = self.multiplayer_level_selection
+                self.load_selected_multiplayer_level()
+                # Return to lobby (or multiplayer menu if no return state)
+                if self.level_select_return_state:
+                    self.state = self.level_select_return_state
+                    self.level_select_return_state = None
+                    # Broadcast updated lobby state to clients
+                    if self.is_network_game and self.network_manager.is_host():
+                        self.broadcast_lobby_state()
+                else:
+                    self.state = GameState.MULTIPLAYER_LOBBY
+        elif event.key == pygame.K_ESCAPE:
+            self.play_blip()
+            # Return to lobby if coming from there, otherwise multiplayer menu
+            if self.level_select_return_state:
+                self.state = self.level_select_return_state
+                self.level_select_return_state = None
+            else:
+                self.state = GameState.MULTIPLAYER_MENU
+
+    def handle_multiplayer_lobby_keydown(self, event):
+        key = event.key
+        # Only host can navigate and change settings in network games
+        can_change = not self.is_network_game or self.network_manager.is_host()
+
+        if key == pygame.K_UP and can_change:
+            self.step_selection('lobby_selection', 8, -1)  # 4 settings + 4 players
+        elif key == pygame.K_DOWN and can_change:
+            self.step_selection('lobby_selection', 8, 1)
+        elif (key == pygame.K_LEFT or key == pygame.K_RIGHT) and can_change:
+            direction = 1 if key == pygame.K_RIGHT else -1
+            self.change_lobby_setting(self.lobby_selection, direction)
+        elif key == pygame.K_a and can_change:
+            # A key opens level select when on level option
+            if self.lobby_selection == 3:
+                self.play_blip()
+                self.level_select_return_state = GameState.MULTIPLAYER_LOBBY
+                self.multiplayer_level_selection = self.lobby_settings.get('level', 0)
+                self.state = GameState.MULTIPLAYER_LEVEL_SELECT
+        elif key == pygame.K_RETURN:
+            # Only host can start game in network mode
+            if not self.is_network_game or self.network_manager.is_host():
+                self.sound_manager.play('start_game')
+                # Start game first (this selects music)
+                self.music_manager.stop_game_over_music()
+                self.reset_game()
+                # Broadcast game start to network clients WITH music track
+                if self.is_network_game:
+                    self.broadcast_game_start(len([s for s in self.player_slots if s != 'off']))
+        elif key == pygame.K_ESCAPE:
+            self.play_blip()
+            # Network clients disconnect, host cancels
+            if self.is_network_game:
+                self.network_manager.cleanup()
+                self.is_network_game = False
+                self.is_multiplayer = False
+                self.state = GameState.NETWORK_MENU if self.network_manager.role == NetworkRole.CLIENT else GameState.NETWORK_MENU
+            else:
+                self.state = GameState.MULTIPLAYER_MENU
+
+    def handle_difficulty_select_keydown(self, event):
+        if event.key == pygame.K_UP:
+            self.step_selection('difficulty_selection', 3, -1)
+        elif event.key == pygame.K_DOWN:
+            self.step_selection('difficulty_selection', 3, 1)
+        elif event.key == pygame.K_RETURN:
+            # Set difficulty and start game
+            if self.difficulty_selection == 0:
+                self.difficulty = Difficulty.EASY
+            elif self.difficulty_selection == 1:
+                self.difficulty = Difficulty.MEDIUM
+            else:
+                self.difficulty = Difficulty.HARD
+            self.sound_manager.play('start_game')
+            self.music_manager.stop_game_over_music()
+            self.reset_game()
+            # reset_game() already sets state to EGG_HATCHING, don't override it
+
+    def handle_intro_button(self, button):
+        # Skip intro with any button press (only if not first time)
+        if not getattr(self, 'intro_first_time', False):
+            self.intro_seen = True
+            self.save_unlocked_levels()
+            self.state = GameState.ADVENTURE_LEVEL_SELECT
+            self.adventure_level_selection = 0
+
+    def handle_menu_button(self, button):
+        if button == GamepadButton.BTN_START or button == GamepadButton.BTN_A:
+            self.select_menu_option()
+
+    def handle_single_player_menu_button(self, button):
+        if button == GamepadButton.BTN_START or button == GamepadButton.BTN_A:
+            self.select_single_player_option()
+
+    def handle_extras_menu_button(self, button):
+        if button == GamepadButton.BTN_START or button == GamepadButton.BTN_A:
+            self.select_extras_option()
+
+    def handle_adventure_level_select_button(self, button):
+        if button == GamepadButton.BTN_START or button == GamepadButton.BTN_A:
+            level_num = self.adventure_level_selection + 1
+            # Only allow playing unlocked levels
+            if self.is_level_unlocked(level_num):
+                if self.load_level(level_num):
+                    self.sound_manager.play('start_game')
+                    self.lives = 3  # Reset lives when starting a level
+                    self.state = GameState.EGG_HATCHING
+                    self.score = 0
+                    self.level = level_num
+            else:
+                # Play error sound or do nothing if level is locked
+                self.play_blip()
+        elif button == GamepadButton.BTN_Y:
+            # View intro if available
+            if len(self.intro_images) > 0:
+                self.play_blip()
+                self.start_intro()
+
+    def handle_playing_button(self, button):
+        if button == GamepadButton.BTN_START:
+            self.state = GameState.PAUSED
+        elif button == GamepadButton.BTN_A:
+            # Shooting in adventure mode
+            if self.game_mode == "adventure" and self.snake.can_shoot:
+                # Check if player has enough segments (need more than 3)
+                if len(self.snake.body) > 3:
+                    # Fire a bullet in the current direction
+                    self.fire_bullet()
+                    # Remove a segment from the snake
+                    if self.snake.body:
+                        self.snake.body.pop()
+                    # Play laser shoot sound
+                    self.sound_manager.play('laser_shoot')
+                    # If segments are now 3 or less, lose shooting ability
+                    if len(self.snake.body) <= 3:
+                        self.snake.can_shoot = False
+
+    def handle_paused_button(self, button):
+        if button == GamepadButton.BTN_START:
+            self.state = GameState.PLAYING
+        elif button == GamepadButton.BTN_B:
+            # Exit game - for network games, use special handling
+            if self.is_network_game:
+                self.exit_network_game()
+            elif self.is_multiplayer:
+                # Local multiplayer - return to multiplayer menu
+                self.state = GameState.MULTIPLAYER_MENU
+            else:
+                # Single player - return to appropriate menu
+                self.music_manager.play_theme()
+                if self.game_mode == "adventure":
+                    self.state = GameState.ADVENTURE_LEVEL_SELECT
+                else:
+                    self.state = GameState.MENU
+
+    def handle_game_over_button(self, button):
+        # Only allow input after the 3-second timer expires
+        if self.game_over_timer == 0 and button == GamepadButton.BTN_START:
+            if self.is_network_game:
+                # Network game - only host can progress
+                if self.network_manager.is_host():
+                    self.play_blip()
+                    return_msg = create_return_to_lobby_message()
+                    self.network_manager.broadcast_to_clients(return_msg)
+                    self.state = GameState.MULTIPLAYER_LOBBY
+                    self.multiplayer_end_timer_phase = 0
+                    self.broadcast_lobby_state()
+                # Client ignores input - waits for host
+            elif self.is_multiplayer:
+                # Local multiplayer - go back to lobby
+                self.play_blip()
+                self.state = GameState.MULTIPLAYER_LOBBY
+            elif self.game_mode == "adventure":
+                # Adventure mode - reset lives and go back to level select
+                self.play_blip()
+                self.lives = 3
+                self.music_manager.stop_game_over_music()
+                self.music_manager.play_theme()
+                self.state = GameState.ADVENTURE_LEVEL_SELECT
+                # Clean up memory after game over to prevent slowdown on Pi
+                gc.collect()
+            else:
+                # Endless mode - reset game and go to menu
+                self.reset_game()
+                self.state = GameState.MENU
+
+    def handle_level_complete_button(self, button):
+        if button == GamepadButton.BTN_START:
+            # Adventure mode returns to level select, endless continues to next level
+            if self.game_mode == "adventure":
+                self.lives = 3  # Reset lives after completing a level
+                self.state = GameState.ADVENTURE_LEVEL_SELECT
+                # Stop victory jingle and start theme music
+                pygame.mixer.music.stop()
+                self.music_manager.play_theme()
+                # Clean up memory between levels to prevent slowdown on Pi
+                gc.collect()
+            else:
+                self.next_level()
+
+    def handle_credits_button(self, button):
+        if button == GamepadButton.BTN_START:
+            self.go_back()
+
+    def handle_achievements_button(self, button):
+        if button == GamepadButton.BTN_START:
+            self.go_back()
+
+    def handle_music_player_button(self, button):
+        if button == GamepadButton.BTN_A:
+            # Play/Pause or select track
+            self.toggle_music_player_track()
+        elif button == GamepadButton.BTN_L:
+            # Previous track
+            self.music_player_previous_track()
+        elif button == GamepadButton.BTN_R:
+            # Next track
+            self.music_player_next_track()
+        elif button == GamepadButton.BTN_START:
+            self.go_back()
+
+    def handle_level_editor_menu_button(self, button):
+        if button == GamepadButton.BTN_START:
+            self.go_back()
+
+    def handle_high_score_entry_button(self, button):
+        if button == GamepadButton.BTN_A:
+            self.use_onscreen_keyboard()
+        elif button == GamepadButton.BTN_B:
+            if self.name_index > 0:
+                self.name_index -= 1
+        elif button == GamepadButton.BTN_START:
+            name = ''.join(self.player_name)
+            self.add_high_score(name, self.score)
+            self.state = GameState.HIGH_SCORES
+
+    def handle_high_scores_button(self, button):
+        if button == GamepadButton.BTN_START:
+            self.state = GameState.MENU
+
+    def handle_multiplayer_menu_button(self, button):
+        if button == GamepadButton.BTN_START or button == GamepadButton.BTN_A:
+            self.select_multiplayer_menu_option()
+
+    def handle_network_menu_button(self, button):
+        if button == GamepadButton.BTN_START or button == GamepadButton.BTN_A:
+            self.select_network_menu_option()
+
+    def handle_network_client_lobby_button(self, button):
+        # Server list navigation with gamepad
+        if button == GamepadButton.BTN_START or button == GamepadButton.BTN_A:
+            self.connect_to_selected_server()
+        elif button == GamepadButton.BTN_Y:
+            self.refresh_server_list()
+
+    def handle_multiplayer_lobby_button(self, button):
+        # Only host can change settings in network games
+        can_change = not self.is_network_game or self.network_manager.is_host()
+
+        if button == GamepadButton.BTN_START:
+            # Only host can start game in network mode
+            if not self.is_network_game or self.network_manager.is_host():
+                self.sound_manager.play('start_game')
+                # Start game first (this selects music)
+                self.music_manager.stop_game_over_music()
+                self.reset_game()
+                # Broadcast game start to network clients WITH music track
+                if self.is_network_game:
+                    self.broadcast_game_start(len([s for s in self.player_slots if s != 'off']))
+        elif button == GamepadButton.BTN_A and can_change:
+            # A button opens level select when on level option, otherwise cycles settings forward
+            if self.lobby_selection == 3:
+                self.play_blip()
+                self.level_select_return_state = GameState.MULTIPLAYER_LOBBY
+                self.multiplayer_level_selection = self.lobby_settings.get('level', 0)
+                self.state = GameState.MULTIPLAYER_LEVEL_SELECT
+            else:
+                self.change_lobby_setting(self.lobby_selection, 1)
+        elif button == GamepadButton.BTN_B:
+            self.play_blip()
+            # Network clients disconnect, host cancels
+            if self.is_network_game:
+                self.network_manager.cleanup()
+                self.is_network_game = False
+                self.is_multiplayer = False
+                self.state = GameState.NETWORK_MENU if self.network_manager.role == NetworkRole.CLIENT else GameState.NETWORK_MENU
+            else:
+                self.state = GameState.MULTIPLAYER_MENU
+
+    def handle_difficulty_select_button(self, button):
+        if button == GamepadButton.BTN_START:
+            # Set difficulty and start game
+            if self.difficulty_selection == 0:
+                self.difficulty = Difficulty.EASY
+            elif self.difficulty_selection == 1:
+                self.difficulty = Difficulty.MEDIUM
+            else:
+                self.difficulty = Difficulty.HARD
+            self.sound_manager.play('start_game')
+            self.music_manager.stop_game_over_music()
+            self.reset_game()
+            # reset_game() already sets state to EGG_HATCHING, don't override it
+
+    def handle_multiplayer_level_select_button(self, button):
+        if button == GamepadButton.BTN_A or button == GamepadButton.BTN_START:
+            # Select level and return to lobby
+            if len(self.multiplayer_levels) > 0:
+                self.play_blip()
+                self.lobby_settings['level'] = self.multiplayer_level_selection
+                self.load_selected_multiplayer_level()
+                if self.level_select_return_state:
+                    self.state = self.level_select_return_state
+                    # Broadcast lobby state update if network host
+                    if self.is_network_game and self.network_manager.is_host():
+                        self.broadcast_lobby_state()
+                else:
+                    self.state = GameState.MULTIPLAYER_LOBBY
+        elif button == GamepadButton.BTN_B:
+            # Cancel and return to lobby
+            self.play_blip()
+            if self.level_select_return_state:
+                self.state = self.level_select_return_state
+            else:
+                self.state = GameState.MULTIPLAYER_LOBBY
+
     def handle_event(self, event):
         if event.type == pygame.QUIT:
             return False
@@ -5112,857 +5544,98 @@ class SnakeGame:
                     self.state = GameState.CREDITS
                 return True
             
-            if self.state == GameState.MENU:
-                if event.key == pygame.K_UP:
-                    self.menu_selection = (self.menu_selection - 1) % len(self.menu_options)
-                    self.sound_manager.play('blip_select')
-                elif event.key == pygame.K_DOWN:
-                    self.menu_selection = (self.menu_selection + 1) % len(self.menu_options)
-                    self.sound_manager.play('blip_select')
-                elif event.key == pygame.K_RETURN:
-                    self.select_menu_option()
-            elif self.state == GameState.SINGLE_PLAYER_MENU:
-                if event.key == pygame.K_UP:
-                    self.single_player_selection = (self.single_player_selection - 1) % len(self.single_player_options)
-                    self.sound_manager.play('blip_select')
-                elif event.key == pygame.K_DOWN:
-                    self.single_player_selection = (self.single_player_selection + 1) % len(self.single_player_options)
-                    self.sound_manager.play('blip_select')
-                elif event.key == pygame.K_RETURN:
-                    self.select_single_player_option()
-                elif event.key == pygame.K_ESCAPE:
-                    self.sound_manager.play('blip_select')
-                    self.state = GameState.MENU
-            elif self.state == GameState.EXTRAS_MENU:
-                if event.key == pygame.K_UP:
-                    self.extras_menu_selection = (self.extras_menu_selection - 1) % len(self.extras_menu_options)
-                    self.sound_manager.play('blip_select')
-                elif event.key == pygame.K_DOWN:
-                    self.extras_menu_selection = (self.extras_menu_selection + 1) % len(self.extras_menu_options)
-                    self.sound_manager.play('blip_select')
-                elif event.key == pygame.K_RETURN:
-                    self.select_extras_option()
-                elif event.key == pygame.K_ESCAPE:
-                    self.sound_manager.play('blip_select')
-                    self.state = GameState.MENU
-            elif self.state == GameState.ADVENTURE_LEVEL_SELECT:
-                cols = 8
-                if event.key == pygame.K_LEFT:
-                    self.adventure_level_selection = max(0, self.adventure_level_selection - 1)
-                    self.sound_manager.play('blip_select')
-                elif event.key == pygame.K_RIGHT:
-                    self.adventure_level_selection = min(self.total_levels - 1, self.adventure_level_selection + 1)
-                    self.sound_manager.play('blip_select')
-                elif event.key == pygame.K_UP:
-                    self.adventure_level_selection = max(0, self.adventure_level_selection - cols)
-                    self.sound_manager.play('blip_select')
-                elif event.key == pygame.K_DOWN:
-                    self.adventure_level_selection = min(self.total_levels - 1, self.adventure_level_selection + cols)
-                    self.sound_manager.play('blip_select')
-                elif event.key == pygame.K_RETURN:
-                    # Load and start the selected level
-                    level_num = self.adventure_level_selection + 1
-                    # Only allow playing unlocked levels
-                    if self.is_level_unlocked(level_num):
-                        if self.load_level(level_num):
-                            self.sound_manager.play('start_game')
-                            self.lives = 3  # Reset lives when starting a level
-                            self.state = GameState.EGG_HATCHING
-                            self.score = 0
-                            self.level = level_num
-                    else:
-                        # Play error sound if level is locked
-                        self.sound_manager.play('blip_select')
-                elif event.key == pygame.K_y:
-                    # View intro if available
-                    if len(self.intro_images) > 0:
-                        self.sound_manager.play('blip_select')
-                        self.start_intro()
-                elif event.key == pygame.K_ESCAPE:
-                    self.sound_manager.play('blip_select')
-                    self.state = GameState.SINGLE_PLAYER_MENU
-            elif self.state == GameState.PLAYING:
-                if event.key == pygame.K_RETURN:
-                    self.state = GameState.PAUSED
-                elif event.key == pygame.K_SPACE:
-                    # Shooting in adventure mode
-                    if self.game_mode == "adventure" and self.snake.can_shoot:
-                        # Check if player has enough segments (need more than 3)
-                        if len(self.snake.body) > 3:
-                            # Fire a bullet in the current direction
-                            head_x, head_y = self.snake.body[0]
-                            bullet = Bullet(head_x, head_y, self.snake.direction)
-                            self.bullets.append(bullet)
-                            # Remove a segment from the snake
-                            if self.snake.body:
-                                self.snake.body.pop()
-                            # Play laser shoot sound
-                            self.sound_manager.play('laser_shoot')
-                            # If segments are now 3 or less, lose shooting ability
-                            if len(self.snake.body) <= 3:
-                                self.snake.can_shoot = False
-            elif self.state == GameState.PAUSED:
-                if event.key == pygame.K_RETURN:
-                    self.state = GameState.PLAYING
-                elif event.key == pygame.K_ESCAPE:
-                    # Exit game - for network games, use special handling
-                    if self.is_network_game:
-                        self.exit_network_game()
-                    elif self.is_multiplayer:
-                        # Local multiplayer - return to multiplayer menu
-                        self.state = GameState.MULTIPLAYER_MENU
-                    else:
-                        # Single player - return to appropriate menu
-                        self.music_manager.play_theme()
-                        if self.game_mode == "adventure":
-                            self.state = GameState.ADVENTURE_LEVEL_SELECT
-                        else:
-                            self.state = GameState.MENU
-            elif self.state == GameState.GAME_OVER:
-                # Only allow input after the 3-second timer expires
-                if self.game_over_timer == 0 and event.key == pygame.K_RETURN:
-                    if self.is_network_game:
-                        # Network game - only host can progress
-                        if self.network_manager.is_host():
-                            self.sound_manager.play('blip_select')
-                            return_msg = create_return_to_lobby_message()
-                            self.network_manager.broadcast_to_clients(return_msg)
-                            self.state = GameState.MULTIPLAYER_LOBBY
-                            self.multiplayer_end_timer_phase = 0
-                            self.broadcast_lobby_state()
-                        # Client ignores input - waits for host
-                    elif self.is_multiplayer:
-                        # Local multiplayer - go back to lobby
-                        self.sound_manager.play('blip_select')
-                        self.state = GameState.MULTIPLAYER_LOBBY
-                    elif self.game_mode == "adventure":
-                        # Adventure mode - reset lives and go back to level select
-                        self.sound_manager.play('blip_select')
-                        self.lives = 3
-                        self.music_manager.stop_game_over_music()
-                        self.music_manager.play_theme()
-                        self.state = GameState.ADVENTURE_LEVEL_SELECT
-                        # Clean up memory after game over to prevent slowdown on Pi
-                        gc.collect()
-                    else:
-                        # Endless mode - reset game and go to menu
-                        self.reset_game()
-                        self.state = GameState.MENU
-                        # Returning to menu - play theme music
-                        self.music_manager.stop_game_over_music()
-                        self.music_manager.play_theme()
-            elif self.state == GameState.LEVEL_COMPLETE:
-                if event.key == pygame.K_RETURN:
-                    # Adventure mode returns to level select, endless continues to next level
-                    if self.game_mode == "adventure":
-                        self.lives = 3  # Reset lives after completing a level
-                        self.state = GameState.ADVENTURE_LEVEL_SELECT
-                        # Stop victory jingle and start theme music
-                        pygame.mixer.music.stop()
-                        self.music_manager.play_theme()
-                        # Clean up memory between levels to prevent slowdown on Pi
-                        gc.collect()
-                    else:
-                        self.next_level()
-            elif self.state == GameState.CREDITS:
-                if event.key == pygame.K_RETURN or event.key == pygame.K_ESCAPE:
-                    # Return to extras menu if accessed from there
-                    self.sound_manager.play('blip_select')
-                    self.state = GameState.EXTRAS_MENU
-                    # Play theme music
-                    if not self.music_manager.theme_mode:
-                        self.music_manager.play_theme()
-            elif self.state == GameState.ACHIEVEMENTS:
-                achievements = self.get_achievement_list()
-                if event.key == pygame.K_UP and achievements:
-                    self.achievement_selection = (self.achievement_selection - 1) % len(achievements)
-                    self.sound_manager.play('blip_select')
-                elif event.key == pygame.K_DOWN and achievements:
-                    self.achievement_selection = (self.achievement_selection + 1) % len(achievements)
-                    self.sound_manager.play('blip_select')
-                elif event.key == pygame.K_RETURN or event.key == pygame.K_ESCAPE:
-                    self.sound_manager.play('blip_select')
-                    self.state = GameState.EXTRAS_MENU
-            elif self.state == GameState.MUSIC_PLAYER:
-                if event.key == pygame.K_UP:
-                    self.music_player_selection = (self.music_player_selection - 1) % len(self.music_player_tracks)
-                    self.sound_manager.play('blip_select')
-                elif event.key == pygame.K_DOWN:
-                    self.music_player_selection = (self.music_player_selection + 1) % len(self.music_player_tracks)
-                    self.sound_manager.play('blip_select')
-                elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
-                    # Play/Pause or select track
-                    self.toggle_music_player_track()
-                elif event.key == pygame.K_LEFT:
-                    # Previous track
-                    self.music_player_previous_track()
-                elif event.key == pygame.K_RIGHT:
-                    # Next track
-                    self.music_player_next_track()
-                elif event.key == pygame.K_ESCAPE:
-                    self.sound_manager.play('blip_select')
-                    self.state = GameState.EXTRAS_MENU
-                    # Stop music player and resume theme
-                    self.music_player_stop()
-                    self.music_manager.play_theme()
-            elif self.state == GameState.LEVEL_EDITOR_MENU:
-                if event.key == pygame.K_RETURN or event.key == pygame.K_ESCAPE:
-                    self.sound_manager.play('blip_select')
-                    self.state = GameState.EXTRAS_MENU
-            elif self.state == GameState.HIGH_SCORE_ENTRY:
-                self.handle_high_score_keyboard(event)
-            elif self.state == GameState.HIGH_SCORES:
-                if event.key == pygame.K_RETURN:
-                    self.state = GameState.MENU
-                    # Ensure theme music is playing when returning to menu
-                    if not self.music_manager.theme_mode:
-                        self.music_manager.play_theme()
-            elif self.state == GameState.MULTIPLAYER_MENU:
-                if event.key == pygame.K_UP:
-                    self.multiplayer_menu_selection = (self.multiplayer_menu_selection - 1) % len(self.multiplayer_menu_options)
-                    self.sound_manager.play('blip_select')
-                elif event.key == pygame.K_DOWN:
-                    self.multiplayer_menu_selection = (self.multiplayer_menu_selection + 1) % len(self.multiplayer_menu_options)
-                    self.sound_manager.play('blip_select')
-                elif event.key == pygame.K_RETURN:
-                    if self.multiplayer_menu_selection == 0:
-                        # Same Screen - Go directly to lobby (level selection is in lobby now)
-                        self.sound_manager.play('blip_select')
-                        self.is_multiplayer = True
-                        self.is_network_game = False
-                        self.lobby_settings['level'] = 0  # Default to first level
-                        self.load_selected_multiplayer_level()
-                        self.setup_multiplayer_game()
-                        self.state = GameState.MULTIPLAYER_LOBBY
-                    elif self.multiplayer_menu_selection == 1:
-                        # Network Game - Go to network menu
-                        self.sound_manager.play('blip_select')
-                        self.state = GameState.NETWORK_MENU
-                    elif self.multiplayer_menu_selection == 2:
-                        # Back to main menu
-                        self.sound_manager.play('blip_select')
-                        self.state = GameState.MENU
-                elif event.key == pygame.K_ESCAPE:
-                    self.sound_manager.play('blip_select')
-                    self.state = GameState.MENU
-            elif self.state == GameState.NETWORK_MENU:
-                if event.key == pygame.K_UP:
-                    self.network_menu_selection = (self.network_menu_selection - 1) % len(self.network_menu_options)
-                    self.sound_manager.play('blip_select')
-                elif event.key == pygame.K_DOWN:
-                    self.network_menu_selection = (self.network_menu_selection + 1) % len(self.network_menu_options)
-                    self.sound_manager.play('blip_select')
-                elif event.key == pygame.K_RETURN:
-                    if self.network_menu_selection == 0:
-                        # Host Game
-                        self.sound_manager.play('blip_select')
-                        success, result = self.network_manager.start_host(max_players=4)
-                        if success:
-                            self.network_host_ip = result
-                            self.network_status_message = f"Hosting on {result}"
-                            self.is_multiplayer = True
-                            self.is_network_game = True
-                            # Initialize default lobby settings
-                            self.player_slots = ['player', 'cpu', 'cpu', 'cpu']  # Host is player 1, rest are CPU
-                            self.lobby_selection = 0
-                            self.lobby_settings['level'] = 0  # Default to first level
-                            self.load_selected_multiplayer_level()  # Load the level data
-                            # Go to multiplayer lobby (setup screen)
-                            self.state = GameState.MULTIPLAYER_LOBBY
-                        else:
-                            self.network_status_message = f"Failed to host: {result}"
-                    elif self.network_menu_selection == 1:
-                        # Join Game - start server discovery and go to server list
-                        self.sound_manager.play('blip_select')
-                        self.network_manager.start_discovery()
-                        self.discovered_servers = []
-                        self.server_selection = 0
-                        self.state = GameState.NETWORK_CLIENT_LOBBY
-                        self.network_status_message = "Searching for LAN servers..."
-                    elif self.network_menu_selection == 2:
-                        # Back
-                        self.sound_manager.play('blip_select')
-                        self.state = GameState.MULTIPLAYER_MENU
-                elif event.key == pygame.K_ESCAPE:
-                    self.sound_manager.play('blip_select')
-                    self.state = GameState.MULTIPLAYER_MENU
-            elif self.state == GameState.NETWORK_HOST_LOBBY:
-                # Host lobby - waiting for players to join
-                if event.key == pygame.K_RETURN:
-                    # Start game if we have at least 2 players (host + 1 client)
-                    if self.network_manager.get_connected_players() >= 2:
-                        self.sound_manager.play('start_game')
-                        # Start game on host first (this selects music)
-                        self.music_manager.stop_game_over_music()
-                        self.reset_game()
-                        # Broadcast game start to all clients WITH current music track
-                        num_players = self.network_manager.get_connected_players()
-                        music_track_index = self.music_manager.get_track_index()
-                        print(f"[HOST] Broadcasting game start with music_track_index: {music_track_index}")  # DEBUG
-                        start_msg = create_game_start_message(num_players, music_track_index, self.current_level_data)
-                        self.network_manager.broadcast_to_clients(start_msg)
-                    else:
-                        self.network_status_message = "Need at least 2 players"
-                elif event.key == pygame.K_ESCAPE:
-                    # Cancel hosting
-                    self.sound_manager.play('blip_select')
-                    self.network_manager.cleanup()
-                    self.is_multiplayer = False
-                    self.is_network_game = False
-                    self.state = GameState.NETWORK_MENU
-            elif self.state == GameState.NETWORK_CLIENT_LOBBY:
-                # Client - server list navigation and connection
-                if event.key == pygame.K_UP:
-                    # Navigate up in server list
-                    if len(self.discovered_servers) > 0 and self.server_selection > 0:
-                        self.server_selection -= 1
-                        self.sound_manager.play('blip_select')
-                elif event.key == pygame.K_DOWN:
-                    # Navigate down in server list
-                    if len(self.discovered_servers) > 0 and self.server_selection < len(self.discovered_servers) - 1:
-                        self.server_selection += 1
-                        self.sound_manager.play('blip_select')
-                elif event.key == pygame.K_RETURN:
-                    # Connect to selected server
-                    if len(self.discovered_servers) > 0 and self.server_selection < len(self.discovered_servers):
-                        self.sound_manager.play('blip_select')
-                        name, ip, port = self.discovered_servers[self.server_selection]
-                        self.network_status_message = f"Connecting to {name}..."
-                        self.network_manager.stop_discovery()
-                        success, result = self.network_manager.connect_to_host(ip)
-                        if success:
-                            self.network_status_message = "Connected! Waiting for host..."
-                            self.is_multiplayer = True
-                            self.is_network_game = True
-                        else:
-                            self.network_status_message = f"Failed: {result}"
-                            self.network_manager.cleanup()
-                            # Restart discovery
-                            self.network_manager.start_discovery()
-                    else:
-                        self.network_status_message = "No server selected"
-                elif event.key == pygame.K_r:
-                    # Refresh server list
-                    self.sound_manager.play('blip_select')
-                    self.network_manager.stop_discovery()
-                    self.network_manager.start_discovery()
-                    self.discovered_servers = []
-                    self.server_selection = 0
-                    self.network_status_message = "Refreshing server list..."
-                elif event.key == pygame.K_ESCAPE:
-                    # Cancel and go back
-                    self.sound_manager.play('blip_select')
-                    self.network_manager.cleanup()
-                    self.state = GameState.NETWORK_MENU
-            elif self.state == GameState.MULTIPLAYER_LEVEL_SELECT:
-                levels_unlocked = self.get_multiplayer_levels_unlocked()
-                max_level = min(levels_unlocked, len(self.multiplayer_levels))
-                if event.key == pygame.K_UP:
-                    if max_level > 0:
-                        self.multiplayer_level_selection = (self.multiplayer_level_selection - 1) % max_level
-                        self.sound_manager.play('blip_select')
-                elif event.key == pygame.K_DOWN:
-                    if max_level > 0:
-                        self.multiplayer_level_selection = (self.multiplayer_level_selection + 1) % max_level
-                        self.sound_manager.play('blip_select')
-                elif event.key == pygame.K_RETURN:
-                    # Select level and return to lobby
-                    if len(self.multiplayer_levels) > 0:
-                        self.sound_manager.play('blip_select')
-                        # Update lobby level setting
-                        self.lobby_settings['level'] = self.multiplayer_level_selection
-                        self.load_selected_multiplayer_level()
-                        # Return to lobby (or multiplayer menu if no return state)
-                        if self.level_select_return_state:
-                            self.state = self.level_select_return_state
-                            self.level_select_return_state = None
-                            # Broadcast updated lobby state to clients
-                            if self.is_network_game and self.network_manager.is_host():
-                                self.broadcast_lobby_state()
-                        else:
-                            self.state = GameState.MULTIPLAYER_LOBBY
-                elif event.key == pygame.K_ESCAPE:
-                    self.sound_manager.play('blip_select')
-                    # Return to lobby if coming from there, otherwise multiplayer menu
-                    if self.level_select_return_state:
-                        self.state = self.level_select_return_state
-                        self.level_select_return_state = None
-                    else:
-                        self.state = GameState.MULTIPLAYER_MENU
-            elif self.state == GameState.MULTIPLAYER_LOBBY:
-                # Only host can navigate and change settings in network games
-                can_change = not self.is_network_game or self.network_manager.is_host()
-                
-                if event.key == pygame.K_UP and can_change:
-                    self.lobby_selection = (self.lobby_selection - 1) % 8  # 4 settings + 4 players
-                    self.sound_manager.play('blip_select')
-                elif event.key == pygame.K_DOWN and can_change:
-                    self.lobby_selection = (self.lobby_selection + 1) % 8
-                    self.sound_manager.play('blip_select')
-                elif (event.key == pygame.K_LEFT or event.key == pygame.K_RIGHT) and can_change:
-                    direction = 1 if event.key == pygame.K_RIGHT else -1
-                    self.change_lobby_setting(self.lobby_selection, direction)
-                elif event.key == pygame.K_a and can_change:
-                    # A key opens level select when on level option
-                    if self.lobby_selection == 3:
-                        self.sound_manager.play('blip_select')
-                        self.level_select_return_state = GameState.MULTIPLAYER_LOBBY
-                        self.multiplayer_level_selection = self.lobby_settings.get('level', 0)
-                        self.state = GameState.MULTIPLAYER_LEVEL_SELECT
-                elif event.key == pygame.K_RETURN:
-                    # Only host can start game in network mode
-                    if not self.is_network_game or self.network_manager.is_host():
-                        self.sound_manager.play('start_game')
-                        # Start game first (this selects music)
-                        self.music_manager.stop_game_over_music()
-                        self.reset_game()
-                        # Broadcast game start to network clients WITH music track
-                        if self.is_network_game:
-                            num_players = len([s for s in self.player_slots if s != 'off'])
-                            music_track_index = self.music_manager.get_track_index()
-                            start_msg = create_game_start_message(num_players, music_track_index, self.current_level_data)
-                            self.network_manager.broadcast_to_clients(start_msg)
-                elif event.key == pygame.K_ESCAPE:
-                    self.sound_manager.play('blip_select')
-                    # Network clients disconnect, host cancels
-                    if self.is_network_game:
-                        self.network_manager.cleanup()
-                        self.is_network_game = False
-                        self.is_multiplayer = False
-                        self.state = GameState.NETWORK_MENU if self.network_manager.role == NetworkRole.CLIENT else GameState.NETWORK_MENU
-                    else:
-                        self.state = GameState.MULTIPLAYER_MENU
-            elif self.state == GameState.DIFFICULTY_SELECT:
-                if event.key == pygame.K_UP:
-                    self.difficulty_selection = (self.difficulty_selection - 1) % 3
-                    self.sound_manager.play('blip_select')
-                elif event.key == pygame.K_DOWN:
-                    self.difficulty_selection = (self.difficulty_selection + 1) % 3
-                    self.sound_manager.play('blip_select')
-                elif event.key == pygame.K_RETURN:
-                    # Set difficulty and start game
-                    if self.difficulty_selection == 0:
-                        self.difficulty = Difficulty.EASY
-                    elif self.difficulty_selection == 1:
-                        self.difficulty = Difficulty.MEDIUM
-                    else:
-                        self.difficulty = Difficulty.HARD
-                    self.sound_manager.play('start_game')
-                    self.music_manager.stop_game_over_music()
-                    self.reset_game()
-                    # reset_game() already sets state to EGG_HATCHING, don't override it
+            if event.key == pygame.K_ESCAPE and self.state in BACK_STATES:
+                self.go_back()
+                return True
+            
+            keydown_handler = self.keydown_handlers.get(self.state)
+            if keydown_handler:
+                keydown_handler(event)
         
         if event.type == pygame.JOYBUTTONDOWN and self.joystick:
-            button = event.button
-            # Skip intro with any button press (only if not first time)
-            if self.state == GameState.INTRO:
-                if not getattr(self, 'intro_first_time', False):
-                    self.intro_seen = True
-                    self.save_unlocked_levels()
-                    self.state = GameState.ADVENTURE_LEVEL_SELECT
-                    self.adventure_level_selection = 0
-            elif self.state == GameState.MENU:
-                if button == GamepadButton.BTN_START or button == GamepadButton.BTN_A:
-                    self.select_menu_option()
-            elif self.state == GameState.SINGLE_PLAYER_MENU:
-                if button == GamepadButton.BTN_START or button == GamepadButton.BTN_A:
-                    self.select_single_player_option()
-                elif button == GamepadButton.BTN_B:
-                    self.sound_manager.play('blip_select')
-                    self.state = GameState.MENU
-            elif self.state == GameState.EXTRAS_MENU:
-                if button == GamepadButton.BTN_START or button == GamepadButton.BTN_A:
-                    self.select_extras_option()
-                elif button == GamepadButton.BTN_B:
-                    self.sound_manager.play('blip_select')
-                    self.state = GameState.MENU
-            elif self.state == GameState.ADVENTURE_LEVEL_SELECT:
-                if button == GamepadButton.BTN_START or button == GamepadButton.BTN_A:
-                    level_num = self.adventure_level_selection + 1
-                    # Only allow playing unlocked levels
-                    if self.is_level_unlocked(level_num):
-                        if self.load_level(level_num):
-                            self.sound_manager.play('start_game')
-                            self.lives = 3  # Reset lives when starting a level
-                            self.state = GameState.EGG_HATCHING
-                            self.score = 0
-                            self.level = level_num
-                    else:
-                        # Play error sound or do nothing if level is locked
-                        self.sound_manager.play('blip_select')
-                elif button == GamepadButton.BTN_Y:
-                    # View intro if available
-                    if len(self.intro_images) > 0:
-                        self.sound_manager.play('blip_select')
-                        self.start_intro()
-                elif button == GamepadButton.BTN_B:
-                    self.sound_manager.play('blip_select')
-                    self.state = GameState.SINGLE_PLAYER_MENU
-            elif self.state == GameState.PLAYING:
-                if button == GamepadButton.BTN_START:
-                    self.state = GameState.PAUSED
-                elif button == GamepadButton.BTN_A:
-                    # Shooting in adventure mode
-                    if self.game_mode == "adventure" and self.snake.can_shoot:
-                        # Check if player has enough segments (need more than 3)
-                        if len(self.snake.body) > 3:
-                            # Fire a bullet in the current direction
-                            head_x, head_y = self.snake.body[0]
-                            bullet = Bullet(head_x, head_y, self.snake.direction)
-                            self.bullets.append(bullet)
-                            # Remove a segment from the snake
-                            if self.snake.body:
-                                self.snake.body.pop()
-                            # Play laser shoot sound
-                            self.sound_manager.play('laser_shoot')
-                            # If segments are now 3 or less, lose shooting ability
-                            if len(self.snake.body) <= 3:
-                                self.snake.can_shoot = False
-            elif self.state == GameState.PAUSED:
-                if button == GamepadButton.BTN_START:
-                    self.state = GameState.PLAYING
-                elif button == GamepadButton.BTN_B:
-                    # Exit game - for network games, use special handling
-                    if self.is_network_game:
-                        self.exit_network_game()
-                    elif self.is_multiplayer:
-                        # Local multiplayer - return to multiplayer menu
-                        self.state = GameState.MULTIPLAYER_MENU
-                    else:
-                        # Single player - return to appropriate menu
-                        self.music_manager.play_theme()
-                        if self.game_mode == "adventure":
-                            self.state = GameState.ADVENTURE_LEVEL_SELECT
-                        else:
-                            self.state = GameState.MENU
-            elif self.state == GameState.GAME_OVER:
-                # Only allow input after the 3-second timer expires
-                if self.game_over_timer == 0 and button == GamepadButton.BTN_START:
-                    if self.is_network_game:
-                        # Network game - only host can progress
-                        if self.network_manager.is_host():
-                            self.sound_manager.play('blip_select')
-                            return_msg = create_return_to_lobby_message()
-                            self.network_manager.broadcast_to_clients(return_msg)
-                            self.state = GameState.MULTIPLAYER_LOBBY
-                            self.multiplayer_end_timer_phase = 0
-                            self.broadcast_lobby_state()
-                        # Client ignores input - waits for host
-                    elif self.is_multiplayer:
-                        # Local multiplayer - go back to lobby
-                        self.sound_manager.play('blip_select')
-                        self.state = GameState.MULTIPLAYER_LOBBY
-                    elif self.game_mode == "adventure":
-                        # Adventure mode - reset lives and go back to level select
-                        self.sound_manager.play('blip_select')
-                        self.lives = 3
-                        self.music_manager.stop_game_over_music()
-                        self.music_manager.play_theme()
-                        self.state = GameState.ADVENTURE_LEVEL_SELECT
-                        # Clean up memory after game over to prevent slowdown on Pi
-                        gc.collect()
-                    else:
-                        # Endless mode - reset game and go to menu
-                        self.reset_game()
-                        self.state = GameState.MENU
-            elif self.state == GameState.LEVEL_COMPLETE:
-                if button == GamepadButton.BTN_START:
-                    # Adventure mode returns to level select, endless continues to next level
-                    if self.game_mode == "adventure":
-                        self.lives = 3  # Reset lives after completing a level
-                        self.state = GameState.ADVENTURE_LEVEL_SELECT
-                        # Stop victory jingle and start theme music
-                        pygame.mixer.music.stop()
-                        self.music_manager.play_theme()
-                        # Clean up memory between levels to prevent slowdown on Pi
-                        gc.collect()
-                    else:
-                        self.next_level()
-            elif self.state == GameState.CREDITS:
-                if button == GamepadButton.BTN_START or button == GamepadButton.BTN_B:
-                    # Return to extras menu
-                    self.sound_manager.play('blip_select')
-                    self.state = GameState.EXTRAS_MENU
-                    # Play theme music
-                    if not self.music_manager.theme_mode:
-                        self.music_manager.play_theme()
-            elif self.state == GameState.ACHIEVEMENTS:
-                if button == GamepadButton.BTN_START or button == GamepadButton.BTN_B:
-                    self.sound_manager.play('blip_select')
-                    self.state = GameState.EXTRAS_MENU
-            elif self.state == GameState.MUSIC_PLAYER:
-                if button == GamepadButton.BTN_A:
-                    # Play/Pause or select track
-                    self.toggle_music_player_track()
-                elif button == GamepadButton.BTN_L:
-                    # Previous track
-                    self.music_player_previous_track()
-                elif button == GamepadButton.BTN_R:
-                    # Next track
-                    self.music_player_next_track()
-                elif button == GamepadButton.BTN_START or button == GamepadButton.BTN_B:
-                    self.sound_manager.play('blip_select')
-                    self.state = GameState.EXTRAS_MENU
-                    # Stop music player and resume theme
-                    self.music_player_stop()
-                    self.music_manager.play_theme()
-            elif self.state == GameState.LEVEL_EDITOR_MENU:
-                if button == GamepadButton.BTN_START or button == GamepadButton.BTN_B:
-                    self.sound_manager.play('blip_select')
-                    self.state = GameState.EXTRAS_MENU
-            elif self.state == GameState.HIGH_SCORE_ENTRY:
-                if button == GamepadButton.BTN_A:
-                    self.use_onscreen_keyboard()
-                elif button == GamepadButton.BTN_B:
-                    if self.name_index > 0:
-                        self.name_index -= 1
-                elif button == GamepadButton.BTN_START:
-                    name = ''.join(self.player_name)
-                    self.add_high_score(name, self.score)
-                    self.state = GameState.HIGH_SCORES
-            elif self.state == GameState.HIGH_SCORES:
-                if button == GamepadButton.BTN_START:
-                    self.state = GameState.MENU
-            elif self.state == GameState.MULTIPLAYER_MENU:
-                if button == GamepadButton.BTN_START or button == GamepadButton.BTN_A:
-                    if self.multiplayer_menu_selection == 0:
-                        # Same Screen - Go directly to lobby (level selection is in lobby now)
-                        self.sound_manager.play('blip_select')
-                        self.is_multiplayer = True
-                        self.is_network_game = False
-                        self.lobby_settings['level'] = 0  # Default to first level
-                        self.load_selected_multiplayer_level()
-                        self.setup_multiplayer_game()
-                        self.state = GameState.MULTIPLAYER_LOBBY
-                    elif self.multiplayer_menu_selection == 1:
-                        # Network Game - Go to network menu
-                        self.sound_manager.play('blip_select')
-                        self.state = GameState.NETWORK_MENU
-                    elif self.multiplayer_menu_selection == 2:
-                        # Back to main menu
-                        self.sound_manager.play('blip_select')
-                        self.state = GameState.MENU
-                elif button == GamepadButton.BTN_B:
-                    self.sound_manager.play('blip_select')
-                    self.state = GameState.MENU
-            elif self.state == GameState.NETWORK_MENU:
-                if button == GamepadButton.BTN_START or button == GamepadButton.BTN_A:
-                    if self.network_menu_selection == 0:
-                        # Host Game
-                        self.sound_manager.play('blip_select')
-                        success, result = self.network_manager.start_host(max_players=4)
-                        if success:
-                            self.network_host_ip = result
-                            self.network_status_message = f"Hosting on {result}"
-                            self.is_multiplayer = True
-                            self.is_network_game = True
-                            # Initialize default lobby settings
-                            self.player_slots = ['player', 'cpu', 'cpu', 'cpu']  # Host is player 1, rest are CPU
-                            self.lobby_selection = 0
-                            self.lobby_settings['level'] = 0  # Default to first level
-                            self.load_selected_multiplayer_level()  # Load the level data
-                            # Go to multiplayer lobby (setup screen)
-                            self.state = GameState.MULTIPLAYER_LOBBY
-                        else:
-                            self.network_status_message = f"Failed to host: {result}"
-                    elif self.network_menu_selection == 1:
-                        # Join Game - start server discovery and go to server list
-                        self.sound_manager.play('blip_select')
-                        self.network_manager.start_discovery()
-                        self.discovered_servers = []
-                        self.server_selection = 0
-                        self.state = GameState.NETWORK_CLIENT_LOBBY
-                        self.network_status_message = "Searching for LAN servers..."
-                    elif self.network_menu_selection == 2:
-                        # Back
-                        self.sound_manager.play('blip_select')
-                        self.state = GameState.MULTIPLAYER_MENU
-                elif button == GamepadButton.BTN_B:
-                    self.sound_manager.play('blip_select')
-                    self.state = GameState.MULTIPLAYER_MENU
-            elif self.state == GameState.NETWORK_CLIENT_LOBBY:
-                # Server list navigation with gamepad
-                if button == GamepadButton.BTN_START or button == GamepadButton.BTN_A:
-                    # Connect to selected server
-                    if len(self.discovered_servers) > 0 and self.server_selection < len(self.discovered_servers):
-                        self.sound_manager.play('blip_select')
-                        name, ip, port = self.discovered_servers[self.server_selection]
-                        self.network_status_message = f"Connecting to {name}..."
-                        self.network_manager.stop_discovery()
-                        success, result = self.network_manager.connect_to_host(ip)
-                        if success:
-                            self.network_status_message = "Connected! Waiting for host..."
-                            self.is_multiplayer = True
-                            self.is_network_game = True
-                        else:
-                            self.network_status_message = f"Failed: {result}"
-                            self.network_manager.cleanup()
-                            self.network_manager.start_discovery()
-                    else:
-                        self.network_status_message = "No server selected"
-                elif button == GamepadButton.BTN_B:
-                    # Cancel and go back
-                    self.sound_manager.play('blip_select')
-                    self.network_manager.cleanup()
-                    self.state = GameState.NETWORK_MENU
-                elif button == GamepadButton.BTN_Y:
-                    # Refresh server list
-                    self.sound_manager.play('blip_select')
-                    self.network_manager.stop_discovery()
-                    self.network_manager.start_discovery()
-                    self.discovered_servers = []
-                    self.server_selection = 0
-                    self.network_status_message = "Refreshing server list..."
-            elif self.state == GameState.MULTIPLAYER_LOBBY:
-                # Only host can change settings in network games
-                can_change = not self.is_network_game or self.network_manager.is_host()
-                
-                if button == GamepadButton.BTN_START:
-                    # Only host can start game in network mode
-                    if not self.is_network_game or self.network_manager.is_host():
-                        self.sound_manager.play('start_game')
-                        # Start game first (this selects music)
-                        self.music_manager.stop_game_over_music()
-                        self.reset_game()
-                        # Broadcast game start to network clients WITH music track
-                        if self.is_network_game:
-                            num_players = len([s for s in self.player_slots if s != 'off'])
-                            music_track_index = self.music_manager.get_track_index()
-                            start_msg = create_game_start_message(num_players, music_track_index, self.current_level_data)
-                            self.network_manager.broadcast_to_clients(start_msg)
-                elif button == GamepadButton.BTN_A and can_change:
-                    # A button opens level select when on level option, otherwise cycles settings forward
-                    if self.lobby_selection == 3:
-                        self.sound_manager.play('blip_select')
-                        self.level_select_return_state = GameState.MULTIPLAYER_LOBBY
-                        self.multiplayer_level_selection = self.lobby_settings.get('level', 0)
-                        self.state = GameState.MULTIPLAYER_LEVEL_SELECT
-                    else:
-                        self.change_lobby_setting(self.lobby_selection, 1)
-                elif button == GamepadButton.BTN_B:
-                    self.sound_manager.play('blip_select')
-                    # Network clients disconnect, host cancels
-                    if self.is_network_game:
-                        self.network_manager.cleanup()
-                        self.is_network_game = False
-                        self.is_multiplayer = False
-                        self.state = GameState.NETWORK_MENU if self.network_manager.role == NetworkRole.CLIENT else GameState.NETWORK_MENU
-                    else:
-                        self.state = GameState.MULTIPLAYER_MENU
-            elif self.state == GameState.DIFFICULTY_SELECT:
-                if button == GamepadButton.BTN_START:
-                    # Set difficulty and start game
-                    if self.difficulty_selection == 0:
-                        self.difficulty = Difficulty.EASY
-                    elif self.difficulty_selection == 1:
-                        self.difficulty = Difficulty.MEDIUM
-                    else:
-                        self.difficulty = Difficulty.HARD
-                    self.sound_manager.play('start_game')
-                    self.music_manager.stop_game_over_music()
-                    self.reset_game()
-                    # reset_game() already sets state to EGG_HATCHING, don't override it
-            elif self.state == GameState.MULTIPLAYER_LEVEL_SELECT:
-                if button == GamepadButton.BTN_A or button == GamepadButton.BTN_START:
-                    # Select level and return to lobby
-                    if len(self.multiplayer_levels) > 0:
-                        self.sound_manager.play('blip_select')
-                        self.lobby_settings['level'] = self.multiplayer_level_selection
-                        self.load_selected_multiplayer_level()
-                        if self.level_select_return_state:
-                            self.state = self.level_select_return_state
-                            # Broadcast lobby state update if network host
-                            if self.is_network_game and self.network_manager.is_host():
-                                self.broadcast_lobby_state()
-                        else:
-                            self.state = GameState.MULTIPLAYER_LOBBY
-                elif button == GamepadButton.BTN_B:
-                    # Cancel and return to lobby
-                    self.sound_manager.play('blip_select')
-                    if self.level_select_return_state:
-                        self.state = self.level_select_return_state
-                    else:
-                        self.state = GameState.MULTIPLAYER_LOBBY
+            if event.button == GamepadButton.BTN_B and self.state in BACK_STATES:
+                self.go_back()
+            else:
+                button_handler = self.button_handlers.get(self.state)
+                if button_handler:
+                    button_handler(event.button)
+        
+        if event.type == pygame.JOYHATMOTION:
+            # Decoded once for both the steering cache and the menu chain below
+            hat_direction = HAT_DIRECTIONS.get(event.value)
+            if event.hat == 0:
+                # Remember where each pad's D-pad is held for handle_input's steering
+                self.hat_directions[event.instance_id] = hat_direction
         
         if event.type == pygame.JOYHATMOTION and self.joystick:
-            hat = event.value
-            if self.state == GameState.MENU:
-                if hat[1] == 1:
-                    self.menu_selection = (self.menu_selection - 1) % len(self.menu_options)
-                    self.sound_manager.play('blip_select')
-                elif hat[1] == -1:
-                    self.menu_selection = (self.menu_selection + 1) % len(self.menu_options)
-                    self.sound_manager.play('blip_select')
-            elif self.state == GameState.MULTIPLAYER_MENU:
-                if hat[1] == 1:
-                    self.multiplayer_menu_selection = (self.multiplayer_menu_selection - 1) % len(self.multiplayer_menu_options)
-                    self.sound_manager.play('blip_select')
-                elif hat[1] == -1:
-                    self.multiplayer_menu_selection = (self.multiplayer_menu_selection + 1) % len(self.multiplayer_menu_options)
-                    self.sound_manager.play('blip_select')
-            elif self.state == GameState.NETWORK_MENU:
-                if hat[1] == 1:
-                    self.network_menu_selection = (self.network_menu_selection - 1) % len(self.network_menu_options)
-                    self.sound_manager.play('blip_select')
-                elif hat[1] == -1:
-                    self.network_menu_selection = (self.network_menu_selection + 1) % len(self.network_menu_options)
-                    self.sound_manager.play('blip_select')
-            elif self.state == GameState.MULTIPLAYER_LOBBY:
+            state = self.state
+            if state == GameState.MENU:
+                if hat_direction == Direction.UP:
+                    self.step_selection('menu_selection', len(self.menu_options), -1)
+                elif hat_direction == Direction.DOWN:
+                    self.step_selection('menu_selection', len(self.menu_options), 1)
+            elif state == GameState.MULTIPLAYER_MENU:
+                if hat_direction == Direction.UP:
+                    self.step_selection('multiplayer_menu_selection', len(self.multiplayer_menu_options), -1)
+                elif hat_direction == Direction.DOWN:
+                    self.step_selection('multiplayer_menu_selection', len(self.multiplayer_menu_options), 1)
+            elif state == GameState.NETWORK_MENU:
+                if hat_direction == Direction.UP:
+                    self.step_selection('network_menu_selection', len(self.network_menu_options), -1)
+                elif hat_direction == Direction.DOWN:
+                    self.step_selection('network_menu_selection', len(self.network_menu_options), 1)
+            elif state == GameState.MULTIPLAYER_LOBBY:
                 # Only host can navigate and change settings in network games
                 can_change = not self.is_network_game or self.network_manager.is_host()
                 if can_change:
-                    if hat[1] == 1:
-                        self.lobby_selection = (self.lobby_selection - 1) % 8  # 4 settings + 4 players
-                        self.sound_manager.play('blip_select')
-                    elif hat[1] == -1:
-                        self.lobby_selection = (self.lobby_selection + 1) % 8
-                        self.sound_manager.play('blip_select')
-                    elif hat[0] == -1 or hat[0] == 1:
+                    if hat_direction == Direction.UP:
+                        self.step_selection('lobby_selection', 8, -1)  # 4 settings + 4 players
+                    elif hat_direction == Direction.DOWN:
+                        self.step_selection('lobby_selection', 8, 1)
+                    elif hat_direction is not None:
                         # Left/right to change settings
-                        direction = 1 if hat[0] == 1 else -1
+                        direction = 1 if hat_direction == Direction.RIGHT else -1
                         self.change_lobby_setting(self.lobby_selection, direction)
-            elif self.state == GameState.NETWORK_CLIENT_LOBBY:
+            elif state == GameState.NETWORK_CLIENT_LOBBY:
                 # D-pad navigation for server list
-                if hat[1] == 1:
+                if hat_direction == Direction.UP:
                     # Up - navigate up in server list
                     if len(self.discovered_servers) > 0 and self.server_selection > 0:
                         self.server_selection -= 1
-                        self.sound_manager.play('blip_select')
-                elif hat[1] == -1:
+                        self.play_blip()
+                elif hat_direction == Direction.DOWN:
                     # Down - navigate down in server list
                     if len(self.discovered_servers) > 0 and self.server_selection < len(self.discovered_servers) - 1:
                         self.server_selection += 1
-                        self.sound_manager.play('blip_select')
-            elif self.state == GameState.DIFFICULTY_SELECT:
-                if hat[1] == 1:
-                    self.difficulty_selection = (self.difficulty_selection - 1) % 3
-                    self.sound_manager.play('blip_select')
-                elif hat[1] == -1:
-                    self.difficulty_selection = (self.difficulty_selection + 1) % 3
-                    self.sound_manager.play('blip_select')
-            elif self.state == GameState.MULTIPLAYER_LEVEL_SELECT:
+                        self.play_blip()
+            elif state == GameState.DIFFICULTY_SELECT:
+                if hat_direction == Direction.UP:
+                    self.step_selection('difficulty_selection', 3, -1)
+                elif hat_direction == Direction.DOWN:
+                    self.step_selection('difficulty_selection', 3, 1)
+            elif state == GameState.MULTIPLAYER_LEVEL_SELECT:
                 levels_unlocked = self.get_multiplayer_levels_unlocked()
                 max_level = min(levels_unlocked, len(self.multiplayer_levels))
                 if max_level > 0:
-                    if hat[1] == 1:
-                        self.multiplayer_level_selection = (self.multiplayer_level_selection - 1) % max_level
-                        self.sound_manager.play('blip_select')
-                    elif hat[1] == -1:
-                        self.multiplayer_level_selection = (self.multiplayer_level_selection + 1) % max_level
-                        self.sound_manager.play('blip_select')
-            elif self.state == GameState.HIGH_SCORE_ENTRY:
+                    if hat_direction == Direction.UP:
+                        self.step_selection('multiplayer_level_selection', max_level, -1)
+                    elif hat_direction == Direction.DOWN:
+                        self.step_selection('multiplayer_level_selection', max_level, 1)
+            elif state == GameState.HIGH_SCORE_ENTRY:
+                # The letter grid checks horizontal first, so it reads the raw hat value
+                hat = event.value
                 if hat[0] == -1:
                     self.keyboard_selection[1] = max(0, self.keyboard_selection[1] - 1)
-                    self.sound_manager.play('blip_select')
+                    self.play_blip()
                 elif hat[0] == 1:
                     self.keyboard_selection[1] = min(9, self.keyboard_selection[1] + 1)
-                    self.sound_manager.play('blip_select')
+                    self.play_blip()
                 elif hat[1] == 1:
                     self.keyboard_selection[0] = max(0, self.keyboard_selection[0] - 1)
-                    self.sound_manager.play('blip_select')
+                    self.play_blip()
                 elif hat[1] == -1:
                     self.keyboard_selection[0] = min(3, self.keyboard_selection[0] + 1)
-                    self.sound_manager.play('blip_select')
+                    self.play_blip()
         
         # CRITICAL: Consume ALL gamepad events to prevent passthrough to EmulationStation
         # This includes axis motion, button presses, hat motion, etc.
@@ -5975,33 +5648,34 @@ class SnakeGame:
         return True
     
     def handle_high_score_keyboard(self, event):
-        if event.key == pygame.K_BACKSPACE:
+        key = event.key
+        if key == pygame.K_BACKSPACE:
             if self.name_index > 0:
                 self.name_index -= 1
                 self.player_name[self.name_index] = 'A'
-                self.sound_manager.play('blip_select')
-        elif event.key == pygame.K_LEFT:
+                self.play_blip()
+        elif key == pygame.K_LEFT:
             if self.name_index > 0:
                 self.name_index -= 1
-                self.sound_manager.play('blip_select')
-        elif event.key == pygame.K_RIGHT:
+                self.play_blip()
+        elif key == pygame.K_RIGHT:
             if self.name_index < 2:
                 self.name_index += 1
-                self.sound_manager.play('blip_select')
-        elif event.key == pygame.K_UP:
+                self.play_blip()
+        elif key == pygame.K_UP:
             # Optional: Navigate onscreen keyboard
             self.keyboard_selection[0] = max(0, self.keyboard_selection[0] - 1)
-            self.sound_manager.play('blip_select')
-        elif event.key == pygame.K_DOWN:
+            self.play_blip()
+        elif key == pygame.K_DOWN:
             # Optional: Navigate onscreen keyboard
             self.keyboard_selection[0] = min(3, self.keyboard_selection[0] + 1)
-            self.sound_manager.play('blip_select')
-        elif event.key == pygame.K_RETURN:
+            self.play_blip()
+        elif key == pygame.K_RETURN:
             self.sound_manager.play('select_letter')
             name = ''.join(self.player_name)
             self.add_high_score(name, self.score)
             self.state = GameState.HIGH_SCORES
-        elif event.key == pygame.K_SPACE:
+        elif key == pygame.K_SPACE:
             # Use onscreen keyboard selection
             self.use_onscreen_keyboard()
         elif event.unicode.isalnum() and len(event.unicode) == 1:
@@ -6017,11 +5691,11 @@ class SnakeGame:
         if char == '<':
             if self.name_index > 0:
                 self.name_index -= 1
-                self.sound_manager.play('blip_select')
+                self.play_blip()
         elif char == '>':
             if self.name_index < 2:
                 self.name_index += 1
-                self.sound_manager.play('blip_select')
+                self.play_blip()
         elif char != ' ':
             self.sound_manager.play('select_letter')
             self.player_name[self.name_index] = char
@@ -6031,17 +5705,17 @@ class SnakeGame:
     def select_menu_option(self):
         if self.menu_selection == 0:
             # Single Player - Go to single player submenu
-            self.sound_manager.play('blip_select')
+            self.play_blip()
             self.state = GameState.SINGLE_PLAYER_MENU
             self.single_player_selection = 0
         elif self.menu_selection == 1:
             # Multiplayer - Go to multiplayer menu
-            self.sound_manager.play('blip_select')
+            self.play_blip()
             self.state = GameState.MULTIPLAYER_MENU
             self.multiplayer_menu_selection = 0
         elif self.menu_selection == 2:
             # Extras - Go to extras menu
-            self.sound_manager.play('blip_select')
+            self.play_blip()
             self.state = GameState.EXTRAS_MENU
             self.extras_menu_selection = 0
         elif self.menu_selection == 3:
@@ -6054,7 +5728,7 @@ class SnakeGame:
         """Handle single player submenu selection"""
         if self.single_player_selection == 0:
             # Adventure Mode - Check if intro has been seen
-            self.sound_manager.play('blip_select')
+            self.play_blip()
             self.game_mode = "adventure"
             self.is_multiplayer = False
             
@@ -6066,36 +5740,109 @@ class SnakeGame:
                 self.adventure_level_selection = 0
         elif self.single_player_selection == 1:
             # Endless Mode - Go to difficulty selection
-            self.sound_manager.play('blip_select')
+            self.play_blip()
             self.game_mode = "endless"
             self.is_multiplayer = False
             self.state = GameState.DIFFICULTY_SELECT
         elif self.single_player_selection == 2:
             # Back to main menu
-            self.sound_manager.play('blip_select')
+            self.play_blip()
             self.state = GameState.MENU
     
     def select_extras_option(self):
         """Handle extras submenu selection"""
         if self.extras_menu_selection == 0:
             # Achievements
-            self.sound_manager.play('blip_select')
+            self.play_blip()
             self.state = GameState.ACHIEVEMENTS
         elif self.extras_menu_selection == 1:
             # Music Player
-            self.sound_manager.play('blip_select')
+            self.play_blip()
             self.state = GameState.MUSIC_PLAYER
             # Stop theme music when entering music player
             self.music_manager.stop_theme()
         elif self.extras_menu_selection == 2:
             # Credits
-            self.sound_manager.play('blip_select')
+            self.play_blip()
             self.state = GameState.CREDITS
         elif self.extras_menu_selection == 3:
             # Back to main menu
-            self.sound_manager.play('blip_select')
+            self.play_blip()
+            self.state = GameState.MENU
+    
+    def select_multiplayer_menu_option(self):
+        """Handle multiplayer menu selection"""
+        if self.multiplayer_menu_selection == 0:
+            # Same Screen - Go directly to lobby (level selection is in lobby now)
+            self.play_blip()
+            self.is_multiplayer = True
+            self.is_network_game = False
+            self.lobby_settings['level'] = 0  # Default to first level
+            self.load_selected_multiplayer_level()
+            self.setup_multiplayer_game()
+            self.state = GameState.MULTIPLAYER_LOBBY
+        elif self.multiplayer_menu_selection == 1:
+            # Network Game - Go to network menu
+            self.play_blip()
+            self.state = GameState.NETWORK_MENU
+        elif self.multiplayer_menu_selection == 2:
+            # Back to main menu
+            self.play_blip()
             self.state = GameState.MENU
     
+    def select_network_menu_option(self):
+        """Handle network menu selection"""
+        if self.network_menu_selection == 0:
+            # Host Game
+            self.play_blip()
+            success, result = self.network_manager.start_host(max_players=4)
+            if success:
+                self.network_host_ip = result
+                self.network_status_message = f"Hosting on {result}"
+                self.is_multiplayer = True
+                self.is_network_game = True
+                # Initialize default lobby settings
+                self.player_slots = ['player', 'cpu', 'cpu', 'cpu']  # Host is player 1, rest are CPU
+                self.lobby_selection = 0
+                self.lobby_settings['level'] = 0  # Default to first level
+                self.load_selected_multiplayer_level()  # Load the level data
+                # Go to multiplayer lobby (setup screen)
+                self.state = GameState.MULTIPLAYER_LOBBY
+            else:
+                self.network_status_message = f"Failed to host: {result}"
+        elif self.network_menu_selection == 1:
+            # Join Game - start server discovery and go to server list
+            self.play_blip()
+            self.network_manager.start_discovery()
+            self.discovered_servers = []
+            self.server_selection = 0
+            self.state = GameState.NETWORK_CLIENT_LOBBY
+            self.network_status_message = "Searching for LAN servers..."
+        elif self.network_menu_selection == 2:
+            # Back
+            self.play_blip()
+            self.state = GameState.MULTIPLAYER_MENU
+    
+    def connect_to_selected_server(self):
+        """Join the LAN server highlighted in the join screen's list"""
+        if len(self.discovered_servers) > 0 and self.server_selection < len(self.discovered_servers):
+            self.play_blip()
+            name, ip, port = self.discovered_servers[self.server_selection]
+            self.network_status_message = f"Connecting to {name}..."
+            self.network_manager.stop_discovery()
+            success, result = self.network_manager.connect_to_host(ip)
+            if success:
+                self.network_status_message = "Connected! Waiting for host..."
+                self.is_multiplayer = True
+                self.is_network_game = True
+            else:
+                self.network_status_message = f"Failed: {result}"
+                self.network_manager.cleanup()
+                # Restart discovery
+                self.network_manager.start_discovery()
+        else:
+            self.network_status_message = "No server selected"
+    
     def toggle_music_player_track(self):
         """Play or pause the selected track in the music player, or purchase if locked."""
         if len(self.music_player_tracks) == 0:
@@ -6116,7 +5863,7 @@ class SnakeGame:
                 self.music_player_playing = True
             else:
                 # Not enough coins
-                self.sound_manager.play('blip_select')
+                self.play_blip()
             return
         
         # If currently playing
@@ -6125,36 +5872,35 @@ class SnakeGame:
             if self.music_player_current_track == self.music_player_selection:
                 pygame.mixer.music.pause()
                 self.music_player_playing = False
-                self.sound_manager.play('blip_select')
+                self.play_blip()
             else:
                 # Different track selected, play it
                 pygame.mixer.music.load(track_path)
                 pygame.mixer.music.play()  # Play once (will auto-advance)
                 self.music_player_current_track = self.music_player_selection
                 self.music_player_playing = True
-                self.sound_manager.play('blip_select')
+                self.play_blip()
         else:
             # Not playing - check if we're resuming or starting new
             if self.music_player_current_track == self.music_player_selection:
                 # Resume the paused track
                 pygame.mixer.music.unpause()
                 self.music_player_playing = True
-                self.sound_manager.play('blip_select')
+                self.play_blip()
             else:
                 # Start playing the selected track
                 pygame.mixer.music.load(track_path)
                 pygame.mixer.music.play()  # Play once (will auto-advance)
                 self.music_player_current_track = self.music_player_selection
                 self.music_player_playing = True
-                self.sound_manager.play('blip_select')
+                self.play_blip()
     
     def music_player_previous_track(self):
         """Skip to the previous track."""
         if len(self.music_player_tracks) == 0:
             return
         
-        self.music_player_selection = (self.music_player_selection - 1) % len(self.music_player_tracks)
-        self.sound_manager.play('blip_select')
+        self.step_selection('music_player_selection', len(self.music_player_tracks), -1)
         
         # If music is playing, auto-play the new track (only if unlocked)
         if self.music_player_playing:
@@ -6186,7 +5932,7 @@ class SnakeGame:
                     pygame.mixer.music.load(track_path)
                     pygame.mixer.music.play()  # Play once (will auto-advance)
                     self.music_player_current_track = self.music_player_selection
-                    self.sound_manager.play('blip_select')
+                    self.play_blip()
                     return
                 
                 attempts += 1
@@ -6196,8 +5942,7 @@ class SnakeGame:
             pygame.mixer.music.stop()
         else:
             # Manual skip, just move selection
-            self.music_player_selection = (self.music_player_selection + 1) % len(self.music_player_tracks)
-            self.sound_manager.play('blip_select')
+            self.step_selection('music_player_selection', len(self.music_player_tracks), 1)
     
     def music_player_stop(self):
         """Stop the music player."""
@@ -6231,7 +5976,7 @@ class SnakeGame:
             self.current_adventure_level = level_number
             
             # Parse level data
-            self.level_walls = [(w['x'], w['y']) for w in self.current_level_data['walls']]
+            self.level_walls = {(w['x'], w['y']) for w in self.current_level_data['walls']}
             self.worms_required = self.current_level_data['worms_required']
             self.worms_collected = 0
             self.bonus_fruits_collected = 0
@@ -6292,6 +6037,8 @@ class SnakeGame:
             if 'isotope_positions' in self.current_level_data:
                 for isotope_data in self.current_level_data['isotope_positions']:
                     self.food_items.append(((isotope_data['x'], isotope_data['y']), 'isotope'))
+            self.isotope_count = sum(1 for _, food_type in self.food_items if food_type == 'isotope')
+            self.food_by_pos = dict(self.food_items)
             
             # Load enemies (if any)
             self.enemies = []
@@ -6329,6 +6076,7 @@ class SnakeGame:
                         snake_enemy.move_timer = 0
                         snake_enemy.last_move_interval = 16
                         snake_enemy.previous_body = snake_enemy.body.copy()
+                        snake_enemy.bounds = snake_enemy.get_bounds()  # Broad-phase box for player collision
                         self.enemy_snakes.append(snake_enemy)
                         print("Spawned enemy snake at {} with length {}".format(spawn_pos, len(snake_enemy.body)))
                     else:
@@ -6348,8 +6096,7 @@ class SnakeGame:
             self.boss_death_phase = 0
             self.boss_death_timer = 0
             self.boss_death_particle_timer = 0
-            if hasattr(self, 'boss_death_phase1_timer'):
-                del self.boss_death_phase1_timer
+            self.boss_death_phase1_timer = None
             
             # Handle boss battle data
             if 'boss_data' in self.current_level_data and self.current_level_data['boss_data']:
@@ -6379,10 +6126,9 @@ class SnakeGame:
                 self.boss_death_particle_timer = 0
                 self.boss_slide_offset_y = 0
                 self.boss_slide_timer = 0
-                if hasattr(self, 'boss_death_phase1_timer'):
-                    del self.boss_death_phase1_timer
+                self.boss_death_phase1_timer = None
                 # Reset super attack tracking
-                self.boss_super_attacks_used = set()
+                self.boss_super_attacks_used = 0
                 
                 # If it's a wormBoss (FINAL BOSS), play epic FinalBoss music
                 if self.boss_data == 'wormBoss':
@@ -6449,7 +6195,7 @@ class SnakeGame:
             return False
     def change_lobby_setting(self, selection, direction):
         """Change a lobby setting or player slot."""
-        self.sound_manager.play('blip_select')
+        self.play_blip()
         
         if selection == 0:
             # Lives
@@ -6536,6 +6282,8 @@ class SnakeGame:
         
         # Initialize food
         self.food_items = []
+        self.food_by_pos = {}
+        self.isotope_count = 0
         self.respawning_players = {}
         
         # Set first snake for backwards compatibility
@@ -6586,9 +6334,9 @@ class SnakeGame:
             # Apply loaded multiplayer level data if available
             if hasattr(self, 'current_level_data') and self.current_level_data:
                 # Load walls from level
-                self.walls = []
+                self.walls = set()
                 for wall in self.current_level_data.get('walls', []):
-                    self.walls.append((wall['x'], wall['y']))
+                    self.walls.add((wall['x'], wall['y']))
                 
                 # Load background
                 bg_image = self.current_level_data.get('background_image', 'bg.png')
@@ -6603,10 +6351,12 @@ class SnakeGame:
                 print("Applied multiplayer level: {} walls, background: {}".format(len(self.walls), bg_image))
             else:
                 # No level loaded, use default (no walls)
-                self.walls = []
+                self.walls = set()
             
             # Initialize multiplayer food based on settings
             self.food_items = []
+            self.food_by_pos = {}
+            self.isotope_count = 0
             freq = self.lobby_settings['item_frequency']
             
             if freq == 0:  # Low
@@ -6660,7 +6410,7 @@ class SnakeGame:
         self.bullets = []
         self.spewtums = []
         self.enemy_walls = []
-        self.level_walls = []
+        self.level_walls = set()
         
         # In multiplayer, skip egg hatching and go straight to playing
         if self.is_multiplayer:
@@ -6679,8 +6429,8 @@ class SnakeGame:
         
         # Reset snake with chosen direction
         # Check if we have a boss egg respawn position (random position after death)
-        if (hasattr(self, 'boss_egg_respawn_pos') and self.boss_egg_respawn_pos is not None and 
-            hasattr(self, 'boss_egg_is_respawn') and self.boss_egg_is_respawn):
+        if (self.boss_egg_respawn_pos is not None and 
+            self.boss_egg_is_respawn):
             start_pos = tuple(self.boss_egg_respawn_pos)
             self.snake.reset(spawn_pos=start_pos, direction=direction)
         # In adventure mode, use the level's starting position
@@ -6694,16 +6444,14 @@ class SnakeGame:
         
         # Create flying egg pieces
         # Check if we have a boss egg respawn position (random position after death)
-        if (hasattr(self, 'boss_egg_respawn_pos') and self.boss_egg_respawn_pos is not None and 
-            hasattr(self, 'boss_egg_is_respawn') and self.boss_egg_is_respawn):
+        if (self.boss_egg_respawn_pos is not None and 
+            self.boss_egg_is_respawn):
             egg_x, egg_y = self.boss_egg_respawn_pos
-            center_x = egg_x * GRID_SIZE + GRID_SIZE // 2
-            center_y = egg_y * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y
+            center_x, center_y = grid_to_pixel_center(egg_x, egg_y)
         # In adventure mode, spawn pieces at the starting position
         elif self.game_mode == "adventure" and hasattr(self, 'current_level_data'):
             egg_x, egg_y = self.current_level_data['starting_position']
-            center_x = egg_x * GRID_SIZE + GRID_SIZE // 2
-            center_y = egg_y * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y
+            center_x, center_y = grid_to_pixel_center(egg_x, egg_y)
         else:
             center_x = SCREEN_WIDTH // 2
             center_y = SCREEN_HEIGHT // 2
@@ -6722,10 +6470,8 @@ class SnakeGame:
                 self.egg_pieces.append(piece)
         
         # Reset boss egg respawn flag, position, and timer
-        if hasattr(self, 'boss_egg_is_respawn'):
-            self.boss_egg_is_respawn = False
-        if hasattr(self, 'boss_egg_respawn_pos'):
-            self.boss_egg_respawn_pos = None
+        self.boss_egg_is_respawn = False
+        self.boss_egg_respawn_pos = None
         self.egg_timer = 0
         
         # Transition to playing - start gameplay music
@@ -7186,7 +6932,7 @@ class SnakeGame:
                 # Check if game is in progress - send spectator mode message
                 if self.state == GameState.PLAYING and self.network_manager.is_host():
                     print(f"Game in progress - Player {player_id + 1} joins as spectator")
-                    walls = getattr(self, 'walls', [])
+                    walls = list(getattr(self, 'walls', []))  # Sets don't serialize
                     progress_msg = create_game_in_progress_message(self.snakes, self.food_items, walls)
                     self.network_manager.send_to_client(player_id - 1, progress_msg)
                 else:
@@ -7267,27 +7013,34 @@ class SnakeGame:
             
             # Check if this player is in an egg (respawning)
             if player_id in self.respawning_players:
-                print(f"Host received HATCH input from player {player_id}: {direction.name}")  # DEBUG
+                if DEBUG_NETWORK:
+                    print(f"Host received HATCH input from player {player_id}: {direction.name}")
                 egg_data = self.respawning_players[player_id]
                 # Respawn the player with chosen direction
-                self.respawn_player(player_id, egg_data['pos'], direction)
-                print(f"  -> Player {player_id} hatched!")  # DEBUG
+                self.respawn_player(player_id, egg_data.pos, direction)
+                if DEBUG_NETWORK:
+                    print(f"  -> Player {player_id} hatched!")
                 return
             
-            print(f"Host received input from player {player_id}: {direction.name}, current dir: {snake.direction.name}")  # DEBUG
+            if DEBUG_NETWORK:
+                print(f"Host received input from player {player_id}: {direction.name}, current dir: {snake.direction.name}")
             # Only update if it's a valid direction change (not opposite)
             if direction == Direction.UP and snake.direction != Direction.DOWN:
                 snake.next_direction = direction
-                print(f"  -> Applied UP to player {player_id}")  # DEBUG
+                if DEBUG_NETWORK:
+                    print(f"  -> Applied UP to player {player_id}")
             elif direction == Direction.DOWN and snake.direction != Direction.UP:
                 snake.next_direction = direction
-                print(f"  -> Applied DOWN to player {player_id}")  # DEBUG
+                if DEBUG_NETWORK:
+                    print(f"  -> Applied DOWN to player {player_id}")
             elif direction == Direction.LEFT and snake.direction != Direction.RIGHT:
                 snake.next_direction = direction
-                print(f"  -> Applied LEFT to player {player_id}")  # DEBUG
+                if DEBUG_NETWORK:
+                    print(f"  -> Applied LEFT to player {player_id}")
             elif direction == Direction.RIGHT and snake.direction != Direction.LEFT:
                 snake.next_direction = direction
-                print(f"  -> Applied RIGHT to player {player_id}")  # DEBUG
+                if DEBUG_NETWORK:
+                    print(f"  -> Applied RIGHT to player {player_id}")
     
     def send_input_to_host(self, direction):
         """Client sends input to the host"""
@@ -7300,12 +7053,34 @@ class SnakeGame:
             return
         
         message = create_input_message(self.network_player_id, direction.name)
-        print(f"Sending to network_manager: {message}")  # DEBUG
+        if DEBUG_NETWORK:
+            print(f"Sending to network_manager: {message}")
         self.network_manager.send_to_host(message)
-        print(f"Message sent to host")  # DEBUG
+        if DEBUG_NETWORK:
+            print(f"Message sent to host")
+    
+    def refresh_server_list(self):
+        """Restart LAN discovery, at most once per DISCOVERY_REFRESH_MIN_MS however fast it's pressed"""
+        now = pygame.time.get_ticks()
+        if now - self.last_discovery_refresh_time < DISCOVERY_REFRESH_MIN_MS:
+            return
+        self.last_discovery_refresh_time = now
+        self.play_blip()
+        self.network_manager.stop_discovery()
+        self.network_manager.start_discovery()
+        self.discovered_servers = []
+        self.server_selection = 0
+        self.network_status_message = "Refreshing server list..."
     
     def broadcast_lobby_state(self):
-        """Host broadcasts lobby state to all clients"""
+        """Host queues a lobby state broadcast; run() sends one per frame however many changes asked for it"""
+        self.lobby_state_pending = True
+    
+    def flush_lobby_state(self):
+        """Send the queued lobby state to all clients, if any"""
+        if not self.lobby_state_pending:
+            return
+        self.lobby_state_pending = False
         if not self.network_manager.is_host():
             return
         
@@ -7313,6 +7088,26 @@ class SnakeGame:
         message = create_lobby_state_message(self.player_slots, self.lobby_settings, num_connected, self.network_host_ip)
         self.network_manager.broadcast_to_clients(message)
     
+    def update_discovered_servers(self):
+        """Re-snapshot the LAN server list, but only when the discovery thread has changed it"""
+        version = self.network_manager.get_discovered_servers_version()
+        if version == self.discovered_servers_version:
+            return
+        self.discovered_servers_version = version
+        self.discovered_servers = self.network_manager.get_discovered_servers()
+        # Keep the selection on the list when servers drop off
+        if self.server_selection >= len(self.discovered_servers):
+            self.server_selection = max(0, len(self.discovered_servers) - 1)
+    
+    def broadcast_game_start(self, num_players):
+        """Host tells all clients to start, with the chosen music track and level"""
+        self.flush_lobby_state()  # Clients must see the final lobby before the start
+        music_track_index = self.music_manager.get_track_index()
+        if DEBUG_NETWORK:
+            print(f"[HOST] Broadcasting game start with music_track_index: {music_track_index}")
+        start_msg = create_game_start_message(num_players, music_track_index, self.current_level_data)
+        self.network_manager.broadcast_to_clients(start_msg)
+    
     def broadcast_game_state(self):
         """Host broadcasts current game state to all clients"""
         if not self.network_manager.is_host():
@@ -7377,10 +7172,7 @@ class SnakeGame:
                     # Snake just died - play death sound and spawn particles
                     self.sound_manager.play('die')
                     # Spawn white particles on all body segments
-                    for segment_x, segment_y in snake.body if snake.body else new_body:
-                        self.create_particles(segment_x * GRID_SIZE + GRID_SIZE // 2,
-                                            segment_y * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y,
-                                            None, None, particle_type='white')
+                    self.create_particles_batch(snake.body if snake.body else new_body, particle_type='white')
                 
                 # Update authoritative state (used as fallback and for game logic)
                 snake.body = new_body
@@ -7423,32 +7215,26 @@ class SnakeGame:
                                 # Create particles and play sound based on food type
                                 if food_type == 'worm':
                                     self.sound_manager.play('eat_fruit')
-                                    self.create_particles(fx * GRID_SIZE + GRID_SIZE // 2,
-                                                        fy * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y, RED, 10)
+                                    self.create_particles(*grid_to_pixel_center(fx, fy), RED, 10)
                                 elif food_type == 'apple':
                                     self.sound_manager.play('powerup')
-                                    self.create_particles(fx * GRID_SIZE + GRID_SIZE // 2,
-                                                        fy * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y,
+                                    self.create_particles(*grid_to_pixel_center(fx, fy),
                                                         None, None, particle_type='rainbow')
                                 elif food_type == 'black_apple':
                                     self.sound_manager.play('power_down')
-                                    self.create_particles(fx * GRID_SIZE + GRID_SIZE // 2,
-                                                        fy * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y,
+                                    self.create_particles(*grid_to_pixel_center(fx, fy),
                                                         None, None, particle_type='white')
                                 break  # Only trigger once per food item
         
         self.food_items = new_food_items
+        self.food_by_pos = dict(new_food_items)
         
         # Update respawning players (eggs)
         egg_data = message.get('respawning_players', [])
         self.respawning_players = {}
         for egg in egg_data:
             player_id = egg.get('player_id')
-            self.respawning_players[player_id] = {
-                'pos': tuple(egg.get('pos')),
-                'timer': egg.get('timer', 0),
-                'direction': None
-            }
+            self.respawning_players[player_id] = RespawnEgg(tuple(egg.get('pos')), egg.get('timer', 0))
     
     def handle_network_game_start(self, message):
         """Client handles game start message from host"""
@@ -7467,7 +7253,7 @@ class SnakeGame:
         # Initialize client game state with level data from host
         # Load walls from message - walls come as dicts with 'x' and 'y' keys
         walls_data = message.get('walls', [])
-        self.walls = [(int(w['x']), int(w['y'])) for w in walls_data]
+        self.walls = {(int(w['x']), int(w['y'])) for w in walls_data}
         print(f"[CLIENT] Loaded {len(self.walls)} walls from host")
         
         # Load background from message (backgrounds are in img/bg/ folder)
@@ -7481,6 +7267,8 @@ class SnakeGame:
             print(f"[CLIENT] Could not load background {bg_filename}: {e}")
         
         self.food_items = []
+        self.food_by_pos = {}
+        self.isotope_count = 0
         self.particles = []
         self.bullets = []
         self.respawning_players = {}
@@ -7499,13 +7287,15 @@ class SnakeGame:
         
         # Setup player controllers (keyboard for client)
         self.player_controllers = [('keyboard', 0)] * num_players
+        self.build_controller_inputs()
         
         self.state = GameState.PLAYING
         
         # Sync music with host - check for track BEFORE stopping game over music
         # (stop_game_over_music calls play_next internally which we want to avoid)
         music_track_index = message.get('music_track')
-        print(f"[CLIENT] Received music_track_index: {music_track_index}")  # DEBUG
+        if DEBUG_NETWORK:
+            print(f"[CLIENT] Received music_track_index: {music_track_index}")
         
         # Stop any game over music without starting new music
         if self.music_manager.game_over_mode:
@@ -7514,10 +7304,12 @@ class SnakeGame:
         
         # Now play the correct music by index (uses client's local paths)
         if music_track_index is not None:
-            print(f"[CLIENT] Playing track by index: {music_track_index}")  # DEBUG
+            if DEBUG_NETWORK:
+                print(f"[CLIENT] Playing track by index: {music_track_index}")
             self.music_manager.play_by_index(music_track_index)
         else:
-            print("[CLIENT] No music track received, playing random")  # DEBUG
+            if DEBUG_NETWORK:
+                print("[CLIENT] No music track received, playing random")
             if self.music_manager.theme_mode:
                 pygame.mixer.music.stop()
                 self.music_manager.theme_mode = False
@@ -7551,10 +7343,7 @@ class SnakeGame:
                 self.sound_manager.play('die')
                 
                 # Spawn death particles
-                for segment_x, segment_y in snake.body:
-                    self.create_particles(segment_x * GRID_SIZE + GRID_SIZE // 2,
-                                        segment_y * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y, 
-                                        None, None, particle_type='white')
+                self.create_particles_batch(snake.body, particle_type='white')
             
             # Remove from respawning if they were in an egg
             if player_id in self.respawning_players:
@@ -7635,19 +7424,43 @@ class SnakeGame:
     
     def run(self):
         running = True
+        # The queue is drained with one event.get() per frame; bind the per-event
+        # handler once rather than looking it up for every event
+        handle_event = self.handle_event
         while running:
+            # Input handling and drawing both work from this frame's server-list snapshot
+            if self.state == GameState.NETWORK_CLIENT_LOBBY:
+                self.update_discovered_servers()
+            
+            # Only name entry reads typed characters; keep TEXTINPUT out of the queue elsewhere
+            text_entry = self.state == GameState.HIGH_SCORE_ENTRY
+            if text_entry != self.text_input_allowed:
+                self.text_input_allowed = text_entry
+                if text_entry:
+                    pygame.event.set_allowed(pygame.TEXTINPUT)
+                else:
+                    pygame.event.set_blocked(pygame.TEXTINPUT)
+            
             for event in pygame.event.get():
-                if not self.handle_event(event):
+                if not handle_event(event):
                     running = False
             
             self.handle_input()
             
+            # One blip for however many menu moves this frame's input made
+            if self.blip_pending:
+                self.blip_pending = False
+                self.sound_manager.play_blip()
+            
             # Process network messages (if in network game)
             if self.is_network_game:
                 self.process_network_messages()
                 # Check client connection health
                 self.check_client_connection()
             
+            # One lobby_state message for however many lobby changes this frame made
+            self.flush_lobby_state()
+            
             # Handle splash screen timer
             if self.state == GameState.SPLASH:
                 current_time = pygame.time.get_ticks()
@@ -7669,13 +7482,13 @@ class SnakeGame:
             
             if self.state == GameState.EGG_HATCHING:
                 # In boss mode, give player 5 seconds to choose direction (after death, not initial spawn)
-                if hasattr(self, 'boss_active') and self.boss_active:
+                if self.boss_active:
                     # Check if this is a respawn (not the initial spawn)
-                    is_respawn = hasattr(self, 'boss_egg_is_respawn') and self.boss_egg_is_respawn
+                    is_respawn = self.boss_egg_is_respawn
                     
                     if is_respawn:
                         # Give player 5 seconds to choose a direction
-                        self.egg_timer = getattr(self, 'egg_timer', 0) + 1
+                        self.egg_timer = self.egg_timer + 1
                         if self.egg_timer >= 300:  # 5 seconds at 60 FPS
                             # Auto-hatch facing right after 5 seconds
                             self.hatch_egg(Direction.RIGHT)
@@ -7686,20 +7499,17 @@ class SnakeGame:
                         self.hatch_egg(Direction.RIGHT)
                 
                 # Update particles (death particles from previous life)
-                self.particles = [p for p in self.particles if p.is_alive()]
-                for particle in self.particles:
-                    particle.update()
+                self.particles = update_entities(self.particles)
                 
                 # Update egg pieces and animations while waiting for player input
-                self.egg_pieces = [p for p in self.egg_pieces if p.is_alive()]
-                for piece in self.egg_pieces:
-                    piece.update()
+                self.egg_pieces = update_entities(self.egg_pieces)
                 
-                # Update worm animation
-                if self.worm_frames:
-                    self.worm_animation_counter += 1
+                # Update worm animation (idle tick rate; carry the remainder to keep the speed)
+                self.idle_frame_count += 1
+                if self.worm_frames and self.idle_frame_count % IDLE_ANIMATION_TICK == 0:
+                    self.worm_animation_counter += IDLE_ANIMATION_TICK
                     if self.worm_animation_counter >= self.worm_animation_speed:
-                        self.worm_animation_counter = 0
+                        self.worm_animation_counter -= self.worm_animation_speed
                         self.worm_frame_index = (self.worm_frame_index + 1) % len(self.worm_frames)
                 
                 # Update music - LEVEL_COMPLETE is a menu state (returning to menus)
@@ -7902,7 +7712,7 @@ class SnakeGame:
         self.screen.blit(title, title_rect)
         
         # Draw level grid (8 columns x 4 rows for 32 levels)
-        cols = 8
+        cols = LEVEL_SELECT_COLUMNS
         rows = 4
         cell_size = 25  # Halved from 50
         spacing = 5  # Halved from 10
@@ -8166,9 +7976,7 @@ class SnakeGame:
             wait_rect = wait_text.get_rect(center=(SCREEN_WIDTH // 2, 120))
             self.screen.blit(wait_text, wait_rect)
         else:
-            # Not connected - show server list from LAN discovery
-            # Update discovered servers from network manager
-            self.discovered_servers = self.network_manager.get_discovered_servers()
+            # Not connected - show server list from LAN discovery (snapshot taken in run())
             
             prompt_text = self.font_medium.render("LAN Servers:", True, BLACK)
             prompt_rect = prompt_text.get_rect(center=((SCREEN_WIDTH // 2)+1, 51))
@@ -8569,6 +8377,10 @@ class SnakeGame:
         # Player slots (starting at selection index 4)
         # Use hatchling heads with input icons
         head_size = 24  # Halved from 48 for 240x240 resolution
+        # Network role and client count are fixed for the frame; read them once, not per slot
+        is_network_host = self.is_network_game and self.network_manager.is_host()
+        is_network_client = self.is_network_game and self.network_manager.is_client()
+        connected_players = self.network_manager.get_connected_players() if is_network_host else 0
         for i in range(4):
             player_name = self.player_names[i]
             player_color = self.player_colors[i]
@@ -8614,9 +8426,9 @@ class SnakeGame:
                 # For network games, connected players get gamepad icon
                 if self.is_network_game:
                     # Host (player 0) or connected clients show gamepad icon
-                    if i == 0 or (self.network_manager.is_host() and i < self.network_manager.get_connected_players()):
+                    if i == 0 or (is_network_host and i < connected_players):
                         icon = self.gamepad_icon
-                    elif self.network_manager.is_client() and i < self.num_players:
+                    elif is_network_client and i < self.num_players:
                         # Clients see gamepad icons for all active players
                         icon = self.gamepad_icon
                     else:
@@ -8725,18 +8537,18 @@ class SnakeGame:
         # Draw egg at starting position (adventure mode) or center (endless mode)
         if self.egg_img:
             # Check if we have a boss egg respawn position (random position after death)
-            if (hasattr(self, 'boss_egg_respawn_pos') and self.boss_egg_respawn_pos is not None and 
-                hasattr(self, 'boss_egg_is_respawn') and self.boss_egg_is_respawn):
+            if (self.boss_egg_respawn_pos is not None and 
+                self.boss_egg_is_respawn):
                 egg_x, egg_y = self.boss_egg_respawn_pos
                 # Center the 2x2 egg over the spawn point
-                egg_pixel_x = egg_x * GRID_SIZE - GRID_SIZE // 2
-                egg_pixel_y = egg_y * GRID_SIZE + GAME_OFFSET_Y - GRID_SIZE // 2
+                egg_pixel_x = egg_x * GRID_SIZE - HALF_GRID
+                egg_pixel_y = egg_y * GRID_SIZE + GAME_OFFSET_Y - HALF_GRID
             elif self.game_mode == "adventure" and hasattr(self, 'current_level_data'):
                 # Use level's starting position
                 egg_x, egg_y = self.current_level_data['starting_position']
                 # Center the 2x2 egg over the 1x1 spawn point
-                egg_pixel_x = egg_x * GRID_SIZE - GRID_SIZE // 2
-                egg_pixel_y = egg_y * GRID_SIZE + GAME_OFFSET_Y - GRID_SIZE // 2
+                egg_pixel_x = egg_x * GRID_SIZE - HALF_GRID
+                egg_pixel_y = egg_y * GRID_SIZE + GAME_OFFSET_Y - HALF_GRID
             else:
                 # Default to center for endless mode
                 egg_pixel_x = SCREEN_WIDTH // 2 - GRID_SIZE
@@ -8745,9 +8557,9 @@ class SnakeGame:
         
         # Draw instruction text (with timer if in boss mode respawn)
         instruction_text = "Press a direction to hatch!"
-        if hasattr(self, 'boss_active') and self.boss_active and hasattr(self, 'boss_egg_is_respawn') and self.boss_egg_is_respawn:
+        if self.boss_active and self.boss_egg_is_respawn:
             # Show countdown timer (5 seconds = 300 frames)
-            time_left = max(0, (300 - getattr(self, 'egg_timer', 0)) // 60)
+            time_left = max(0, (300 - self.egg_timer) // 60)
             instruction_text = "Choose direction! Auto-hatch in {}s".format(time_left)
         
         instruction = self.font_medium.render(instruction_text, True, BLACK)
@@ -8846,7 +8658,7 @@ class SnakeGame:
                 # Draw head with animation or static image
                 if head_img_static:
                     # Boss minion - use static bad snake head
-                    dx, dy = snake.direction.value
+                    dx, dy = snake.direction.delta
                     if dx == 1:  # Right
                         rotated_head = pygame.transform.rotate(head_img_static, -90)
                     elif dx == -1:  # Left
@@ -8861,7 +8673,7 @@ class SnakeGame:
                     # Regular player - use animated head
                     head_img = head_frames[self.head_frame_index]
                     # Rotate head based on direction
-                    dx, dy = snake.direction.value
+                    dx, dy = snake.direction.delta
                     if dx == 1:  # Right
                         rotated_head = pygame.transform.rotate(head_img, 90)
                     elif dx == -1:  # Left
@@ -8878,7 +8690,7 @@ class SnakeGame:
                     rect = pygame.Rect(int(pixel_x), int(pixel_y), GRID_SIZE - 2, GRID_SIZE - 2)
                     pygame.draw.rect(self.screen, color, rect, border_radius=2)
                     
-                    dx, dy = snake.direction.value
+                    dx, dy = snake.direction.delta
                     if dx == 1:
                         eye1 = (int(pixel_x + GRID_SIZE - 5), int(pixel_y + 3))
                         eye2 = (int(pixel_x + GRID_SIZE - 5), int(pixel_y + GRID_SIZE - 5))
@@ -8952,8 +8764,7 @@ class SnakeGame:
                         self.screen.blit(self.bonus_img, (fx * GRID_SIZE, fy * GRID_SIZE + GAME_OFFSET_Y))
                     else:
                         # Fallback to circle
-                        center_x = fx * GRID_SIZE + GRID_SIZE // 2
-                        center_y = fy * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y
+                        center_x, center_y = grid_to_pixel_center(fx, fy)
                         pygame.draw.circle(self.screen, (200, 30, 30), (center_x, center_y), GRID_SIZE // 3)
                         pygame.draw.circle(self.screen, (255, 100, 100), (center_x - 2, center_y - 2), GRID_SIZE // 6)
                 
@@ -8963,8 +8774,7 @@ class SnakeGame:
                         self.screen.blit(self.bad_apple_img, (fx * GRID_SIZE, fy * GRID_SIZE + GAME_OFFSET_Y))
                     else:
                         # Fallback to circle
-                        center_x = fx * GRID_SIZE + GRID_SIZE // 2
-                        center_y = fy * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y
+                        center_x, center_y = grid_to_pixel_center(fx, fy)
                         pygame.draw.circle(self.screen, (40, 20, 50), (center_x, center_y), GRID_SIZE // 3)
                         pygame.draw.circle(self.screen, (80, 50, 90), (center_x - 2, center_y - 2), GRID_SIZE // 6)
         else:
@@ -9026,21 +8836,17 @@ class SnakeGame:
                         self.screen.blit(self.bonus_img, (fx * GRID_SIZE, fy * GRID_SIZE + GAME_OFFSET_Y))
                     else:
                         # Fallback to yellow circle
-                        pygame.draw.circle(self.screen, NEON_YELLOW, 
-                                         (fx * GRID_SIZE + GRID_SIZE // 2, fy * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y),
-                                         GRID_SIZE // 3)
+                        pygame.draw.circle(self.screen, NEON_YELLOW, grid_to_pixel_center(fx, fy), GRID_SIZE // 3)
                 elif food_type == 'coin':
                     # Draw coin as a golden circle
-                    center_x = fx * GRID_SIZE + GRID_SIZE // 2
-                    center_y = fy * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y
+                    center_x, center_y = grid_to_pixel_center(fx, fy)
                     pygame.draw.circle(self.screen, YELLOW, (center_x, center_y), GRID_SIZE // 4)
                     pygame.draw.circle(self.screen, (255, 165, 0), (center_x, center_y), GRID_SIZE // 4, 2)
                     # Add inner circle for detail
                     pygame.draw.circle(self.screen, (255, 165, 0), (center_x, center_y), GRID_SIZE // 6, 2)
                 elif food_type == 'diamond':
                     # Draw diamond as a cyan diamond shape
-                    center_x = fx * GRID_SIZE + GRID_SIZE // 2
-                    center_y = fy * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y
+                    center_x, center_y = grid_to_pixel_center(fx, fy)
                     size = GRID_SIZE // 3
                     points = [
                         (center_x, center_y - size),  # Top
@@ -9065,13 +8871,11 @@ class SnakeGame:
                         self.screen.blit(self.isotope_img, (fx * GRID_SIZE, fy * GRID_SIZE + GAME_OFFSET_Y))
                     else:
                         # Fallback to rendered graphic
-                        center_x = fx * GRID_SIZE + GRID_SIZE // 2
-                        center_y = fy * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y
+                        center_x, center_y = grid_to_pixel_center(fx, fy)
                         # Draw nucleus (central circle)
                         pygame.draw.circle(self.screen, NEON_PURPLE, (center_x, center_y), GRID_SIZE // 6)
                         pygame.draw.circle(self.screen, WHITE, (center_x, center_y), GRID_SIZE // 6, 2)
                         # Draw orbiting electrons (3 circles)
-                        import math
                         radius = GRID_SIZE // 3
                         for i in range(3):
                             angle = (self.move_timer * 3 + i * 120) % 360  # Rotating animation
@@ -9082,8 +8886,8 @@ class SnakeGame:
         # Draw bullets
         for bullet in self.bullets:
             # Draw bullet as a glowing projectile
-            bullet_x = int(bullet.pixel_x + GRID_SIZE // 2)
-            bullet_y = int(bullet.pixel_y + GRID_SIZE // 2 + GAME_OFFSET_Y)
+            bullet_x = int(bullet.pixel_x + HALF_GRID)
+            bullet_y = int(bullet.pixel_y + CENTER_Y_OFFSET)
             # Draw outer glow
             pygame.draw.circle(self.screen, NEON_YELLOW, (bullet_x, bullet_y), 6)
             # Draw inner bright core
@@ -9102,17 +8906,17 @@ class SnakeGame:
             spewtum.draw(self.screen, GAME_OFFSET_Y)
         
         # Draw enemies in Adventure mode during PLAYING state
-        if self.game_mode == "adventure" and hasattr(self, 'enemies'):
+        if self.game_mode == "adventure" and self.enemies:
             for enemy in self.enemies:
                 if enemy.alive:
                     render_x, render_y = enemy.get_render_position()
                     
                     # Skip wasps here - they're drawn on top later
-                    if enemy.enemy_type.startswith('enemy_wasp'):
+                    if enemy.kind == EnemyKind.WASP:
                         continue
                     
                     # Draw enemies (ants, spiders, wasps, walls)
-                    if enemy.enemy_type == 'enemy_wall':
+                    if enemy.kind == EnemyKind.WALL:
                         # Draw enemy wall with visual indicator of health
                         wall_x = enemy.grid_x * GRID_SIZE
                         wall_y = enemy.grid_y * GRID_SIZE + GAME_OFFSET_Y
@@ -9136,18 +8940,18 @@ class SnakeGame:
                         # Draw enemy using sprite if available
                         enemy_frames = None
                         is_scorpion = False
-                        if enemy.enemy_type.startswith('enemy_ant') and self.ant_frames:
+                        if enemy.kind == EnemyKind.ANT and self.ant_frames:
                             enemy_frames = self.ant_frames
-                        elif enemy.enemy_type.startswith('enemy_spider') and self.spider_frames:
+                        elif enemy.kind == EnemyKind.SPIDER and self.spider_frames:
                             enemy_frames = self.spider_frames
-                        elif enemy.enemy_type.startswith('enemy_scorpion') and self.scorpion_frames:
+                        elif enemy.kind == EnemyKind.SCORPION and self.scorpion_frames:
                             # Scorpion is 2x2 grid (64x64 pixels), use attack animation if attacking
                             if enemy.is_attacking:
                                 enemy_frames = self.scorpion_frames  # Can switch to attack frames later if desired
                             else:
                                 enemy_frames = self.scorpion_frames
                             is_scorpion = True
-                        elif enemy.enemy_type.startswith('enemy_beetle'):
+                        elif enemy.kind == EnemyKind.BEETLE:
                             # Beetle uses different animations based on state
                             if enemy.is_attacking and self.beetle_attack_frames:
                                 # Use attack animation when launching larvae
@@ -9171,17 +8975,17 @@ class SnakeGame:
                                 img_rect = rotated_img.get_rect(center=(int(render_x * GRID_SIZE + GRID_SIZE), 
                                                                          int(render_y * GRID_SIZE + GRID_SIZE + GAME_OFFSET_Y)))
                             else:
-                                img_rect = rotated_img.get_rect(center=(int(render_x * GRID_SIZE + GRID_SIZE // 2), 
-                                                                         int(render_y * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y)))
+                                img_rect = rotated_img.get_rect(center=(int(render_x * GRID_SIZE + HALF_GRID), 
+                                                                         int(render_y * GRID_SIZE + CENTER_Y_OFFSET)))
                             self.screen.blit(rotated_img, img_rect)
                         else:
                             # Fallback to circle rendering if no sprite
-                            center_x = int(render_x * GRID_SIZE + GRID_SIZE // 2)
-                            center_y = int(render_y * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y)
+                            center_x = int(render_x * GRID_SIZE + HALF_GRID)
+                            center_y = int(render_y * GRID_SIZE + CENTER_Y_OFFSET)
                             radius = GRID_SIZE // 3
                             
                             # Get color based on enemy type
-                            if enemy.enemy_type.startswith('enemy_spider'):
+                            if enemy.kind == EnemyKind.SPIDER:
                                 enemy_color = (139, 69, 19)  # Brown for spiders
                             else:
                                 enemy_color = (165, 42, 42)  # Default ant brown
@@ -9208,15 +9012,14 @@ class SnakeGame:
             else:
                 # Fallback to pulsing yellow circle
                 pulse = abs((self.bonus_food_timer % 60) - 30) / 30
-                size = int(GRID_SIZE // 2 + pulse * 2)
-                center_x = bx * GRID_SIZE + GRID_SIZE // 2
-                center_y = by * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y
+                size = int(HALF_GRID + pulse * 2)
+                center_x, center_y = grid_to_pixel_center(bx, by)
                 pygame.draw.circle(self.screen, NEON_YELLOW, (center_x, center_y), size)
         
         # Draw respawn eggs in multiplayer
         if self.is_multiplayer:
             for player_id, egg_data in self.respawning_players.items():
-                ex, ey = egg_data['pos']
+                ex, ey = egg_data.pos
                 pixel_x = ex * GRID_SIZE
                 pixel_y = ey * GRID_SIZE + GAME_OFFSET_Y
                 
@@ -9227,8 +9030,8 @@ class SnakeGame:
                 if player_id < len(self.player_egg_imgs) and self.player_egg_imgs[player_id]:
                     # Center the 2x2 egg image on the grid cell
                     egg_img = self.player_egg_imgs[player_id]
-                    egg_x = pixel_x - GRID_SIZE // 2
-                    egg_y = pixel_y - GRID_SIZE // 2
+                    egg_x = pixel_x - HALF_GRID
+                    egg_y = pixel_y - HALF_GRID
                     self.screen.blit(egg_img, (egg_x, egg_y))
                 else:
                     # Fallback to colored ellipse
@@ -9240,12 +9043,12 @@ class SnakeGame:
                                                  size, size))
                 
                 # Draw timer below egg
-                seconds_left = max(0, egg_data['timer'] // 60 + 1)
+                seconds_left = max(0, egg_data.timer // 60 + 1)
                 timer_text = self.font_small.render(str(seconds_left), True, BLACK)
-                timer_rect = timer_text.get_rect(center=(pixel_x + GRID_SIZE // 2 + 2, pixel_y + GRID_SIZE + 8))
+                timer_rect = timer_text.get_rect(center=(pixel_x + HALF_GRID + 2, pixel_y + GRID_SIZE + 8))
                 self.screen.blit(timer_text, timer_rect)
                 timer_text = self.font_small.render(str(seconds_left), True, egg_color)
-                timer_rect = timer_text.get_rect(center=(pixel_x + GRID_SIZE // 2, pixel_y + GRID_SIZE + 6))
+                timer_rect = timer_text.get_rect(center=(pixel_x + HALF_GRID, pixel_y + GRID_SIZE + 6))
                 self.screen.blit(timer_text, timer_rect)
         
         # Draw boss minions FIRST (so they render behind the boss)
@@ -9292,7 +9095,7 @@ class SnakeGame:
                 self.screen.blit(rotated_frog, rotated_rect)
             
             # Draw tongue segments
-            if len(self.frog_tongue_segments) > 0 and self.frog_tongue_img:
+            if self.frog_tongue_segments and self.frog_tongue_img:
                 for segment_pos in self.frog_tongue_segments:
                     seg_x = int(segment_pos[0] * GRID_SIZE)
                     seg_y = int(segment_pos[1] * GRID_SIZE + GAME_OFFSET_Y)
@@ -9404,18 +9207,19 @@ class SnakeGame:
             if self.state != GameState.EGG_HATCHING or len(self.snake.body) > 1:
                 self.draw_snake(self.snake, 0)
         
-        # Draw particles
-        for particle in self.particles:
-            particle.draw(self.screen)
+        # Draw particles in one blits() call (a death or full-grid burst is one per segment)
+        particle_blits = [particle.get_blit() for particle in self.particles if particle.alive]
+        if particle_blits:
+            self.screen.blits(particle_blits, doreturn=False)
         
         # Draw egg pieces (if any are still flying)
         for piece in self.egg_pieces:
             piece.draw(self.screen)
         
         # Draw wasps on top of everything (they fly over the snake)
-        if self.game_mode == "adventure" and hasattr(self, 'enemies'):
+        if self.game_mode == "adventure" and self.enemies:
             for enemy in self.enemies:
-                if enemy.alive and enemy.enemy_type.startswith('enemy_wasp'):
+                if enemy.alive and enemy.kind == EnemyKind.WASP:
                     render_x, render_y = enemy.get_render_position()
                     
                     # Draw wasp using sprite if available
@@ -9424,13 +9228,13 @@ class SnakeGame:
                         # Rotate sprite to match direction
                         rotated_img = pygame.transform.rotate(wasp_img, -enemy.angle)
                         # Get rect to center the rotated image on the grid position
-                        img_rect = rotated_img.get_rect(center=(int(render_x * GRID_SIZE + GRID_SIZE // 2), 
-                                                                 int(render_y * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y)))
+                        img_rect = rotated_img.get_rect(center=(int(render_x * GRID_SIZE + HALF_GRID), 
+                                                                 int(render_y * GRID_SIZE + CENTER_Y_OFFSET)))
                         self.screen.blit(rotated_img, img_rect)
                     else:
                         # Fallback to circle rendering if no sprite
-                        center_x = int(render_x * GRID_SIZE + GRID_SIZE // 2)
-                        center_y = int(render_y * GRID_SIZE + GRID_SIZE // 2 + GAME_OFFSET_Y)
+                        center_x = int(render_x * GRID_SIZE + HALF_GRID)
+                        center_y = int(render_y * GRID_SIZE + CENTER_Y_OFFSET)
                         radius = GRID_SIZE // 3
                         
                         # Yellow color for wasps
@@ -9508,7 +9312,7 @@ class SnakeGame:
                         self.screen.blit(x_text, (count_x, y_pos))
         else:
             # Single player score - Left side: Score with label (hidden during boss battles)
-            if not (hasattr(self, 'boss_active') and self.boss_active and self.boss_spawned):
+            if not (self.boss_active and self.boss_spawned):
                 score_label = self.font_small.render("SCORE:", True, BLACK)
                 self.screen.blit(score_label, (5, 4))
                 score_label = self.font_small.render("SCORE:", True, NEON_YELLOW)
@@ -9519,7 +9323,7 @@ class SnakeGame:
                 self.screen.blit(score_value, (49, 3))
         
         # Single player HUD elements (level, worms counter) - hidden during boss battles
-        if not self.is_multiplayer and not (hasattr(self, 'boss_active') and self.boss_active and self.boss_spawned):
+        if not self.is_multiplayer and not (self.boss_active and self.boss_spawned):
             # Bottom right: Level
             level_value_text = "{}".format(self.level)
             level_value = self.font_small.render(level_value_text, True, BLACK)
@@ -9576,7 +9380,7 @@ class SnakeGame:
         if not self.is_multiplayer:
             # Hide lives HUD during egg hatching in boss battles
             show_lives = True
-            if hasattr(self, 'boss_active') and self.boss_active and self.state == GameState.EGG_HATCHING:
+            if self.boss_active and self.state == GameState.EGG_HATCHING:
                 show_lives = False
             
             if show_lives:
@@ -9746,7 +9550,7 @@ class SnakeGame:
                 self.screen.blit(hint_text, hint_rect)
                 
                 # Show auto-progress countdown
-                if hasattr(self, 'network_game_over_auto_timer') and self.network_game_over_auto_timer > 0:
+                if self.network_game_over_auto_timer > 0:
                     seconds_left = (self.network_game_over_auto_timer + 59) // 60  # Round up
                     timer_text = self.font_small.render(f"Auto-continue in {seconds_left}s", True, GRAY)
                     timer_rect = timer_text.get_rect(center=(SCREEN_WIDTH // 2, 235))
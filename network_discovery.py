@@ -3,6 +3,7 @@ Network Discovery for LAN Multiplayer
 Uses UDP broadcast for automatic server discovery (Quake 3 style)
 """
 
+import itertools
 import socket
 import threading
 import time
@@ -14,6 +15,10 @@ DISCOVERY_MAGIC = b"PYSNAKE_DISCOVER_V1"
 RESPONSE_MAGIC = b"PYSNAKE_RESPONSE_V1"
 HEARTBEAT_INTERVAL = 1.0        # Seconds between heartbeat broadcasts
 
+# Server-list versions are unique across DiscoveryClient instances, so a restarted
+# listener never reports a version a reader has already seen
+_server_list_versions = itertools.count(1)
+
 
 class DiscoveryServer:
     """Broadcasts server presence on LAN via UDP heartbeats"""
@@ -79,6 +84,7 @@ class DiscoveryClient:
         self.listen_thread = None
         self.servers = {}  # {ip: (name, port, last_seen_time)}
         self.servers_lock = threading.Lock()
+        self.servers_version = next(_server_list_versions)  # Changes whenever the server list does
         self.server_timeout = 5.0  # Remove servers not seen for this many seconds
         
     def start(self):
@@ -122,6 +128,9 @@ class DiscoveryClient:
                 
                 # Update server list
                 with self.servers_lock:
+                    known = self.servers.get(server_ip)
+                    if known is None or known[0] != name_str or known[1] != port:
+                        self.servers_version = next(_server_list_versions)
                     self.servers[server_ip] = (name_str, port, time.time())
                     
             except socket.timeout:
@@ -141,6 +150,8 @@ class DiscoveryClient:
                      if current_time - last_seen > self.server_timeout]
             for ip in stale:
                 del self.servers[ip]
+            if stale:
+                self.servers_version = next(_server_list_versions)
     
     def get_servers(self):
         """Get list of discovered servers as [(name, ip, port), ...]"""
@@ -158,4 +169,5 @@ class DiscoveryClient:
         self.socket = None
         with self.servers_lock:
             self.servers.clear()
+            self.servers_version = next(_server_list_versions)
         print("[discovery] Stopped listening")
@@ -396,6 +396,12 @@ class NetworkManager:
             return self.discovery_client.get_servers()
         return []
     
+    def get_discovered_servers_version(self):
+        """Get a value that changes whenever get_discovered_servers() would return something new"""
+        if self.discovery_client:
+            return self.discovery_client.servers_version
+        return 0
+    
     def set_server_name(self, name):
         """Set the server name for discovery broadcasts"""
         self.server_name = name
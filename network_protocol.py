@@ -112,8 +112,8 @@ def create_game_state_message(snakes, food_items, frame, respawning_players=None
         for player_id, egg_info in respawning_players.items():
             egg_data.append({
                 "player_id": player_id,
-                "pos": list(egg_info['pos']),
-                "timer": egg_info.get('timer', 0)
+                "pos": list(egg_info.pos),
+                "timer": egg_info.timer
             })
     
     return {